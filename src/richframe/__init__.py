@@ -1,23 +1,42 @@
 """richframe public package exports."""
-from .api import to_html
+from .api import (
+    build_table,
+    diff_table,
+    iter_html,
+    iter_html_async,
+    render_many,
+    to_html,
+    to_html_async,
+)
 from .core.model import Cell, Row, Table
 from .layout import (
     ColumnConfig,
     FilterConfig,
     LayoutOptions,
+    RowMask,
     SortConfig,
 )
-from .plugins import ColorScalePlugin, DataBarPlugin, IconRule, IconSetPlugin, conditional_format
+from .render import Patch, TableDiff
+from .plugins import ColorScalePlugin, DataBarPlugin, IconBins, IconRule, IconSetPlugin, conditional_format
 from .style import RowStyle, Theme, get_theme, list_themes, resolve_theme
 
 __all__ = [
     "to_html",
+    "to_html_async",
+    "iter_html",
+    "iter_html_async",
+    "render_many",
+    "build_table",
+    "diff_table",
     "Cell",
     "Row",
     "Table",
+    "Patch",
+    "TableDiff",
     "ColumnConfig",
     "LayoutOptions",
     "FilterConfig",
+    "RowMask",
     "SortConfig",
     "RowStyle",
     "Theme",
@@ -28,5 +47,6 @@ __all__ = [
     "DataBarPlugin",
     "IconSetPlugin",
     "IconRule",
+    "IconBins",
     "conditional_format",
 ]
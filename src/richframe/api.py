@@ -1,15 +1,20 @@
 """Public API surface for richframe."""
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping, Sequence
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import replace
+from functools import partial
 from typing import Any
 
 import pandas as pd
 
 from .core.model import Table
-from .io.pandas_adapter import dataframe_to_table
-from .render.html_renderer import HTMLRenderer
+from .io.pandas_adapter import RowPredicate, dataframe_to_table
+from .parallel import create_executor
+from .render.html_renderer import HTMLRenderer, needs_runtime, worker_renderer
+from .render.patches import TableDiff, diff_tables
 from .format import Formatter
 from .layout import (
     ColumnConfig,
@@ -18,10 +23,20 @@ from .layout import (
     coerce_filter_configs,
     coerce_sort_configs,
 )
-from .plugins import Plugin
-from .style import RowStyle, Theme, resolve_theme
+from .plugins import CellPlugin, Plugin
+from .plugins.base import run_cell_plugins
+from .style import RowStyle, StyleRegistry, Theme, resolve_theme
+from .style.registry import StyleDefinition
 
-__all__ = ["to_html"]
+__all__ = [
+    "to_html",
+    "to_html_async",
+    "iter_html",
+    "iter_html_async",
+    "render_many",
+    "build_table",
+    "diff_table",
+]
 
 
 def to_html(
@@ -36,7 +51,7 @@ def to_html(
     column_layout: Mapping[str, ColumnConfig | Mapping[str, object] | None] | None = None,
     sticky_header: bool = False,
     zebra_striping: bool = False,
-    row_predicates: Sequence[tuple[Callable[[Any, Sequence[Any]], bool], RowStyle | Mapping[str, str] | None]] | None = None,
+    row_predicates: Sequence[tuple[RowPredicate, RowStyle | Mapping[str, str] | None]] | None = None,
     title: str | None = None,
     subtitle: str | None = None,
     renderer: HTMLRenderer | None = None,
@@ -45,6 +60,11 @@ def to_html(
     interactive_controls: bool = False,
     resizable_columns: bool = False,
     plugins: Sequence[Plugin | None] | None = None,
+    workers: int | None = None,
+    format_workers: int | None = None,
+    live_updates: bool = False,
+    virtualize: bool = False,
+    runtime: str = "inline",
 ) -> str:
     """Render a supported tabular structure into HTML.
 
@@ -77,8 +97,10 @@ def to_html(
     formatters:
         Optional mapping of column identifiers to formatter names or callables.
         Formatter strings resolve to the built-in helpers (``"number"``,
-        ``"currency"``, ``"percent"``, ``"date"``). Only applied when ``value``
-        is a :class:`pandas.DataFrame`.
+        ``"currency"``, ``"percent"``, ``"date"``, ``"duration"``, ``"period"``,
+        ``"interval"``) or are number patterns such as ``"#,##0.00"``,
+        ``"0.0%"`` or ``",.2f"`` (see :class:`~richframe.format.PatternFormatter`).
+        Only applied when ``value`` is a :class:`pandas.DataFrame`.
     locale:
         Optional locale string passed to locale-aware formatters. Requires the
         ``babel`` extra when used with date formatting.
@@ -94,6 +116,9 @@ def to_html(
         Sequence of ``(predicate, style)`` tuples applied to body rows. Each
         predicate receives ``(index, values)`` and, when true, applies the
         provided :class:`~richframe.style.model.RowStyle` (or a style mapping).
+        A predicate may instead be a :class:`~richframe.layout.RowMask` or a
+        :meth:`pandas.DataFrame.eval` expression string, evaluated once on the
+        whole (filtered) DataFrame. The first matching predicate wins.
     renderer:
         Optional :class:`~richframe.render.html_renderer.HTMLRenderer`
         instance. Supply this when you need to reuse a configured renderer or
@@ -119,6 +144,37 @@ def to_html(
         Optional sequence of plugin instances executed after formatting
         (pre-theme) and immediately before rendering. Use this to add color
         scales, data bars, icon sets, or custom conditional styling.
+    workers:
+        Optional number of worker processes used to render large table bodies.
+        Body rows are split into contiguous ranges rendered concurrently (in
+        threads on free-threaded builds) and stitched back together; the output
+        is identical to a serial render. Defaults to ``None`` (serial).
+    format_workers:
+        Optional number of workers used to format large DataFrames column by
+        column (processes, or threads on free-threaded builds). Formatters of
+        the columns sent to workers must be picklable. Only valid for DataFrame
+        inputs, since :class:`Table` objects are already formatted. Defaults to
+        ``None`` (serial).
+    live_updates:
+        When ``True`` body rows and cells carry ``data-rf-key``/``data-rf-col``
+        attributes and the output includes the ``richframe.applyPatches``
+        client so that patches from :func:`diff_table` can update the table
+        in place. Defaults to ``False``.
+    virtualize:
+        When ``True`` the body is embedded as a compact JSON payload instead of
+        table rows, and the interactive runtime (implied by this option) only
+        creates DOM rows for the visible scroll window. Sorting and filtering
+        run against the in-memory payload. Index labels are not merged across
+        rows in this mode, and it cannot be combined with ``live_updates`` or
+        ``workers``. Defaults to ``False``.
+    runtime:
+        How the client runtime used by interactive, resizable, live, and
+        virtualized tables is delivered: ``"inline"`` embeds it in every
+        fragment, ``"once"`` embeds it only in the first fragment rendered by
+        ``renderer`` (share one renderer across a page), and ``"external"``
+        references the versioned asset written by
+        :func:`richframe.render.runtime.write_runtime`. Ignored when
+        ``renderer`` is supplied. Defaults to ``"inline"``.
 
     Returns
     -------
@@ -128,11 +184,11 @@ def to_html(
         surfaces.
     """
 
-    resolved_filters = coerce_filter_configs(filters) if filters else None
-    resolved_sorts = coerce_sort_configs(sorts) if sorts else None
-
-    table = _coerce_to_table(
+    _check_virtualize_workers(virtualize, workers)
+    table = _build_table(
         value,
+        theme=resolve_theme(theme),
+        plugins=plugins,
         include_index=include_index,
         caption=caption,
         formatters=formatters,
@@ -143,54 +199,346 @@ def to_html(
         row_predicates=row_predicates,
         title=title,
         subtitle=subtitle,
-        filters=resolved_filters,
-        sorts=resolved_sorts,
+        filters=filters,
+        sorts=sorts,
         interactive_controls=interactive_controls,
         resizable_columns=resizable_columns,
+        live_updates=live_updates,
+        virtualize=virtualize,
+        format_workers=format_workers,
     )
-    table = _run_plugins(table, plugins, stage="after_format")
-    resolved_theme = resolve_theme(theme)
-    if resolved_theme is not None:
-        table = resolved_theme.apply(table)
-    table = _run_plugins(table, plugins, stage="before_render")
+    active_renderer = renderer or HTMLRenderer(inline_styles=inline_styles, runtime=runtime)
+    return active_renderer.render(table, workers=workers)
+
+
+def build_table(
+    value: Table | pd.DataFrame,
+    *,
+    theme: str | Theme | None = "minimal",
+    plugins: Sequence[Plugin | None] | None = None,
+    **options: Any,
+) -> Table:
+    """Run the :func:`to_html` pipeline up to, but excluding, rendering.
+
+    The returned :class:`~richframe.core.model.Table` has been formatted,
+    themed, and processed by ``plugins``. Other keyword options are those
+    accepted by :func:`to_html`.
+    """
+
+    return _build_table(value, theme=resolve_theme(theme), plugins=plugins, **options)
+
+
+def diff_table(
+    previous: Table,
+    value: Table | pd.DataFrame,
+    *,
+    theme: str | Theme | None = "minimal",
+    inline_styles: bool = False,
+    renderer: HTMLRenderer | None = None,
+    plugins: Sequence[Plugin | None] | None = None,
+    **options: Any,
+) -> TableDiff:
+    """Diff a new frame against a previously rendered table.
+
+    ``previous`` is the table rendered with ``live_updates=True`` (see
+    :func:`build_table`) or the ``table`` of the last :class:`TableDiff`.
+    ``value`` is built with the same options and compared row by row (keyed by
+    index value) and cell by cell (keyed by ``column_id``). Send
+    :meth:`TableDiff.to_json` to the page and pass it to
+    ``richframe.applyPatches(container, patches)``.
+    """
+
+    options["live_updates"] = True
+    table = _build_table(value, theme=resolve_theme(theme), plugins=plugins, **options)
     active_renderer = renderer or HTMLRenderer(inline_styles=inline_styles)
-    return active_renderer.render(table)
+    return TableDiff(table=table, patches=diff_tables(previous, table, renderer=active_renderer))
+
+
+def render_many(
+    frames: Iterable[Table | pd.DataFrame],
+    *,
+    theme: str | Theme | None = "minimal",
+    inline_styles: bool = False,
+    renderer: HTMLRenderer | None = None,
+    plugins: Sequence[Plugin | None] | None = None,
+    shared_stylesheet: bool = False,
+    runtime: str = "inline",
+    processes: int | None = None,
+    chunksize: int = 16,
+    workers: int | None = None,
+    **options: Any,
+) -> list[str]:
+    """Render many tables with one renderer, theme, and style cache.
+
+    Parameters
+    ----------
+    frames:
+        Iterable of :class:`pandas.DataFrame` or
+        :class:`~richframe.core.model.Table` values.
+    theme, inline_styles, renderer, plugins:
+        As for :func:`to_html`; resolved once and reused for every fragment.
+    shared_stylesheet:
+        When ``True`` fragments omit their own ``<style>`` block and a single
+        stylesheet covering every fragment is prepended to the first one. Use
+        this when all fragments end up on the same page.
+    runtime:
+        As for :func:`to_html`. With ``"once"`` the client runtime is embedded
+        only in the first fragment that needs it, which suits fragments placed
+        on the same page.
+    processes:
+        Optional number of worker processes (threads on free-threaded builds).
+        Frames are submitted in chunks of ``chunksize``; plugins, formatters,
+        and predicates must be picklable when this is set.
+    chunksize:
+        Number of frames sent to a worker per submission.
+    workers:
+        As for :func:`to_html`: render each large body in a worker pool.
+        Cannot be combined with ``processes``.
+    **options:
+        Any other keyword option accepted by :func:`to_html`, applied to every
+        frame.
+
+    Returns
+    -------
+    list[str]
+        One HTML fragment per input, in input order.
+    """
+
+    if processes is not None and processes > 1 and workers is not None and workers > 1:
+        raise ValueError("render_many accepts either processes or workers, not both")
+    _check_virtualize_workers(options.get("virtualize", False), workers)
+    values = list(frames)
+    active_renderer = renderer or HTMLRenderer(inline_styles=inline_styles, runtime=runtime)
+    build = partial(_build_table, theme=resolve_theme(theme), plugins=plugins, **options)
+    registry = active_renderer.create_registry() if shared_stylesheet else None
+    if processes is not None and processes > 1 and len(values) > chunksize:
+        fragments = _render_many_parallel(values, active_renderer, build, registry, processes, chunksize)
+    else:
+        fragments = [_render_fragment(active_renderer, build(value), registry, workers=workers) for value in values]
+    if registry is not None and fragments:
+        fragments[0] = active_renderer.render_stylesheet(registry) + fragments[0]
+    return fragments
+
+
+def iter_html(
+    value: Table | pd.DataFrame,
+    *,
+    batch_size: int = 1000,
+    theme: str | Theme | None = "minimal",
+    inline_styles: bool = False,
+    renderer: HTMLRenderer | None = None,
+    plugins: Sequence[Plugin | None] | None = None,
+    runtime: str = "inline",
+    **options: Any,
+) -> Iterator[str]:
+    """Yield the HTML produced by :func:`to_html` in chunks.
+
+    Body rows are emitted ``batch_size`` rows at a time; joining the chunks
+    gives the same markup as :func:`to_html`. Other keyword options are those
+    accepted by :func:`to_html`.
+    """
+
+    active_renderer = renderer or HTMLRenderer(inline_styles=inline_styles, runtime=runtime)
+    table = _build_table(value, theme=resolve_theme(theme), plugins=plugins, **options)
+    return active_renderer.iter_render(table, batch_size=batch_size)
+
+
+async def iter_html_async(
+    value: Table | pd.DataFrame,
+    *,
+    executor: Executor | None = None,
+    batch_size: int = 1000,
+    theme: str | Theme | None = "minimal",
+    inline_styles: bool = False,
+    renderer: HTMLRenderer | None = None,
+    plugins: Sequence[Plugin | None] | None = None,
+    runtime: str = "inline",
+    **options: Any,
+) -> AsyncIterator[str]:
+    """Asynchronously yield the HTML produced by :func:`to_html` in chunks.
+
+    Formatting, plugins, and rendering run on ``executor`` (the event loop's
+    default executor when ``None``), one row batch per call, so the event loop
+    regains control between batches. Cancelling the consuming task stops the
+    render at the next batch boundary. Other keyword options are those
+    accepted by :func:`to_html`.
+
+    The render advances a generator on ``executor``, which therefore has to
+    run its jobs in this process: a ``ProcessPoolExecutor`` raises
+    ``TypeError``.
+    """
+
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError("iter_html_async needs a thread-based executor; a ProcessPoolExecutor cannot run the render")
+    loop = asyncio.get_running_loop()
+    active_renderer = renderer or HTMLRenderer(inline_styles=inline_styles, runtime=runtime)
+    build = partial(_build_table, theme=resolve_theme(theme), plugins=plugins, **options)
+    table = await loop.run_in_executor(executor, build, value)
+    steps = active_renderer.iter_render_steps(table, batch_size=batch_size)
+    while True:
+        chunk = await loop.run_in_executor(executor, next, steps, None)
+        if chunk is None:
+            break
+        if chunk:
+            yield chunk
+
+
+async def to_html_async(
+    value: Table | pd.DataFrame,
+    *,
+    executor: Executor | None = None,
+    batch_size: int = 1000,
+    **options: Any,
+) -> str:
+    """Render ``value`` like :func:`to_html` without blocking the event loop.
+
+    See :func:`iter_html_async` for how work is offloaded and cancelled.
+    """
+
+    chunks = [
+        chunk
+        async for chunk in iter_html_async(value, executor=executor, batch_size=batch_size, **options)
+    ]
+    return "".join(chunks)
+
+
+def _render_fragment(
+    renderer: HTMLRenderer,
+    table: Table,
+    registry: StyleRegistry | None,
+    *,
+    include_runtime: bool = True,
+    workers: int | None = None,
+) -> str:
+    return renderer.render(
+        table,
+        workers=workers,
+        registry=registry,
+        include_stylesheet=registry is None,
+        include_runtime=include_runtime,
+    )
+
+
+def _render_many_parallel(
+    values: Sequence[Table | pd.DataFrame],
+    renderer: HTMLRenderer,
+    build: Callable[[Table | pd.DataFrame], Table],
+    registry: StyleRegistry | None,
+    processes: int,
+    chunksize: int,
+) -> list[str]:
+    chunks = [values[start : start + chunksize] for start in range(0, len(values), chunksize)]
+    jobs = [
+        (chunk, renderer.template_name, renderer.inline_styles, build, registry is not None)
+        for chunk in chunks
+    ]
+    with create_executor(min(processes, len(jobs))) as executor:
+        results = list(executor.map(_render_many_chunk, jobs))
+    fragments: list[str] = []
+    for chunk, (chunk_fragments, definitions, needs) in zip(chunks, results, strict=True):
+        # Merging in submission order reproduces the serial class order.
+        if registry is not None and registry.merge(definitions):
+            chunk_fragments = [
+                _render_fragment(renderer, build(value), registry, include_runtime=False) for value in chunk
+            ]
+        # Workers leave the runtime out; it is added here so that "once" is
+        # honoured across chunks. The template puts it first in a fragment.
+        fragments.extend(
+            renderer.claim_runtime(needed) + fragment
+            for fragment, needed in zip(chunk_fragments, needs, strict=True)
+        )
+    return fragments
+
+
+def _render_many_chunk(
+    job: tuple[Sequence[Table | pd.DataFrame], str, bool, Callable[[Table | pd.DataFrame], Table], bool],
+) -> tuple[list[str], list[StyleDefinition], list[bool]]:
+    values, template_name, inline_styles, build, shared = job
+    renderer = worker_renderer(template_name, inline_styles)
+    registry = renderer.create_registry() if shared else None
+    tables = [build(value) for value in values]
+    fragments = [_render_fragment(renderer, table, registry, include_runtime=False) for table in tables]
+    definitions = list(registry.definitions()) if registry is not None else []
+    return fragments, definitions, [needs_runtime(table) for table in tables]
+
+
+def _build_table(
+    value: Table | pd.DataFrame,
+    *,
+    theme: Theme | None,
+    plugins: Sequence[Plugin | None] | None,
+    filters: Sequence[FilterConfig | Mapping[str, Any]] | None = None,
+    sorts: Sequence[SortConfig | Mapping[str, Any] | str] | None = None,
+    **options: Any,
+) -> Table:
+    if "workers" in options:
+        # Only to_html and render_many render a whole body at once.
+        raise TypeError(
+            "'workers' is only supported by to_html and render_many; use format_workers to format in parallel"
+        )
+    if options.get("virtualize") and options.get("live_updates"):
+        raise ValueError("virtualize cannot be combined with live_updates; patches need the rows in the DOM")
+    resolved_filters = coerce_filter_configs(filters) if filters else None
+    resolved_sorts = coerce_sort_configs(sorts) if sorts else None
+    table = _coerce_to_table(value, filters=resolved_filters, sorts=resolved_sorts, **options)
+    table = _run_plugins(table, plugins, stage="after_format")
+    if theme is not None:
+        table = theme.apply(table)
+    return _run_plugins(table, plugins, stage="before_render")
+
+
+def _check_virtualize_workers(virtualize: bool, workers: int | None) -> None:
+    if virtualize and workers is not None and workers > 1:
+        raise ValueError("virtualize cannot be combined with workers; virtualized bodies are encoded serially")
 
 
 def _run_plugins(table: Table, plugins: Sequence[Plugin | None] | None, *, stage: str) -> Table:
     if not plugins:
         return table
     current = table
+    # Consecutive cell plugins of this stage are fused into one body traversal.
+    pending: list[CellPlugin] = []
     for plugin in plugins:
         if plugin is None:
             continue
+        if isinstance(plugin, CellPlugin) and plugin.stage == stage:
+            pending.append(plugin)
+            continue
         hook = getattr(plugin, stage, None)
         if hook is None:
             continue
+        if pending:
+            current = run_cell_plugins(current, pending)
+            pending = []
         result = hook(current)
         if not isinstance(result, Table):  # pragma: no cover - defensive
             raise TypeError(f"Plugin hook '{stage}' must return a Table")
         current = result
+    if pending:
+        current = run_cell_plugins(current, pending)
     return current
 
 
 def _coerce_to_table(
     value: Table | pd.DataFrame,
     *,
-    include_index: bool,
-    caption: str | None,
-    formatters: Mapping[str, Formatter | str | None] | None,
-    locale: str | None,
-    column_layout: Mapping[str, ColumnConfig | Mapping[str, object] | None] | None,
-    sticky_header: bool,
-    zebra_striping: bool,
-    row_predicates: Sequence[tuple[Callable[[Any, Sequence[Any]], bool], RowStyle | Mapping[str, str] | None]] | None,
-    title: str | None,
-    subtitle: str | None,
-    filters: Sequence[FilterConfig] | None,
-    sorts: Sequence[SortConfig] | None,
-    interactive_controls: bool,
-    resizable_columns: bool,
+    include_index: bool = True,
+    caption: str | None = None,
+    formatters: Mapping[str, Formatter | str | None] | None = None,
+    locale: str | None = None,
+    column_layout: Mapping[str, ColumnConfig | Mapping[str, object] | None] | None = None,
+    sticky_header: bool = False,
+    zebra_striping: bool = False,
+    row_predicates: Sequence[tuple[RowPredicate, RowStyle | Mapping[str, str] | None]] | None = None,
+    title: str | None = None,
+    subtitle: str | None = None,
+    filters: Sequence[FilterConfig] | None = None,
+    sorts: Sequence[SortConfig] | None = None,
+    interactive_controls: bool = False,
+    resizable_columns: bool = False,
+    live_updates: bool = False,
+    virtualize: bool = False,
+    format_workers: int | None = None,
 ) -> Table:
     if isinstance(value, Table):
         if caption is not None and value.caption != caption:
@@ -205,6 +553,11 @@ def _coerce_to_table(
                 metadata["interactive_controls"] = True
             if resizable_columns:
                 metadata["resizable_columns"] = True
+            if live_updates:
+                metadata["live_updates"] = True
+            if virtualize:
+                metadata["virtualize"] = True
+                metadata["interactive_controls"] = True
             value = replace(value, metadata=metadata)
         else:
             metadata = dict(value.metadata) if isinstance(value.metadata, dict) else {}
@@ -212,9 +565,15 @@ def _coerce_to_table(
                 metadata["interactive_controls"] = True
             if resizable_columns and not metadata.get("resizable_columns"):
                 metadata["resizable_columns"] = True
+            if live_updates and not metadata.get("live_updates"):
+                metadata["live_updates"] = True
+            if virtualize and not metadata.get("virtualize"):
+                metadata["virtualize"] = True
+                metadata["interactive_controls"] = True
             if metadata:
                 value = replace(value, metadata=metadata)
-        if any([formatters, locale, column_layout, sticky_header, zebra_striping, row_predicates, filters, sorts]):
+        formatting = [formatters, locale, column_layout, sticky_header, zebra_striping, row_predicates, filters, sorts]
+        if any(formatting) or format_workers is not None:
             raise ValueError(
                 "Formatters, layout, and predicate options are only supported for DataFrame inputs"
             )
@@ -236,5 +595,8 @@ def _coerce_to_table(
             sorts=sorts,
             interactive_controls=interactive_controls,
             resizable_columns=resizable_columns,
+            live_updates=live_updates,
+            virtualize=virtualize,
+            format_workers=format_workers,
         )
     raise TypeError("Unsupported value passed to to_html")
@@ -1,12 +1,19 @@
 """Core modelling utilities for richframe."""
 from .builder import TableBuilder
 from .model import Cell, CellKind, Row, RowKind, Table
+from .stats import ColumnStats, TableStats, aligned_stats, carry_stats, numeric_array, table_stats
 
 __all__ = [
     "Cell",
     "CellKind",
+    "ColumnStats",
     "Row",
     "RowKind",
     "Table",
     "TableBuilder",
+    "TableStats",
+    "aligned_stats",
+    "carry_stats",
+    "numeric_array",
+    "table_stats",
 ]
@@ -59,6 +59,42 @@ class TableBuilder:
     def has_formatter(self, column_id: str) -> bool:
         return self._format_registry.get(column_id) is not None
 
+    def get_formatter(self, column_id: str) -> Formatter | None:
+        return self._format_registry.get(column_id)
+
+    def format_value(self, column_id: str, value: Any, *, row_index: Any | None = None) -> str:
+        """Return the body text ``value`` would get in ``column_id``."""
+
+        context = FormatContext(row_index=row_index, locale=self._locale)
+        return _coerce_text(value, self._format_registry.get(column_id), column_id, context)
+
+    def format_column(self, column_id: str, values: Any) -> list[str | None] | None:
+        """Return the body texts of a whole column at once, when its formatter can.
+
+        Formatters opt in with a ``format_column(values, context)`` method. The
+        result is ``None`` when there is none or it declines the values by
+        returning ``None``; ``None`` entries leave single cells to the per-cell
+        formatter. Errors raised by the method propagate.
+
+        Raises
+        ------
+        ValueError
+            If the method returns a different number of texts than values.
+        """
+
+        format_column = getattr(self._format_registry.get(column_id), "format_column", None)
+        if format_column is None:
+            return None
+        texts = format_column(values, FormatContext(column_id=column_id, locale=self._locale))
+        if texts is None:
+            return None
+        texts = list(texts)
+        if len(texts) != len(values):
+            raise ValueError(
+                f"format_column for column '{column_id}' returned {len(texts)} texts for {len(values)} values"
+            )
+        return texts
+
     def set_column_config(self, config: ColumnConfig) -> None:
         self._column_layout.set(config)
 
@@ -105,7 +141,18 @@ class TableBuilder:
         index: Any | None = None,
         row_style: "RowStyle | None" = None,
         cell_style: "CellStyle | None" = None,
+        texts: Sequence[str | None] | None = None,
+        key: Any | None = None,
     ) -> None:
+        """Append a body row.
+
+        ``index`` is passed to row predicates and formatters. ``key`` becomes
+        the row's :attr:`~richframe.core.model.Row.index`, which identifies it
+        across renders; it defaults to ``index``. ``texts`` optionally supplies
+        already formatted cell texts; cells whose entry is ``None`` are
+        formatted as usual.
+        """
+
         resolved = list(values)
         if len(resolved) != len(self._columns):
             raise ValueError(
@@ -119,6 +166,8 @@ class TableBuilder:
             index=index,
             row_style=effective_row_style,
             cell_style=cell_style,
+            texts=texts,
+            key=key,
         )
         self._body_rows.append(row)
 
@@ -144,6 +193,8 @@ class TableBuilder:
         index: Any | None = None,
         row_style: "RowStyle | None" = None,
         cell_style: "CellStyle | None" = None,
+        texts: Sequence[str | None] | None = None,
+        key: Any | None = None,
     ) -> Row:
         resolved = list(values)
         if len(resolved) != len(self._columns):
@@ -153,9 +204,11 @@ class TableBuilder:
             )
         context = FormatContext(row_index=index, locale=self._locale)
         cells = []
-        for column_id, value in zip(self._columns, resolved, strict=True):
-            formatter = self._format_registry.get(column_id) if kind == "body" else None
-            text = _coerce_text(value, formatter, column_id, context)
+        for position, (column_id, value) in enumerate(zip(self._columns, resolved, strict=True)):
+            text = texts[position] if texts is not None else None
+            if text is None:
+                formatter = self._format_registry.get(column_id) if kind == "body" else None
+                text = _coerce_text(value, formatter, column_id, context)
             cells.append(
                 self._make_cell(
                     value,
@@ -165,7 +218,7 @@ class TableBuilder:
                     text=text,
                 )
             )
-        return Row(tuple(cells), kind=kind, index=index, style=row_style)
+        return Row(tuple(cells), kind=kind, index=index if key is None else key, style=row_style)
 
     def _resolve_row_style(self, index: Any, values: Sequence[Any]) -> "RowStyle | None":
         for predicate, style in self._row_predicates:
@@ -9,6 +9,7 @@ RowKind = Literal["header", "body"]
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     from ..layout import LayoutOptions
+    from .stats import TableStats
     from ..style import CellStyle, RowStyle, TableStyle
 
 
@@ -26,6 +27,9 @@ class Cell:
     id: str | None = None
     scope: str | None = None
     headers: Tuple[str, ...] | None = None
+    # CSS custom properties always written to the cell's inline style, so a
+    # shared class can read per-cell values without a style of its own.
+    variables: Tuple[Tuple[str, str], ...] | None = None
 
 
 @dataclass(slots=True)
@@ -52,12 +56,25 @@ class Table:
     metadata: dict[str, Any] = field(default_factory=dict)
     table_style: "TableStyle | None" = None
     layout: "LayoutOptions | None" = None
+    # Memoized column statistics; see :func:`richframe.core.stats.table_stats`.
+    stats: "TableStats | None" = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.columns = tuple(self.columns)
         self.header_rows = tuple(self.header_rows)
         self.body_rows = tuple(self.body_rows)
 
+    def __getstate__(self) -> dict[str, Any]:
+        # Statistics may reference the source DataFrame, so they are not
+        # pickled along with the table; they are recomputed on demand.
+        state = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        state["stats"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @property
     def column_count(self) -> int:
         """Return the number of logical columns the table has."""
@@ -0,0 +1,285 @@
+"""Per-column statistics shared by plugins."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    from .model import Row, Table
+
+__all__ = ["ColumnStats", "TableStats", "aligned_stats", "carry_stats", "numeric_array", "table_stats"]
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnStats:
+    """Summary of one column, or of several columns pooled together.
+
+    ``count`` is the number of numeric values; ``minimum``, ``maximum``,
+    ``mean`` and the quantiles are computed over those and are ``None`` when
+    there are none. ``null_count`` counts missing values and
+    ``distinct_count`` the distinct non-missing values, numeric or not.
+    """
+
+    size: int
+    count: int
+    null_count: int
+    distinct_count: int
+    minimum: float | None
+    maximum: float | None
+    mean: float | None
+    values: np.ndarray = field(repr=False, compare=False)
+
+    @classmethod
+    def from_values(cls, values: Any) -> "ColumnStats":
+        """Compute statistics for an array-like of raw cell values."""
+
+        raw = _as_array(values)
+        numeric = numeric_array(raw)
+        # Sorted non-missing numbers, including infinities.
+        present_numeric = np.sort(numeric[~np.isnan(numeric)])
+        missing = pd.isna(raw)
+        null_count = int(np.count_nonzero(missing))
+        present = len(raw) - null_count
+        if len(present_numeric) == present:
+            # Neighbours are compared rather than subtracted: inf - inf is NaN.
+            changes = np.count_nonzero(present_numeric[1:] != present_numeric[:-1])
+            distinct = int(changes) + 1 if len(present_numeric) else 0
+        else:
+            distinct = _distinct_count(raw[~missing])
+        if len(present_numeric):
+            with np.errstate(invalid="ignore"):  # inf and -inf average to NaN
+                mean = float(present_numeric.mean())
+            minimum, maximum = float(present_numeric[0]), float(present_numeric[-1])
+        else:
+            minimum = maximum = mean = None
+        return cls(
+            size=len(raw),
+            count=len(present_numeric),
+            null_count=null_count,
+            distinct_count=distinct,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            values=present_numeric,
+        )
+
+    def quantile(self, q: float) -> float | None:
+        """Return the ``q`` quantile (``0 <= q <= 1``) of the numeric values."""
+
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        return float(np.quantile(self.values, q))
+
+    def quantiles(self, qs: Sequence[float]) -> tuple[float, ...] | None:
+        """Return several quantiles at once, or ``None`` without numeric values."""
+
+        if any(not 0.0 <= q <= 1.0 for q in qs):
+            raise ValueError("quantiles must be between 0 and 1")
+        if not self.count:
+            return None
+        return tuple(float(value) for value in np.quantile(self.values, list(qs)))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "size": self.size,
+            "count": self.count,
+            "null_count": self.null_count,
+            "distinct_count": self.distinct_count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.mean,
+        }
+
+
+class TableStats:
+    """Lazily computed, memoized :class:`ColumnStats` for the columns of a table.
+
+    ``sources`` maps column ids to their raw values, or is a callable returning
+    them for a column id. Each column (and each pooled group of columns) is
+    summarised at most once. ``rows`` is the ``body_rows`` tuple the sources
+    describe; :func:`table_stats` only reuses the statistics for that tuple.
+    """
+
+    def __init__(
+        self,
+        sources: Mapping[str, Any] | Callable[[str], Any],
+        *,
+        rows: "tuple[Row, ...] | None" = None,
+    ) -> None:
+        self._sources = sources
+        self.rows = rows
+        self._arrays: dict[str, np.ndarray] = {}
+        self._columns: dict[str, ColumnStats] = {}
+        self._combined: dict[tuple[str, ...], ColumnStats] = {}
+
+    @classmethod
+    def from_table(cls, table: "Table") -> "TableStats":
+        """Collect raw values from the body cells of ``table``.
+
+        Each column has one value per body row; rows without a body cell in
+        the column (such as rows covered by a merged cell) contribute ``None``.
+        """
+
+        body_rows = table.body_rows
+
+        def values(column_id: str) -> list[Any]:
+            return [_row_value(row, column_id) for row in body_rows]
+
+        return cls(values, rows=body_rows)
+
+    def bind(self, rows: "tuple[Row, ...]") -> "TableStats":
+        """Return statistics sharing these caches, for ``rows`` holding the same values.
+
+        Used by transformations that restyle or merge cells without adding,
+        dropping, or reordering rows.
+        """
+
+        bound = TableStats(self._sources, rows=rows)
+        bound._arrays = self._arrays
+        bound._columns = self._columns
+        bound._combined = self._combined
+        return bound
+
+    def array(self, column_id: str) -> np.ndarray:
+        """Return the raw values of ``column_id`` as a NumPy array, one per body row.
+
+        Numeric columns, including nullable ones, come back as ``float64`` with
+        NaN for missing values; other columns keep their NumPy dtype.
+        """
+
+        array = self._arrays.get(column_id)
+        if array is None:
+            array = self._arrays[column_id] = _as_array(self._values(column_id))
+        return array
+
+    def series(self, column_id: str) -> pd.Series:
+        """Return the raw values of ``column_id`` as a :class:`pandas.Series`.
+
+        Unlike :meth:`array` this keeps the source dtype and has a
+        ``RangeIndex`` matching the body row positions.
+        """
+
+        values = self._values(column_id)
+        if isinstance(values, pd.Series):
+            return values.reset_index(drop=True)
+        if isinstance(values, pd.Index):
+            return pd.Series(values, copy=False)
+        return pd.Series(list(values))
+
+    def column(self, column_id: str) -> ColumnStats:
+        """Return the statistics of ``column_id``."""
+
+        stats = self._columns.get(column_id)
+        if stats is None:
+            stats = self._columns[column_id] = ColumnStats.from_values(self.array(column_id))
+        return stats
+
+    def combined(self, column_ids: Iterable[str]) -> ColumnStats:
+        """Return statistics over the values of ``column_ids`` pooled together."""
+
+        key = tuple(dict.fromkeys(column_ids))
+        if len(key) == 1:
+            return self.column(key[0])
+        stats = self._combined.get(key)
+        if stats is None:
+            parts = [self.array(column_id) for column_id in key]
+            pooled = np.concatenate(parts) if parts else np.empty(0, dtype=object)
+            stats = self._combined[key] = ColumnStats.from_values(pooled)
+        return stats
+
+    def _values(self, column_id: str) -> Any:
+        if callable(self._sources):
+            return self._sources(column_id)
+        return self._sources.get(column_id, ())
+
+
+def table_stats(table: "Table") -> TableStats:
+    """Return the statistics service of ``table``, creating it on first use.
+
+    Statistics built for a different ``body_rows`` tuple (for instance copied
+    by :func:`dataclasses.replace` after a plugin dropped rows) are rebuilt
+    from the cells.
+    """
+
+    if table.stats is None or table.stats.rows is not table.body_rows:
+        table.stats = TableStats.from_table(table)
+    return table.stats
+
+
+def aligned_stats(table: "Table", column_ids: Iterable[str]) -> TableStats:
+    """Return statistics of ``table`` with one value per body row in each of ``column_ids``.
+
+    The memoized statistics are used when their sources line up with the body
+    rows; otherwise the values are collected from the body cells.
+    """
+
+    stats = table_stats(table)
+    rows = len(table.body_rows)
+    if all(len(stats.array(column_id)) == rows for column_id in column_ids):
+        return stats
+    return TableStats.from_table(table)
+
+
+def carry_stats(table: "Table", rows: "tuple[Row, ...]") -> TableStats | None:
+    """Return ``table``'s statistics for ``rows``, which hold the same values in the same order.
+
+    Statistics that were already stale for ``table`` are dropped.
+    """
+
+    stats = table.stats
+    if stats is None or stats.rows is not table.body_rows:
+        return None
+    return stats.bind(rows)
+
+
+def numeric_array(values: np.ndarray) -> np.ndarray:
+    """Return ``values`` as float64 with NaN for anything that is not a number.
+
+    Use it on arrays from :meth:`TableStats.array` before arithmetic.
+    """
+
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64, copy=False)
+    if values.dtype.kind != "O":
+        return np.full(len(values), np.nan)
+    return np.fromiter((_float_or_nan(value) for value in values), dtype=np.float64, count=len(values))
+
+
+def _row_value(row: "Row", column_id: str) -> Any:
+    for cell in row.cells:
+        if cell.kind == "body" and cell.column_id == column_id:
+            return cell.value
+    return None
+
+
+def _as_array(values: Any) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values
+    if isinstance(values, (pd.Series, pd.Index)):
+        if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+            # Nullable integer and float columns convert without boxing.
+            return values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return values.to_numpy()
+    return np.asarray(list(values), dtype=object)
+
+
+def _float_or_nan(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _distinct_count(values: np.ndarray) -> int:
+    try:
+        return len(pd.unique(values))
+    except TypeError:  # unhashable values
+        return len({repr(value) for value in values})
@@ -6,8 +6,11 @@ from .formatter import (
     FormatRegistry,
     default_formatters,
 )
+from .intervals import IntervalFormatter
+from .locales import warm_locales
 from .numbers import CurrencyFormatter, NumberFormatter, PercentageFormatter
-from .temporal import DateFormatter
+from .patterns import PatternFormatter, compile_pattern
+from .temporal import DateFormatter, DurationFormatter, PeriodFormatter
 from .resolver import resolve_formatter
 
 __all__ = [
@@ -21,4 +24,10 @@ __all__ = [
     "NumberFormatter",
     "PercentageFormatter",
     "DateFormatter",
+    "DurationFormatter",
+    "PeriodFormatter",
+    "IntervalFormatter",
+    "PatternFormatter",
+    "compile_pattern",
+    "warm_locales",
 ]
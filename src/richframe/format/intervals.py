@@ -0,0 +1,80 @@
+"""Interval formatting helpers."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .formatter import FormatContext, Formatter, FormatResult
+from .numbers import NumberFormatter
+from .temporal import DateFormatter, DurationFormatter
+
+__all__ = ["IntervalFormatter"]
+
+
+@dataclass(slots=True)
+class IntervalFormatter:
+    """Format intervals as ``[left, right)`` with formatted endpoints.
+
+    ``endpoint`` formats both ends; by default numbers keep the digits they
+    have, and timestamps and timedeltas get the matching built-in formatter.
+    """
+
+    endpoint: Formatter | None = None
+
+    def __call__(self, value: object, context: FormatContext) -> FormatResult:
+        if not isinstance(value, pd.Interval):
+            return "" if value is None or value != value else str(value)
+        endpoint = self.endpoint or _default_endpoint_formatter(value.left)
+        left, right = _brackets(value.closed)
+        return f"{left}{endpoint(value.left, context)}, {endpoint(value.right, context)}{right}"
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str] | None:
+        """Format a whole ``interval`` column, formatting each side in bulk.
+
+        Categoricals of intervals, as returned by :func:`pandas.cut`, format
+        their categories once.
+        """
+
+        if isinstance(values.dtype, pd.CategoricalDtype) and isinstance(values.dtype.categories.dtype, pd.IntervalDtype):
+            codes = values.cat.codes.to_numpy() if isinstance(values, pd.Series) else values.codes
+            categories = self.format_column(values.dtype.categories, context)
+            return np.array([*categories, ""], dtype=object)[codes].tolist()  # type: ignore[misc]
+        if not isinstance(values.dtype, pd.IntervalDtype):
+            return None
+        intervals = pd.IntervalIndex(values)
+        endpoint = self.endpoint or _default_endpoint_formatter(intervals.dtype.subtype)
+        open_bracket, close_bracket = _brackets(intervals.closed)
+        lefts = _format_side(endpoint, intervals.left, context)
+        rights = _format_side(endpoint, intervals.right, context)
+        texts = [f"{open_bracket}{left}, {right}{close_bracket}" for left, right in zip(lefts, rights)]
+        return np.where(intervals.isna(), "", np.array(texts, dtype=object)).tolist()
+
+
+def _brackets(closed: str) -> tuple[str, str]:
+    return ("[" if closed in ("left", "both") else "("), ("]" if closed in ("right", "both") else ")")
+
+
+def _default_endpoint_formatter(sample: Any) -> Formatter:
+    """Return the built-in formatter for an endpoint value or dtype."""
+
+    if isinstance(sample, (datetime, np.datetime64)) or pd.api.types.is_datetime64_any_dtype(sample):
+        return DateFormatter()
+    if isinstance(sample, (timedelta, np.timedelta64)) or pd.api.types.is_timedelta64_dtype(sample):
+        return DurationFormatter()
+    return NumberFormatter(precision=None)
+
+
+def _format_side(endpoint: Formatter, values: pd.Index, context: FormatContext) -> list[str]:
+    format_column = getattr(endpoint, "format_column", None)
+    texts = format_column(values, context) if format_column is not None else None
+    if texts is not None:
+        return texts
+    codes, uniques = pd.factorize(values)
+    formatted = np.empty(len(uniques) + 1, dtype=object)
+    formatted[: len(uniques)] = [endpoint(value, context) for value in uniques]
+    formatted[-1] = ""
+    return formatted[codes].tolist()
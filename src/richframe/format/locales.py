@@ -0,0 +1,105 @@
+"""Cached locale data for babel-backed formatters.
+
+Looking up number symbols and parsing date patterns through babel is far more
+expensive than formatting a single value, so both are resolved once per
+locale (and pattern) here and shared by every formatter instance.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    from babel import Locale
+    from babel.dates import get_date_format, get_datetime_format, get_time_format, parse_pattern
+    from babel.numbers import get_decimal_symbol, get_group_symbol
+except Exception:  # pragma: no cover - fallback when babel missing
+    Locale = None  # type: ignore[assignment,misc]
+
+__all__ = ["DatePattern", "date_pattern", "number_symbols", "warm_locales"]
+
+_STANDARD_FORMATS = ("full", "long", "medium", "short")
+
+
+@lru_cache(maxsize=None)
+def number_symbols(locale: str) -> tuple[str | None, str | None]:
+    """Return the ``(group, decimal)`` symbols of ``locale``.
+
+    Either symbol is ``None`` when babel is not installed or does not know it.
+    """
+
+    if Locale is None:
+        return None, None
+    try:
+        group = get_group_symbol(locale)
+    except Exception:
+        group = None
+    try:
+        decimal = get_decimal_symbol(locale)
+    except Exception:
+        decimal = None
+    return group, decimal
+
+
+@dataclass(frozen=True, slots=True)
+class DatePattern:
+    """A babel date pattern compiled for one locale.
+
+    Produces the same text as :func:`babel.dates.format_datetime` without
+    re-parsing the pattern for every value. Standard formats (``"medium"``
+    and friends) keep the locale's separate date and time patterns and the
+    text joining them.
+    """
+
+    locale: Any
+    pattern: Any = None
+    date: Any = None
+    time: Any = None
+    glue: str = ""
+
+    def __call__(self, value: date) -> str:
+        if not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        if self.pattern is not None:
+            return self.pattern.apply(value, self.locale)
+        day = value.date()
+        return self.glue.replace("{0}", self.time.apply(value.timetz(), self.locale, reference_date=day)).replace(
+            "{1}", self.date.apply(day, self.locale)
+        )
+
+
+@lru_cache(maxsize=512)
+def date_pattern(pattern: str, locale: str) -> DatePattern | None:
+    """Return ``pattern`` compiled for ``locale``, or ``None`` without babel."""
+
+    if Locale is None:
+        return None
+    parsed = Locale.parse(locale)
+    if pattern in _STANDARD_FORMATS:
+        return DatePattern(
+            locale=parsed,
+            date=parse_pattern(get_date_format(pattern, locale=parsed)),
+            time=parse_pattern(get_time_format(pattern, locale=parsed)),
+            glue=str(get_datetime_format(pattern, locale=parsed)).replace("'", ""),
+        )
+    return DatePattern(locale=parsed, pattern=parse_pattern(pattern))
+
+
+def warm_locales(locales: Iterable[str], patterns: Iterable[str] = _STANDARD_FORMATS) -> None:
+    """Load number symbols and compile date ``patterns`` for each of ``locales``.
+
+    Services rendering for many locales can call this at start-up so the
+    first request in each locale does not pay for loading babel's data.
+    Unknown locales raise babel's ``UnknownLocaleError``.
+    """
+
+    patterns = tuple(patterns)
+    for locale in locales:
+        number_symbols(locale)
+        for pattern in patterns:
+            date_pattern(pattern, locale)
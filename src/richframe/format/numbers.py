@@ -3,15 +3,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP, localcontext
+from functools import lru_cache
 from typing import Any
 
 from .formatter import FormatContext, FormatResult
-
-try:  # pragma: no cover - optional dependency
-    from babel.numbers import get_decimal_symbol, get_group_symbol
-except Exception:  # pragma: no cover - fallback when babel missing
-    get_decimal_symbol = None  # type: ignore[assignment]
-    get_group_symbol = None  # type: ignore[assignment]
+from .locales import number_symbols
 
 __all__ = ["NumberFormatter", "CurrencyFormatter", "PercentageFormatter"]
 
@@ -30,18 +26,50 @@ class NumberFormatter:
     locale: str | None = None
 
     def __call__(self, value: object, context: FormatContext) -> FormatResult:
-        if value is None or _is_nan(value):
+        if value is None:
             return ""
-        decimal_value = _coerce_decimal(value)
-        if decimal_value is None:
-            return str(value)
-        scale = self._resolve_scale(decimal_value)
-        quantized = self._quantize(decimal_value, scale)
-        base = self._format_quantized(quantized, scale)
+        base = None
+        if self.precision is not None:
+            scale = self.precision if self.precision > self.min_precision else self.min_precision
+            base = self._format_native(value, scale)
+        if base is None:
+            if _is_nan(value):
+                return ""
+            decimal_value = _coerce_decimal(value)
+            if decimal_value is None:
+                return str(value)
+            scale = self._resolve_scale(decimal_value)
+            quantized = self._quantize(decimal_value, scale)
+            base = self._format_quantized(quantized, scale)
         if self.trim_trailing_zeros and scale > self.min_precision:
             base = _trim_trailing(base, ".", self.min_precision)
         thousands, decimal = self._resolve_separators(context)
-        return _apply_separators(base, thousands, decimal, self.use_grouping)
+        table = _separator_table(thousands, decimal, self.use_grouping)
+        return base if table is None else base.translate(table)
+
+    def _format_native(self, value: object, scale: int) -> str | None:
+        """Format a plain int or float without going through ``Decimal``.
+
+        Returns ``None`` when the result could differ from rounding the value's
+        shortest decimal representation ROUND_HALF_UP, and the caller falls back
+        to the ``Decimal`` path.
+        """
+
+        if type(value) is int:
+            digits = format(value, "," if self.use_grouping else "d")
+            return f"{digits}.{'0' * scale}" if scale else digits
+        # Below this bound a float is within a small fraction of 10**-scale of
+        # its shortest repr, so native rounding agrees with rounding the repr
+        # everywhere except exact decimal ties.
+        spec, limit = _native_spec(scale, self.use_grouping)
+        if not isinstance(value, float) or not -limit < value < limit:
+            return None
+        digits = float.__repr__(value)
+        if "e" in digits:
+            return None
+        if digits[-1] == "5" and len(digits) - digits.index(".") - 2 == scale:
+            return None
+        return format(value, spec)
 
     def _resolve_scale(self, value: Decimal) -> int:
         if self.precision is not None:
@@ -74,17 +102,12 @@ class NumberFormatter:
         locale = self.locale or context.locale
         thousands = self.thousands
         decimal = self.decimal
-        if locale and get_decimal_symbol and get_group_symbol:
-            if self.thousands == ",":
-                try:
-                    thousands = get_group_symbol(locale)
-                except Exception:  # pragma: no cover - defensive
-                    thousands = self.thousands
-            if self.decimal == ".":
-                try:
-                    decimal = get_decimal_symbol(locale)
-                except Exception:  # pragma: no cover - defensive
-                    decimal = self.decimal
+        if locale:
+            group_symbol, decimal_symbol = number_symbols(locale)
+            if self.thousands == "," and group_symbol is not None:
+                thousands = group_symbol
+            if self.decimal == "." and decimal_symbol is not None:
+                decimal = decimal_symbol
         if not self.use_grouping:
             thousands = ""
         return thousands, decimal
@@ -149,16 +172,24 @@ def _coerce_decimal(value: object) -> Decimal | None:
         return None
 
 
-def _apply_separators(text: str, thousands: str, decimal: str, use_grouping: bool) -> str:
-    result = text
-    if use_grouping and thousands and thousands != ",":
-        result = result.replace(",", "{COMMA}")
-        result = result.replace("{COMMA}", thousands)
-    if not use_grouping:
-        result = result.replace(",", "")
-    if decimal != ".":
-        result = result.replace(".", decimal)
-    return result
+@lru_cache(maxsize=64)
+def _native_spec(scale: int, use_grouping: bool) -> tuple[str, float]:
+    """Return the ``format`` spec for ``scale`` and the magnitude bound of the native path."""
+
+    return (f",.{scale}f" if use_grouping else f".{scale}f"), 10.0 ** (14 - scale)
+
+
+@lru_cache(maxsize=64)
+def _separator_table(thousands: str, decimal: str, use_grouping: bool) -> dict[int, str] | None:
+    """Translation table mapping ``format``'s separators onto the target ones.
+
+    Both separators are swapped in one pass, so locales that exchange them
+    (``1.234,57``) are handled correctly. ``None`` means no change is needed.
+    """
+
+    if decimal == "." and (thousands == "," or not use_grouping):
+        return None
+    return str.maketrans({",": thousands if use_grouping else "", ".": decimal})
 
 
 def _trim_trailing(value: str, decimal_point: str, min_digits: int) -> str:
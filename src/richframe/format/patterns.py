@@ -0,0 +1,332 @@
+"""Formatters driven by number pattern strings."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import lru_cache
+from numbers import Number
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from .formatter import FormatContext, FormatResult
+from .numbers import NumberFormatter, _coerce_decimal, _native_spec, _separator_table
+
+__all__ = ["PatternFormatter", "compile_pattern"]
+
+# Bracketed colour codes are accepted and ignored; cells are styled separately.
+_COLORS = frozenset({"black", "blue", "cyan", "green", "magenta", "red", "white", "yellow"})
+# Bulk formatting rounds binary floats natively. Below this many units in the
+# last decimal place, and away from ties by this margin, that matches rounding
+# the shortest repr half up; other values take the exact per-value path.
+_NATIVE_LIMIT = 1e11
+_TIE_MARGIN = 1e-4
+
+
+@dataclass(slots=True)
+class PatternFormatter:
+    """Format values with a number pattern string.
+
+    ``pattern`` is either an Excel-style pattern such as ``"#,##0.00"``,
+    ``"0.0%"`` or ``"$#,##0;($#,##0)"``, or a Python format spec such as
+    ``",.2f"`` or ``"{:+.1%}"``. Patterns are compiled once and shared by
+    every formatter using them.
+    """
+
+    pattern: str
+    _compiled: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._compiled = compile_pattern(self.pattern)
+
+    def __call__(self, value: object, context: FormatContext) -> FormatResult:
+        return self._compiled(value, context)
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str]:
+        """Format a whole column, once per distinct value."""
+
+        return self._compiled.format_column(values, context)
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> "_CompiledPattern":
+    """Compile ``pattern`` into a reusable formatter.
+
+    Excel-style patterns support ``0`` and ``#`` digit placeholders, ``,``
+    grouping and trailing ``,`` scaling, ``%``, quoted or escaped literals,
+    colour codes (ignored), and up to four ``;``-separated sections for
+    positive, negative, zero and text values. Anything else must be a valid
+    Python format spec, or a ``str.format`` template with one field.
+
+    Raises
+    ------
+    ValueError
+        If ``pattern`` is neither.
+    """
+
+    try:
+        return _ExcelPattern(pattern)
+    except ValueError as excel_error:
+        try:
+            return _SpecPattern(pattern)
+        except ValueError:
+            raise ValueError(f"Unsupported number pattern '{pattern}': {excel_error}") from None
+
+
+class _CompiledPattern(ABC):
+    """Shared missing-value handling and the batch path of compiled patterns."""
+
+    def __call__(self, value: object, context: FormatContext) -> str:
+        if _is_missing(value):
+            return ""
+        return self.format_value(value, context)
+
+    @abstractmethod
+    def format_value(self, value: object, context: FormatContext) -> str:
+        """Format one non-missing value."""
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str]:
+        if not isinstance(values, (pd.Series, pd.Index)):
+            values = pd.Series(list(values), dtype=object)
+        if pd.api.types.is_object_dtype(values.dtype) or _has_negative_zero(values):
+            # Mixed objects (1 and True) and -0.0 would share a text when factorized.
+            return [self(value, context) for value in values]
+        codes, uniques = pd.factorize(values)
+        texts = np.empty(len(uniques) + 1, dtype=object)
+        texts[: len(uniques)] = [self.format_value(value, context) for value in uniques]
+        texts[-1] = ""
+        return texts[codes].tolist()
+
+
+class _ExcelPattern(_CompiledPattern):
+    def __init__(self, pattern: str) -> None:
+        sections = [_Section(part) for part in _split_sections(pattern)]
+        if len(sections) > 4:
+            raise ValueError("at most four sections are allowed")
+        if sections[0].number is None:
+            raise ValueError("no digit placeholder ('0' or '#')")
+        self.positive = sections[0]
+        self.negative = sections[1] if len(sections) > 1 else None
+        self.zero = sections[2] if len(sections) > 2 else None
+        self.text = sections[3] if len(sections) > 3 else None
+
+    def format_value(self, value: object, context: FormatContext) -> str:
+        number = _as_number(value)
+        if number is None:
+            text = str(value)
+            return self.text.render_text(text) if self.text is not None else text
+        if number < 0:
+            if self.negative is not None:
+                return self.negative.render(-number, context)
+            return "-" + self.positive.render(-number, context)
+        if number == 0 and self.zero is not None:
+            return self.zero.render(abs(number), context)
+        return self.positive.render(abs(number), context)
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str]:
+        if not isinstance(values, (pd.Series, pd.Index)) or not _is_real_dtype(values.dtype):
+            return super().format_column(values, context)
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        if pd.api.types.is_integer_dtype(values.dtype) and np.nanmax(np.abs(numbers), initial=0) >= 2**53:
+            return super().format_column(values, context)
+        texts = np.full(len(numbers), "", dtype=object)
+        negative = numbers < 0
+        zero = (numbers == 0) if self.zero is not None else np.zeros(len(numbers), dtype=bool)
+        positive = ~np.isnan(numbers) & ~negative & ~zero
+        for rows, section, sign in (
+            (positive, self.positive, ""),
+            (negative, self.negative or self.positive, "" if self.negative is not None else "-"),
+            (zero, self.zero, ""),
+        ):
+            if section is not None and rows.any():
+                texts[rows] = section.render_many(np.abs(numbers[rows]), context, sign)
+        return texts.tolist()
+
+
+class _Section:
+    """One ``;``-separated section of an Excel-style pattern."""
+
+    def __init__(self, source: str) -> None:
+        prefix: list[str] = []
+        suffix: list[str] = []
+        placeholders: list[str] = []
+        self.percent = 0
+        position = 0
+        while position < len(source):
+            char = source[position]
+            literal = char
+            if char == '"':
+                end = source.find('"', position + 1)
+                if end < 0:
+                    raise ValueError("unterminated quoted literal")
+                literal = source[position + 1 : end]
+                position = end
+            elif char == "\\" or char == "_":
+                if position + 1 == len(source):
+                    raise ValueError(f"'{char}' must be followed by a character")
+                position += 1
+                literal = source[position] if char == "\\" else " "
+            elif char == "[":
+                end = source.find("]", position)
+                if end < 0 or source[position + 1 : end].lower() not in _COLORS:
+                    raise ValueError("only colour codes may appear in brackets")
+                position = end
+                literal = ""
+            elif char in "0#" or (char in ",." and placeholders and not suffix):
+                placeholders.append(char)
+                position += 1
+                continue
+            elif char == "." and position + 1 < len(source) and source[position + 1] in "0#" and not suffix:
+                placeholders.append(char)
+                position += 1
+                continue
+            elif char == "%":
+                self.percent += 1
+            elif char.isascii() and char.isalnum() or char == "@" and placeholders:
+                raise ValueError(f"unexpected '{char}'")
+            (suffix if placeholders else prefix).append(literal)
+            position += 1
+        self.prefix = "".join(prefix)
+        self.suffix = "".join(suffix)
+        self.number: NumberFormatter | None = None
+        if placeholders:
+            self._compile_number("".join(placeholders))
+
+    def _compile_number(self, placeholders: str) -> None:
+        digits = placeholders.rstrip(",")
+        # Each comma after the last digit placeholder divides by a thousand.
+        self.scale = len(placeholders) - len(digits)
+        core, _, fraction = digits.partition(".")
+        if "." in fraction or "," in fraction:
+            raise ValueError("unexpected separator in the decimal places")
+        self.min_digits = core.count("0")
+        required = len(fraction) - len(fraction.lstrip("0"))
+        self.number = NumberFormatter(
+            precision=len(fraction),
+            min_precision=required,
+            trim_trailing_zeros=required < len(fraction),
+            use_grouping="," in core,
+        )
+
+    def render(self, magnitude: Any, context: FormatContext) -> str:
+        if self.number is None:
+            return self.prefix + self.suffix
+        if self.percent or self.scale:
+            magnitude = _coerce_decimal(magnitude).scaleb(2 * self.percent - 3 * self.scale)
+        text = self.number(magnitude, context)
+        if self.min_digits != 1:
+            text = self._pad_whole(text, context)
+        return f"{self.prefix}{text}{self.suffix}"
+
+    def render_many(self, magnitudes: np.ndarray, context: FormatContext, sign: str) -> list[str]:
+        """Render non-negative ``magnitudes``, natively where that is exact."""
+
+        number = self.number
+        if number is None:
+            return [sign + self.prefix + self.suffix] * len(magnitudes)
+        texts = np.empty(len(magnitudes), dtype=object)
+        exponent = 2 * self.percent - 3 * self.scale
+        scaled = magnitudes * 10.0**exponent if exponent else magnitudes
+        if self.min_digits == 1 and not number.trim_trailing_zeros:
+            units = scaled * 10.0**number.precision
+            with np.errstate(invalid="ignore"):  # infinities render through the scalar path
+                native = np.isfinite(units) & (units < _NATIVE_LIMIT) & (np.abs(units - np.floor(units) - 0.5) > _TIE_MARGIN)
+        else:
+            native = np.zeros(len(magnitudes), dtype=bool)
+        if native.any():
+            spec = _native_spec(number.precision, number.use_grouping)[0]  # type: ignore[arg-type]
+            table = _separator_table(*number._resolve_separators(context), number.use_grouping)
+            head, tail = sign + self.prefix, self.suffix
+            if table is None:
+                texts[native] = [f"{head}{format(value, spec)}{tail}" for value in scaled[native].tolist()]
+            else:
+                texts[native] = [f"{head}{format(value, spec).translate(table)}{tail}" for value in scaled[native].tolist()]
+        if not native.all():
+            texts[~native] = [sign + self.render(value, context) for value in magnitudes[~native].tolist()]
+        return texts
+
+    def render_text(self, text: str) -> str:
+        return (self.prefix + self.suffix).replace("@", text)
+
+    def _pad_whole(self, text: str, context: FormatContext) -> str:
+        _, decimal = self.number._resolve_separators(context)  # type: ignore[union-attr]
+        whole, point, fraction = text.partition(decimal)
+        if self.min_digits == 0 and whole == "0":
+            whole = ""
+        elif len(whole) < self.min_digits:
+            whole = whole.rjust(self.min_digits, "0")
+        return f"{whole}{point}{fraction}"
+
+
+class _SpecPattern(_CompiledPattern):
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self.template = "{" in pattern
+        for sample in (0.5, 0):
+            try:
+                self._format(sample)
+                return
+            except (IndexError, KeyError, TypeError, ValueError):
+                continue
+        raise ValueError(f"'{pattern}' is not a format spec")
+
+    def format_value(self, value: object, context: FormatContext) -> str:
+        try:
+            return self._format(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def _format(self, value: object) -> str:
+        return self.pattern.format(value) if self.template else format(value, self.pattern)
+
+
+def _split_sections(pattern: str) -> list[str]:
+    sections: list[str] = []
+    start = 0
+    quoted = escaped = False
+    for position, char in enumerate(pattern):
+        if escaped:
+            escaped = False
+        elif char == "\\" and not quoted:
+            escaped = True
+        elif char == '"':
+            quoted = not quoted
+        elif char == ";" and not quoted:
+            sections.append(pattern[start:position])
+            start = position + 1
+    sections.append(pattern[start:])
+    return sections
+
+
+def _as_number(value: object) -> int | float | Decimal | None:
+    if isinstance(value, bool) or isinstance(value, np.bool_):
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return value
+    if isinstance(value, np.number) and not isinstance(value, np.complexfloating):
+        return value.item()
+    if isinstance(value, Number) and not isinstance(value, complex):
+        return _coerce_decimal(value)
+    return None
+
+
+def _is_real_dtype(dtype: Any) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not (
+        pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_complex_dtype(dtype)
+    )
+
+
+def _is_missing(value: object) -> bool:
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _has_negative_zero(values: pd.Series | pd.Index) -> bool:
+    if not pd.api.types.is_float_dtype(values.dtype):
+        return False
+    numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return bool(np.any((numbers == 0) & np.signbit(numbers)))
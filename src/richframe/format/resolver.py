@@ -4,29 +4,46 @@ from __future__ import annotations
 from typing import Callable
 
 from .formatter import Formatter
+from .intervals import IntervalFormatter
 from .numbers import CurrencyFormatter, NumberFormatter, PercentageFormatter
-from .temporal import DateFormatter
+from .patterns import PatternFormatter
+from .temporal import DateFormatter, DurationFormatter, PeriodFormatter
 
 __all__ = ["resolve_formatter"]
 
+_NAMED_FORMATTERS: dict[str, Callable[[], Formatter]] = {
+    "number": NumberFormatter,
+    "currency": CurrencyFormatter,
+    "percent": PercentageFormatter,
+    "percentage": PercentageFormatter,
+    "date": DateFormatter,
+    "duration": DurationFormatter,
+    "period": PeriodFormatter,
+    "interval": IntervalFormatter,
+}
+
 
 def resolve_formatter(value: Formatter | str | Callable[..., Formatter]) -> Formatter:
+    """Return the formatter for ``value``.
+
+    Strings name a built-in formatter (``"number"``, ``"currency"``,
+    ``"percent"``, ``"date"``, ``"duration"``, ``"period"``, ``"interval"``)
+    or are a number pattern handled by :class:`PatternFormatter`; callables
+    are returned as-is.
+    """
+
     if callable(value) and not isinstance(value, str):
         # Formatter instances are callable; return as-is.
         return value  # type: ignore[return-value]
-    mapping: dict[str, Formatter] = {
-        "number": NumberFormatter(),
-        "currency": CurrencyFormatter(),
-        "percent": PercentageFormatter(),
-        "percentage": PercentageFormatter(),
-        "date": DateFormatter(),
-    }
     if isinstance(value, str):
-        key = value.lower()
+        factory = _NAMED_FORMATTERS.get(value.lower())
+        if factory is not None:
+            return factory()
         try:
-            return mapping[key]
-        except KeyError as exc:  # pragma: no cover - defensive path
+            return PatternFormatter(value)
+        except ValueError as exc:
             raise KeyError(
-                f"Unknown formatter '{value}'. Available keys: {', '.join(sorted(mapping))}"
+                f"Unknown formatter '{value}'. Available keys: {', '.join(sorted(_NAMED_FORMATTERS))}, "
+                "or a number pattern such as '#,##0.00'"
             ) from exc
     raise TypeError("Formatter must be a callable or a known formatter name")
@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+import pandas as pd
 
 from .formatter import FormatContext, FormatResult
+from .locales import date_pattern
 
-try:  # pragma: no cover - optional dependency
-    from babel.dates import format_datetime
-except Exception:  # pragma: no cover - fallback when babel missing
-    format_datetime = None  # type: ignore
+__all__ = ["DateFormatter", "DurationFormatter", "PeriodFormatter"]
 
-__all__ = ["DateFormatter"]
+_NANOS_PER_SECOND = 1_000_000_000
+_NANOS_PER_DAY = 86_400 * _NANOS_PER_SECOND
 
 
 @dataclass(slots=True)
@@ -24,17 +27,154 @@ class DateFormatter:
         if value is None:
             return ""
         if isinstance(value, datetime):
+            if value != value:  # NaT
+                return ""
             return self._format_datetime(value, context)
         if isinstance(value, date):
             return self._format_date(value, context)
         return str(value)
 
     def _format_datetime(self, value: datetime, context: FormatContext) -> str:
-        if format_datetime is None or context.locale is None:
+        compiled = date_pattern(self.pattern, context.locale) if context.locale is not None else None
+        if compiled is None:
             return value.isoformat()
-        return format_datetime(value, format=self.pattern, locale=context.locale)
+        return compiled(value)
 
     def _format_date(self, value: date, context: FormatContext) -> str:
-        if format_datetime is None or context.locale is None:
+        compiled = date_pattern(self.pattern, context.locale) if context.locale is not None else None
+        if compiled is None:
             return value.isoformat()
-        return format_datetime(value, format=self.pattern, locale=context.locale)
+        return compiled(value)
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str] | None:
+        """Format a whole ``datetime64`` column or index at once.
+
+        Without a locale the ISO texts are assembled with NumPy; with one, the
+        cached pattern is applied once per distinct timestamp. NaT becomes an
+        empty string. Returns ``None`` for other dtypes.
+        """
+
+        if not pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return None
+        stamps = pd.DatetimeIndex(values)
+        compiled = date_pattern(self.pattern, context.locale) if context.locale is not None else None
+        if compiled is None:
+            return _iso_texts(stamps)
+        codes, uniques = pd.factorize(stamps)
+        texts = np.empty(len(uniques) + 1, dtype=object)
+        texts[: len(uniques)] = [compiled(stamp) for stamp in uniques]
+        texts[-1] = ""
+        return texts[codes].tolist()
+
+
+@dataclass(slots=True)
+class DurationFormatter:
+    """Format timedeltas as ``[-][Dd ]HH:MM:SS[.fff]``.
+
+    ``precision`` is the number of fractional second digits, rounded half up.
+    With ``days=False`` whole days are folded into the hours (``50:00:00``).
+    """
+
+    precision: int = 0
+    days: bool = True
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.precision <= 9:
+            raise ValueError("precision must be between 0 and 9")
+
+    def __call__(self, value: object, context: FormatContext) -> FormatResult:
+        if value is None or value is pd.NaT:
+            return ""
+        if isinstance(value, (timedelta, np.timedelta64)):
+            duration = pd.Timedelta(value)
+            if duration is pd.NaT:
+                return ""
+            return _duration_text(duration.value, self.precision, self.days)
+        return str(value)
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str] | None:
+        """Format a whole ``timedelta64`` column once per distinct duration."""
+
+        if not pd.api.types.is_timedelta64_dtype(values.dtype):
+            return None
+        nanos = np.asarray(values.to_numpy()).astype("timedelta64[ns]").view(np.int64)
+        missing = np.isnat(nanos.view("timedelta64[ns]"))
+        uniques, codes = np.unique(nanos[~missing], return_inverse=True)
+        texts = np.full(len(nanos), "", dtype=object)
+        texts[~missing] = np.array(
+            [_duration_text(nano, self.precision, self.days) for nano in uniques.tolist()], dtype=object
+        )[codes]
+        return texts.tolist()
+
+
+@dataclass(slots=True)
+class PeriodFormatter:
+    """Format periods with a ``strftime`` pattern, or pandas' own notation without one."""
+
+    pattern: str | None = None
+
+    def __call__(self, value: object, context: FormatContext) -> FormatResult:
+        if value is None or value is pd.NaT:
+            return ""
+        if isinstance(value, pd.Period):
+            return value.strftime(self.pattern) if self.pattern is not None else str(value)
+        return str(value)
+
+    def format_column(self, values: Any, context: FormatContext) -> list[str] | None:
+        """Format a whole ``period`` column with :meth:`pandas.PeriodIndex.strftime`."""
+
+        if not isinstance(values.dtype, pd.PeriodDtype):
+            return None
+        periods = pd.PeriodIndex(values)
+        texts = periods.strftime(self.pattern) if self.pattern is not None else periods.astype(str)
+        return np.where(periods.isna(), "", texts.to_numpy(dtype=object)).tolist()
+
+
+def _duration_text(nanos: int, precision: int, days: bool) -> str:
+    unit = 10 ** (9 - precision)
+    total = (abs(nanos) + unit // 2) // unit * unit
+    # Durations that round to zero show no sign.
+    sign = "-" if nanos < 0 and total else ""
+    day_count, rest = divmod(total, _NANOS_PER_DAY) if days else (0, total)
+    seconds, fraction = divmod(rest, _NANOS_PER_SECOND)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    text = f"{sign}{day_count}d " if day_count else sign
+    text += f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    if precision:
+        text += f".{fraction // unit:0{precision}d}"
+    return text
+
+
+def _iso_texts(stamps: pd.DatetimeIndex) -> list[str] | None:
+    """Return ``Timestamp.isoformat()`` for every stamp, with ``""`` for NaT."""
+
+    wall = stamps.tz_localize(None) if stamps.tz is not None else stamps
+    seconds = wall.to_numpy().astype("datetime64[s]")
+    valid = ~np.isnat(seconds)
+    if valid.any() and not (
+        np.datetime64("0001-01-01") <= seconds[valid].min() and seconds[valid].max() < np.datetime64("10000-01-01")
+    ):
+        return None
+    texts = np.datetime_as_string(seconds, unit="s").astype(object)
+    # Like isoformat(), show microseconds when present and nanoseconds when needed.
+    fraction = (wall.to_numpy() - seconds).astype("timedelta64[ns]").astype(np.int64)
+    micro, nano = np.divmod(np.where(valid, fraction, 0), 1000)
+    for rows, digits, width in (
+        (valid & (micro != 0) & (nano == 0), micro, 6),
+        (valid & (nano != 0), micro * 1000 + nano, 9),
+    ):
+        if rows.any():
+            texts[rows] += np.char.add(".", np.char.zfill(digits[rows].astype(str), width)).astype(object)
+    if stamps.tz is not None:
+        offsets = np.asarray((wall - stamps.tz_convert(None)).total_seconds())
+        codes, uniques = pd.factorize(offsets[valid])
+        suffixes = np.array([_iso_offset(offset) for offset in uniques], dtype=object)
+        texts[valid] += suffixes[codes]
+    texts[~valid] = ""
+    return texts.tolist()
+
+
+def _iso_offset(seconds: float) -> str:
+    stamp = datetime(2000, 1, 1, tzinfo=timezone(timedelta(seconds=seconds)))
+    return stamp.isoformat()[len("2000-01-01T00:00:00") :]
@@ -1,20 +1,62 @@
 """Adapters for turning pandas objects into richframe tables."""
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from itertools import repeat
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from ..core.builder import TableBuilder
 from ..core.model import Table
-from ..format import Formatter, NumberFormatter, DateFormatter, resolve_formatter
-from ..layout import ColumnConfig, FilterConfig, SortConfig
+from ..core.stats import TableStats
+from ..format import (
+    CurrencyFormatter,
+    DateFormatter,
+    DurationFormatter,
+    Formatter,
+    IntervalFormatter,
+    NumberFormatter,
+    PatternFormatter,
+    PercentageFormatter,
+    PeriodFormatter,
+    resolve_formatter,
+)
+from ..layout import ColumnConfig, FilterConfig, RowMask, SortConfig, filter_mask
 from ..merge import apply_merges
+from ..parallel import create_executor
 from ..style import RowStyle
 from pandas.api import types as pd_types
 
-__all__ = ["dataframe_to_table"]
+__all__ = ["dataframe_to_table", "filter_frame", "sort_frame"]
+
+# Filter menus of columns with more distinct values than this only offer search.
+_FILTER_VALUE_LIMIT = 500
+
+# Columns with at most this share of distinct values are formatted once per value.
+_DICTIONARY_RATIO = 0.5
+# Object columns of these inferred kinds never hold distinct values that compare
+# equal (such as ``1`` and ``True``), so factorizing them is lossless.
+_DICTIONARY_OBJECT_KINDS = frozenset({"string", "bytes", "boolean", "integer", "date"})
+# Parallel column formatting only pays off with at least this many cells per worker.
+_MIN_CELLS_PER_FORMAT_WORKER = 50_000
+# Formatters whose output depends only on the value (and locale), not the row.
+# Matched by exact type: a subclass may override ``__call__`` to use the row.
+_VALUE_FORMATTERS = frozenset(
+    {
+        NumberFormatter,
+        CurrencyFormatter,
+        PercentageFormatter,
+        PatternFormatter,
+        DateFormatter,
+        DurationFormatter,
+        PeriodFormatter,
+        IntervalFormatter,
+    }
+)
+
+RowPredicate = Callable[[Any, Sequence[Any]], bool] | RowMask | str
 
 
 def dataframe_to_table(
@@ -27,13 +69,17 @@ def dataframe_to_table(
     column_layout: Mapping[str, ColumnConfig | Mapping[str, object] | None] | None = None,
     sticky_header: bool = False,
     zebra_striping: bool = False,
-    row_predicates: Sequence[tuple[Callable[[Any, Sequence[Any]], bool], RowStyle | Mapping[str, str] | None]] | None = None,
+    row_predicates: Sequence[tuple[RowPredicate, RowStyle | Mapping[str, str] | None]] | None = None,
     title: str | None = None,
     subtitle: str | None = None,
     filters: Sequence[FilterConfig] | None = None,
     sorts: Sequence[SortConfig] | None = None,
     interactive_controls: bool = False,
     resizable_columns: bool = False,
+    live_updates: bool = False,
+    virtualize: bool = False,
+    filter_value_limit: int = _FILTER_VALUE_LIMIT,
+    format_workers: int | None = None,
 ) -> Table:
     """Convert a :class:`pandas.DataFrame` into a :class:`~richframe.core.model.Table`.
 
@@ -45,13 +91,26 @@ def dataframe_to_table(
         When ``True`` the DataFrame index becomes the first column. Defaults to ``True``.
     caption:
         Optional table caption to propagate to the renderer.
+    row_predicates:
+        ``(predicate, style)`` pairs; the first matching predicate styles the
+        row. A predicate is a callable receiving ``(index, values)`` for each
+        row, or a :class:`~richframe.layout.RowMask` (or expression string)
+        evaluated once on the whole filtered frame.
+    filter_value_limit:
+        Columns with more distinct values than this get a search-only filter
+        menu when interactive controls are enabled. Defaults to ``500``.
+    format_workers:
+        Number of workers used to format large frames column by column, in
+        processes (threads on free-threaded builds). Only columns formatted
+        by value are sent to the pool, so their formatters must be picklable.
+        Defaults to ``None`` (serial).
     """
 
     working_frame = frame
     if filters:
-        working_frame = _apply_filters(working_frame, filters)
+        working_frame = filter_frame(working_frame, filters)
     if sorts:
-        working_frame = _apply_sorts(working_frame, sorts)
+        working_frame = sort_frame(working_frame, sorts)
 
     index_columns: list[str] = _build_index_columns(working_frame.index) if include_index else []
     data_columns, column_levels = _build_column_levels(working_frame.columns)
@@ -69,6 +128,11 @@ def dataframe_to_table(
         metadata["interactive_controls"] = True
     if resizable_columns:
         metadata["resizable_columns"] = True
+    if live_updates:
+        metadata["live_updates"] = True
+    if virtualize:
+        metadata["virtualize"] = True
+        metadata["interactive_controls"] = True
     if index_columns:
         metadata["index_columns"] = list(index_columns)
     if len(column_levels) > 1:
@@ -95,28 +159,278 @@ def dataframe_to_table(
             sticky_header=sticky_header,
             zebra_striping=zebra_striping,
         )
+    row_styles: list[RowStyle | None] | None = None
     if row_predicates:
-        for predicate, style in row_predicates:
-            builder.add_row_predicate(predicate, row_style=_coerce_row_style(style))
+        resolved_predicates = [(predicate, _coerce_row_style(style)) for predicate, style in row_predicates]
+        if any(isinstance(predicate, (RowMask, str)) for predicate, _ in resolved_predicates):
+            row_styles = _resolve_row_styles(working_frame, resolved_predicates, include_index=include_index)
+        else:
+            for predicate, style in resolved_predicates:
+                builder.add_row_predicate(predicate, row_style=style)
 
     for header_row in _compose_header_rows(index_columns, column_levels):
         builder.add_header_row(header_row)
 
+    sources = _column_sources(working_frame, index_columns if include_index else [], data_columns)
+    row_texts = _precomputed_texts(
+        builder,
+        sources,
+        column_ids,
+        len(working_frame),
+        locale=locale,
+        workers=format_workers,
+    )
     if include_index:
         index_levels = working_frame.index.nlevels if isinstance(working_frame.index, pd.MultiIndex) else 1
-        for row in working_frame.itertuples(index=True, name=None):
+        for position, row in enumerate(working_frame.itertuples(index=True, name=None)):
             raw_index, *values = row
             index_values = [raw_index] if index_levels == 1 else list(raw_index)
-            builder.add_body_row([*index_values, *values], index=raw_index)
+            row_style = row_styles[position] if row_styles is not None else None
+            texts = next(row_texts) if row_texts is not None else None
+            builder.add_body_row([*index_values, *values], index=raw_index, row_style=row_style, texts=texts)
     else:
-        for row in working_frame.itertuples(index=False, name=None):
-            builder.add_body_row(list(row))
+        # Rows keep their index as the key for live updates even when it is
+        # not displayed; predicates and formatters get None for it.
+        for position, (raw_index, *values) in enumerate(working_frame.itertuples(index=True, name=None)):
+            row_style = row_styles[position] if row_styles is not None else None
+            texts = next(row_texts) if row_texts is not None else None
+            builder.add_body_row(values, row_style=row_style, texts=texts, key=raw_index)
 
     table = builder.build()
-    return apply_merges(table, index_columns=index_columns)
+    table.stats = TableStats(sources, rows=table.body_rows)
+    if metadata.get("interactive_controls"):
+        table.metadata["value_index"] = _build_value_index(
+            working_frame,
+            table,
+            index_columns=index_columns if include_index else [],
+            data_columns=data_columns,
+            limit=filter_value_limit,
+        )
+    # Virtualized bodies render arbitrary row windows, so rows cannot span.
+    return apply_merges(table, index_columns=index_columns, span_rows=not virtualize)
+
+
+def _precomputed_texts(
+    builder: TableBuilder,
+    sources: Callable[[str], Any],
+    column_ids: Sequence[str],
+    rows: int,
+    *,
+    locale: str | None = None,
+    workers: int | None = None,
+) -> Iterator[tuple[str | None, ...]] | None:
+    """Format whole columns ahead of the row loop where possible.
+
+    Columns whose formatter formats a column at once (see
+    :meth:`TableBuilder.format_column`) are formatted in bulk. Otherwise
+    categorical columns, and columns where distinct values make up at most
+    ``_DICTIONARY_RATIO`` of the rows, are factorized; each distinct value is
+    formatted once and rows share the resulting string. Only formatters whose
+    output depends on the value alone are eligible for that, since the row
+    index is not passed when formatting by value. With ``workers`` those
+    columns are formatted completely, and concurrently, in a worker pool.
+    Returns an iterator of per-row text tuples (``None`` for cells formatted
+    as usual), or ``None`` when no column qualifies.
+    """
+
+    if rows < 2:
+        return None
+    parallel: dict[str, list[str]] = {}
+    if workers is not None and workers > 1:
+        # Index levels stay serial; they are few and come from the row tuples.
+        eligible = [
+            column_id
+            for column_id in column_ids
+            if isinstance(sources(column_id), pd.Series) and _formats_by_value(builder.get_formatter(column_id))
+        ]
+        if rows * len(eligible) >= workers * _MIN_CELLS_PER_FORMAT_WORKER:
+            parallel = _format_columns_parallel(builder, sources, eligible, locale, workers)
+    columns: list[Any] = []
+    encoded = False
+    for column_id in column_ids:
+        texts = parallel.get(column_id)
+        if texts is None:
+            texts = _column_texts(builder, column_id, sources(column_id), rows)
+        if texts is None:
+            columns.append(repeat(None, rows))
+        else:
+            columns.append(texts)
+            encoded = True
+    return zip(*columns) if encoded else None
+
+
+def _column_texts(builder: TableBuilder, column_id: str, values: Any, rows: int) -> list[str | None] | None:
+    texts = builder.format_column(column_id, values)
+    if texts is None and _formats_by_value(builder.get_formatter(column_id)):
+        texts = _column_dictionary_texts(builder, column_id, values, rows)
+    return texts
+
+
+def _formats_by_value(formatter: Formatter | None) -> bool:
+    return formatter is None or type(formatter) in _VALUE_FORMATTERS
+
+
+def _format_columns_parallel(
+    builder: TableBuilder,
+    sources: Callable[[str], Any],
+    column_ids: Sequence[str],
+    locale: str | None,
+    workers: int,
+) -> dict[str, list[str]]:
+    """Format ``column_ids`` completely in a worker pool, a batch of columns per job."""
+
+    batch_count = min(len(column_ids), workers * 4)
+    batches = [column_ids[start::batch_count] for start in range(batch_count)]
+    # A fresh RangeIndex keeps the frame's index out of the payload.
+    jobs = [
+        (locale, [(column_id, builder.get_formatter(column_id), sources(column_id).reset_index(drop=True)) for column_id in batch])
+        for batch in batches
+    ]
+    with create_executor(min(workers, len(jobs))) as executor:
+        results = list(executor.map(_format_columns_job, jobs))
+    return {
+        column_id: texts
+        for batch, batch_texts in zip(batches, results, strict=True)
+        for column_id, texts in zip(batch, batch_texts, strict=True)
+    }
+
+
+def _format_columns_job(job: tuple[str | None, list[tuple[str, Formatter | None, Any]]]) -> list[list[str]]:
+    """Worker entry point: return the text of every row for each column in ``job``."""
+
+    locale, columns = job
+    results: list[list[str]] = []
+    for column_id, formatter, values in columns:
+        builder = TableBuilder([column_id])
+        builder.set_locale(locale)
+        if formatter is not None:
+            builder.set_formatter(column_id, formatter)
+        texts = _column_texts(builder, column_id, values, len(values)) or repeat(None)
+        results.append(
+            [builder.format_value(column_id, value) if text is None else text for text, value in zip(texts, values)]
+        )
+    return results
+
+
+def _column_dictionary_texts(builder: TableBuilder, column_id: str, values: Any, rows: int) -> list[str | None] | None:
+    categorical = isinstance(values.dtype, pd.CategoricalDtype)
+    if categorical:
+        codes = values.cat.codes.to_numpy() if isinstance(values, pd.Series) else values.codes
+        uniques = list(values.dtype.categories)
+    else:
+        if not _factorizes_losslessly(values):
+            return None
+        try:
+            codes, unique_values = pd.factorize(values)
+        except TypeError:  # unhashable values
+            return None
+        if len(unique_values) > rows * _DICTIONARY_RATIO:
+            return None
+        uniques = pd.Index(unique_values).tolist() if not isinstance(unique_values, pd.Index) else unique_values.tolist()
+    texts = np.empty(len(uniques) + 1, dtype=object)
+    texts[: len(uniques)] = [builder.format_value(column_id, value) for value in uniques]
+    # Missing values (code -1) map to the trailing None and are formatted per row.
+    texts[-1] = None
+    return texts[codes].tolist()
+
+
+def _factorizes_losslessly(values: Any) -> bool:
+    dtype = values.dtype
+    if pd_types.is_object_dtype(dtype):
+        return pd_types.infer_dtype(values, skipna=True) in _DICTIONARY_OBJECT_KINDS
+    if pd_types.is_complex_dtype(dtype):
+        return False
+    if pd_types.is_float_dtype(dtype):
+        # 0.0 and -0.0 factorize together but may format differently.
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return not np.any((numbers == 0) & np.signbit(numbers))
+    return True
+
+
+def _column_sources(
+    frame: pd.DataFrame,
+    index_columns: Sequence[str],
+    data_columns: Sequence[str],
+) -> Callable[[str], Any]:
+    """Return a lookup of the raw values behind each column id."""
+
+    positions = {column_id: position for position, column_id in enumerate(data_columns)}
+    levels = {column_id: level for level, column_id in enumerate(index_columns)}
+
+    def values(column_id: str) -> Any:
+        if column_id in positions:
+            return frame.iloc[:, positions[column_id]]
+        if column_id in levels:
+            return frame.index.get_level_values(levels[column_id])
+        return ()
+
+    return values
+
+
+def _build_value_index(
+    frame: pd.DataFrame,
+    table: Table,
+    *,
+    index_columns: Sequence[str],
+    data_columns: Sequence[str],
+    limit: int,
+) -> dict[str, dict[str, Any]]:
+    """Return the distinct displayed values and their counts for each column.
+
+    Values are factorized per column, so each distinct raw value is formatted
+    once by looking up the text of its first row. ``codes`` gives the
+    position in ``values`` of every row's text, letting the renderer detect
+    text rewritten by plugins.
+    """
+
+    sources: list[tuple[str, Any]] = []
+    if isinstance(frame.index, pd.MultiIndex):
+        sources.extend(
+            (label, frame.index.get_level_values(level)) for level, label in enumerate(index_columns)
+        )
+    elif index_columns:
+        sources.append((index_columns[0], frame.index))
+    sources.extend((column_id, frame.iloc[:, position]) for position, column_id in enumerate(data_columns))
+
+    index: dict[str, dict[str, Any]] = {}
+    for column_id, values in sources:
+        entry = _column_value_index(values, table, column_id, limit)
+        if entry is not None:
+            index[column_id] = entry
+    return index
 
 
-def _apply_filters(frame: pd.DataFrame, filters: Sequence[FilterConfig]) -> pd.DataFrame:
+def _column_value_index(values: Any, table: Table, column_id: str, limit: int) -> dict[str, Any] | None:
+    try:
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    except TypeError:  # unhashable values
+        return None
+    if len(uniques) > limit:
+        return {"search_only": True, "distinct": len(uniques)}
+    counts = np.bincount(codes, minlength=len(uniques))
+    _, first_rows = np.unique(codes, return_index=True)
+    # Distinct raw values may share a displayed text (e.g. after rounding).
+    merged: dict[str, int] = {}
+    slots: dict[str, int] = {}
+    text_codes = np.empty(len(uniques), dtype=np.intp)
+    for code, position in enumerate(first_rows.tolist()):
+        text = _cell_text(table, position, column_id)
+        slot = slots.setdefault(text, len(slots))
+        merged[text] = merged.get(text, 0) + int(counts[code])
+        text_codes[code] = slot
+    return {"values": tuple(merged), "counts": tuple(merged.values()), "codes": text_codes[codes]}
+
+
+def _cell_text(table: Table, position: int, column_id: str) -> str:
+    for cell in table.body_rows[position].cells:
+        if cell.column_id == column_id:
+            return cell.text.strip()
+    return ""
+
+
+def filter_frame(frame: pd.DataFrame, filters: Sequence[FilterConfig]) -> pd.DataFrame:
+    """Return the rows of ``frame`` matching every filter, as ``to_html(filters=...)`` does."""
+
     if not filters:
         return frame
     mask = pd.Series(True, index=frame.index)
@@ -127,12 +441,14 @@ def _apply_filters(frame: pd.DataFrame, filters: Sequence[FilterConfig]) -> pd.D
             series = current[column]
         else:
             series = _series_from_index(current, config.key)
-        column_mask = _mask_from_series(series, config)
+        column_mask = filter_mask(series, config)
         mask = mask & column_mask
     return frame.loc[mask]
 
 
-def _apply_sorts(frame: pd.DataFrame, sorts: Sequence[SortConfig]) -> pd.DataFrame:
+def sort_frame(frame: pd.DataFrame, sorts: Sequence[SortConfig]) -> pd.DataFrame:
+    """Return ``frame`` sorted by ``sorts``, as ``to_html(sorts=...)`` does."""
+
     if not sorts:
         return frame
     result = frame
@@ -216,32 +532,6 @@ def _series_from_index(frame: pd.DataFrame, key: str) -> pd.Series:
     return pd.Series(index, index=index, name=str(key))
 
 
-def _mask_from_series(series: pd.Series, config: FilterConfig) -> pd.Series:
-    op = config.operator
-    value = config.value
-    if op == "contains":
-        mask = series.astype(str).str.contains(str(value), na=False)
-    elif op == "in":
-        mask = series.isin(config.value)
-    elif op == "between":
-        mask = series.between(config.value, config.upper, inclusive="both")
-    elif op == "eq":
-        mask = series.isna() if value is None else series.eq(value)
-    elif op == "ne":
-        mask = series.notna() if value is None else series.ne(value)
-    elif op == "gt":
-        mask = series.gt(value)
-    elif op == "ge":
-        mask = series.ge(value)
-    elif op == "lt":
-        mask = series.lt(value)
-    elif op == "le":
-        mask = series.le(value)
-    else:  # pragma: no cover - should be prevented by validation
-        raise ValueError(f"Unsupported operator '{config.operator}'")
-    return mask.fillna(False)
-
-
 def _build_index_columns(index: pd.Index) -> list[str]:
     if isinstance(index, pd.MultiIndex):
         labels: list[str] = []
@@ -309,29 +599,41 @@ def _apply_automatic_formatters(
         column_id = str(column)
         if builder.has_formatter(column_id):
             continue
-        if pd_types.is_datetime64_any_dtype(frame[column]):
-            builder.set_formatter(column_id, DateFormatter())
-        elif pd_types.is_numeric_dtype(frame[column]):
-            builder.set_formatter(column_id, NumberFormatter())
+        formatter = _automatic_formatter(frame[column].dtype)
+        if formatter is not None:
+            builder.set_formatter(column_id, formatter)
 
     if include_index:
         if isinstance(frame.index, pd.MultiIndex):
-            for level, label in enumerate(index_columns):
-                if builder.has_formatter(label):
-                    continue
-                level_values = frame.index.get_level_values(level)
-                if pd_types.is_datetime64_any_dtype(level_values):
-                    builder.set_formatter(label, DateFormatter())
-                elif pd_types.is_numeric_dtype(level_values):
-                    builder.set_formatter(label, NumberFormatter(precision=0))
+            levels = [(label, frame.index.get_level_values(level)) for level, label in enumerate(index_columns)]
         else:
             index_label = index_columns[0] if index_columns else _format_index_label(frame.index.name)
-            if builder.has_formatter(index_label):
-                return
-            if pd_types.is_datetime64_any_dtype(frame.index):
-                builder.set_formatter(index_label, DateFormatter())
-            elif pd_types.is_numeric_dtype(frame.index):
-                builder.set_formatter(index_label, NumberFormatter(precision=0))
+            levels = [(index_label, frame.index)]
+        for label, level_values in levels:
+            if builder.has_formatter(label):
+                continue
+            formatter = _automatic_formatter(level_values.dtype, index=True)
+            if formatter is not None:
+                builder.set_formatter(label, formatter)
+
+
+def _automatic_formatter(dtype: Any, *, index: bool = False) -> Formatter | None:
+    """Return the built-in formatter for columns (or index levels) of ``dtype``."""
+
+    if pd_types.is_datetime64_any_dtype(dtype):
+        return DateFormatter()
+    if pd_types.is_timedelta64_dtype(dtype):
+        return DurationFormatter()
+    if isinstance(dtype, pd.PeriodDtype):
+        return PeriodFormatter()
+    if isinstance(dtype, pd.IntervalDtype) or (
+        # Bins from pandas.cut are categoricals of intervals.
+        isinstance(dtype, pd.CategoricalDtype) and isinstance(dtype.categories.dtype, pd.IntervalDtype)
+    ):
+        return IntervalFormatter()
+    if pd_types.is_numeric_dtype(dtype):
+        return NumberFormatter(precision=0) if index else NumberFormatter()
+    return None
 
 
 def _apply_column_layout(
@@ -349,6 +651,64 @@ def _apply_column_layout(
             raise TypeError("Column layout entries must be ColumnConfig or mapping")
 
 
+def _resolve_row_styles(
+    frame: pd.DataFrame,
+    predicates: Sequence[tuple[RowPredicate, RowStyle | None]],
+    *,
+    include_index: bool,
+) -> list[RowStyle | None]:
+    """Return the style of every row of ``frame``, first matching predicate first.
+
+    Row masks are evaluated once on the whole frame. Per-row callables are
+    only called for rows no earlier mask has claimed, with the same
+    ``(index, values)`` arguments and error handling as the table builder.
+    """
+
+    rows = len(frame)
+    chosen = np.full(rows, -1, dtype=np.intp)
+    per_row: list[tuple[int, Callable[[Any, Sequence[Any]], bool]]] = []
+    for number, (predicate, _) in enumerate(predicates):
+        if isinstance(predicate, (RowMask, str)):
+            mask = _row_mask(frame, predicate if isinstance(predicate, RowMask) else RowMask(predicate))
+            chosen[(chosen < 0) & mask] = number
+        else:
+            per_row.append((number, predicate))
+    if per_row:
+        index_levels = frame.index.nlevels if isinstance(frame.index, pd.MultiIndex) else 1
+        for position, (raw_index, *values) in enumerate(frame.itertuples(index=True, name=None)):
+            row_index = None
+            if include_index:
+                row_index = raw_index
+                index_values = [raw_index] if index_levels == 1 else list(raw_index)
+                values = [*index_values, *values]
+            for number, predicate in per_row:
+                if 0 <= chosen[position] < number:
+                    break
+                try:
+                    matched = predicate(row_index, values)
+                except Exception:  # pragma: no cover - defensive guard
+                    continue
+                if matched:
+                    chosen[position] = number
+                    break
+    styles = [style for _, style in predicates] + [None]
+    # Index -1 picks the trailing ``None`` for rows nothing matched.
+    return [styles[number] for number in chosen.tolist()]
+
+
+def _row_mask(frame: pd.DataFrame, row_mask: RowMask) -> np.ndarray:
+    condition = row_mask.condition
+    result = frame.eval(condition) if isinstance(condition, str) else condition(frame)
+    if isinstance(result, pd.Series):
+        if not result.index.equals(frame.index):
+            result = result.reindex(frame.index)
+        result = result.fillna(False)
+    mask = np.asarray(result, dtype=bool)
+    if mask.shape != (len(frame),):
+        raise ValueError("Row masks must produce one boolean per row")
+    return mask
+
+
 def _coerce_row_style(style: RowStyle | Mapping[str, str] | None) -> RowStyle | None:
     if style is None:
         return None
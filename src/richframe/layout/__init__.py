@@ -1,6 +1,13 @@
 """Layout configuration models for richframe."""
 from .column import ColumnConfig, ColumnLayout
-from .filtering import FilterConfig, SortConfig, coerce_filter_configs, coerce_sort_configs
+from .filtering import (
+    FilterConfig,
+    RowMask,
+    SortConfig,
+    coerce_filter_configs,
+    coerce_sort_configs,
+    filter_mask,
+)
 from .table import LayoutOptions
 
 __all__ = [
@@ -8,7 +15,9 @@ __all__ = [
     "ColumnLayout",
     "LayoutOptions",
     "FilterConfig",
+    "RowMask",
     "SortConfig",
     "coerce_filter_configs",
     "coerce_sort_configs",
+    "filter_mask",
 ]
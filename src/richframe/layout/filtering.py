@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, ClassVar, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Mapping, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
+    import pandas as pd
 
 AxisLiteral = str  # we normalise values internally
 
-__all__ = ["FilterConfig", "SortConfig", "coerce_filter_configs", "coerce_sort_configs"]
+__all__ = [
+    "FilterConfig",
+    "RowMask",
+    "SortConfig",
+    "coerce_filter_configs",
+    "coerce_sort_configs",
+    "filter_mask",
+]
 
 
 def _normalize_axis(axis: str | None) -> str:
@@ -161,6 +171,55 @@ class SortConfig:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class RowMask:
+    """Vectorized row condition for ``row_predicates``.
+
+    ``condition`` is either a :meth:`pandas.DataFrame.eval` expression such as
+    ``"price > 100 and status == 'late'"`` or a callable taking the filtered
+    DataFrame and returning a boolean mask with one entry per row. Plain
+    strings in ``row_predicates`` are treated as ``RowMask`` expressions.
+    """
+
+    condition: str | Callable[[Any], Any]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.condition, str) and not callable(self.condition):
+            raise TypeError("RowMask condition must be an expression string or a callable")
+
+
+def filter_mask(series: "pd.Series", config: FilterConfig) -> "pd.Series":
+    """Return the boolean mask of the values in ``series`` that pass ``config``.
+
+    ``contains`` matches the string form of the raw values; missing values
+    never match.
+    """
+
+    op = config.operator
+    value = config.value
+    if op == "contains":
+        mask = series.astype(str).str.contains(str(value), na=False)
+    elif op == "in":
+        mask = series.isin(config.value)
+    elif op == "between":
+        mask = series.between(config.value, config.upper, inclusive="both")
+    elif op == "eq":
+        mask = series.isna() if value is None else series.eq(value)
+    elif op == "ne":
+        mask = series.notna() if value is None else series.ne(value)
+    elif op == "gt":
+        mask = series.gt(value)
+    elif op == "ge":
+        mask = series.ge(value)
+    elif op == "lt":
+        mask = series.lt(value)
+    elif op == "le":
+        mask = series.le(value)
+    else:  # pragma: no cover - should be prevented by validation
+        raise ValueError(f"Unsupported operator '{config.operator}'")
+    return mask.fillna(False)
+
+
 def coerce_filter_configs(
     configs: Sequence[FilterConfig | Mapping[str, Any]],
 ) -> tuple[FilterConfig, ...]:
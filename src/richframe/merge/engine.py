@@ -5,16 +5,21 @@ from dataclasses import replace
 from typing import Sequence
 
 from ..core.model import Cell, Row, Table
+from ..core.stats import carry_stats
 
 __all__ = ["apply_merges"]
 
 
-def apply_merges(table: Table, *, index_columns: Sequence[str]) -> Table:
-    """Return a new table with header colspans and body rowspans applied."""
+def apply_merges(table: Table, *, index_columns: Sequence[str], span_rows: bool = True) -> Table:
+    """Return a new table with header colspans and body rowspans applied.
+
+    With ``span_rows=False`` index cells still become row headers but repeated
+    labels are not merged, so every body row keeps all of its cells.
+    """
 
     header_rows = _merge_header_rows(table.header_rows)
     header_rows, column_header_map = _assign_header_metadata(header_rows, table.columns)
-    body_rows, row_header_ids = _merge_index_columns(table.body_rows, index_columns)
+    body_rows, row_header_ids = _merge_index_columns(table.body_rows, index_columns, span_rows=span_rows)
     body_rows = _assign_body_headers(body_rows, column_header_map, row_header_ids)
     metadata = dict(table.metadata) if isinstance(table.metadata, dict) else {}
     return Table(
@@ -25,6 +30,7 @@ def apply_merges(table: Table, *, index_columns: Sequence[str]) -> Table:
         metadata=metadata,
         table_style=table.table_style,
         layout=table.layout,
+        stats=carry_stats(table, body_rows),
     )
 
 
@@ -85,6 +91,8 @@ def _assign_header_metadata(
 def _merge_index_columns(
     body_rows: Sequence[Row],
     index_columns: Sequence[str],
+    *,
+    span_rows: bool = True,
 ) -> tuple[tuple[Row, ...], list[list[str]]]:
     if not index_columns:
         return tuple(body_rows), [[] for _ in body_rows]
@@ -96,7 +104,7 @@ def _merge_index_columns(
     rowspan_overrides: list[dict[str, int]] = [dict() for _ in body_rows]
     hidden_cells: list[set[str]] = [set() for _ in body_rows]
 
-    for column_offset, column_id in enumerate(index_columns):
+    for column_offset, column_id in enumerate(index_columns if span_rows else ()):
         row_idx = 0
         while row_idx < len(body_rows):
             if column_id in hidden_cells[row_idx]:
@@ -0,0 +1,26 @@
+"""Worker pools shared by parallel formatting and rendering."""
+from __future__ import annotations
+
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+__all__ = ["create_executor", "gil_disabled"]
+
+
+def gil_disabled() -> bool:
+    """Return whether this interpreter runs without the GIL (free-threaded builds)."""
+
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return callable(is_gil_enabled) and not is_gil_enabled()
+
+
+def create_executor(workers: int) -> Executor:
+    """Return a pool of ``workers`` workers.
+
+    Threads run Python code in parallel on free-threaded builds and are used
+    there; otherwise the pool uses processes, so jobs must be picklable.
+    """
+
+    if gil_disabled():
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
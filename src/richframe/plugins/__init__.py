@@ -1,16 +1,22 @@
 """Plugin system and built-in plugins for richframe."""
-from .base import Plugin, PluginBase
+from .base import CellPlugin, Plugin, PluginBase
 from .color import ColorScalePlugin
+from .column import ColumnPlugin, ColumnResult, column_mapper
 from .databar import DataBarPlugin
-from .icon import IconSetPlugin, IconRule
+from .icon import IconBins, IconSetPlugin, IconRule
 from .rules import conditional_format
 
 __all__ = [
     "Plugin",
     "PluginBase",
+    "CellPlugin",
+    "ColumnPlugin",
+    "ColumnResult",
+    "column_mapper",
     "ColorScalePlugin",
     "DataBarPlugin",
     "IconSetPlugin",
     "IconRule",
+    "IconBins",
     "conditional_format",
 ]
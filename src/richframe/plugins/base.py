@@ -1,13 +1,26 @@
 """Core plugin definitions and helpers."""
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Callable, Iterable, Protocol, Sequence
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import Callable, Collection, Iterable, Protocol, Sequence
 
 from ..core.model import Cell, Row, Table
+from ..core.stats import carry_stats
 from ..style import CellStyle
 
-__all__ = ["Plugin", "PluginBase", "map_body_cells", "merge_cell_style"]
+__all__ = [
+    "CellMapper",
+    "CellPlugin",
+    "Plugin",
+    "PluginBase",
+    "dispatch_body_cells",
+    "map_body_cells",
+    "merge_cell_style",
+    "run_cell_plugins",
+]
+
+CellMapper = Callable[[Cell, int, int], Cell]
 
 
 class Plugin(Protocol):
@@ -30,7 +43,132 @@ class PluginBase:
         return table
 
 
-def map_body_cells(table: Table, mapper: Callable[[Cell, int, int], Cell]) -> Table:
+class CellPlugin(PluginBase, ABC):
+    """Base class for plugins that transform body cells one at a time.
+
+    :meth:`prepare` runs once per table and is where table-wide pre-scans
+    (such as a column's minimum and maximum) belong; it returns the per-cell
+    mapper, or ``None`` when there is nothing to do. Consecutive cell plugins
+    of the same ``stage`` are fused so that the body is traversed once and each
+    row is rebuilt at most once. Because of that, ``prepare`` sees the table as
+    it was before the fused group ran and should not rely on changes made by
+    earlier plugins in the group.
+
+    ``columns`` names the columns the mapper applies to. The pipeline resolves
+    them to cell positions once per row layout and only calls the mapper for
+    body cells at those positions; rows without such cells are passed through
+    untouched. ``None`` hands the mapper every cell of every body row.
+    """
+
+    stage: str = "before_render"
+    columns: tuple[str, ...] | None = None
+
+    @abstractmethod
+    def prepare(self, table: Table) -> CellMapper | None:
+        """Return the mapper for ``table``'s body cells, or ``None`` to skip it."""
+
+    def after_format(self, table: Table) -> Table:
+        if self.stage != "after_format":
+            return table
+        return run_cell_plugins(table, (self,))
+
+    def before_render(self, table: Table) -> Table:
+        if self.stage != "before_render":
+            return table
+        return run_cell_plugins(table, (self,))
+
+
+def run_cell_plugins(table: Table, plugins: Sequence[CellPlugin]) -> Table:
+    """Apply ``plugins`` to ``table`` in a single traversal of the body."""
+
+    targets: list[tuple[CellMapper, Collection[str] | None]] = []
+    for plugin in plugins:
+        mapper = plugin.prepare(table)
+        if mapper is None:
+            continue
+        columns = plugin.columns
+        targets.append((mapper, None if columns is None else frozenset(columns)))
+    if not targets:
+        return table
+    return dispatch_body_cells(table, targets)
+
+
+def dispatch_body_cells(
+    table: Table,
+    targets: Sequence[tuple[CellMapper, Collection[str] | None]],
+) -> Table:
+    """Apply each mapper in ``targets`` to the body cells of its columns.
+
+    A target's columns of ``None`` selects every cell. Mappers that share a cell
+    run in order, each receiving the previous one's result.
+    """
+
+    plans: dict[int, _RowPlan] = {}
+    updated_rows: list[Row] = []
+    changed = False
+    for row_index, row in enumerate(table.body_rows):
+        cells = row.cells
+        plan = plans.get(len(cells))
+        if plan is None or not plan.matches(cells):
+            plan = plans[len(cells)] = _RowPlan.resolve(cells, targets)
+        new_cells: list[Cell] | None = None
+        for position, mappers in plan.steps:
+            cell = cells[position]
+            updated = cell
+            for mapper in mappers:
+                updated = mapper(updated, row_index, position)
+            if updated is not cell:
+                if new_cells is None:
+                    new_cells = list(cells)
+                new_cells[position] = updated
+        if new_cells is None:
+            updated_rows.append(row)
+        else:
+            changed = True
+            updated_rows.append(replace(row, cells=tuple(new_cells)))
+    if not changed:
+        return table
+    body_rows = tuple(updated_rows)
+    return replace(table, body_rows=body_rows, stats=carry_stats(table, body_rows))
+
+
+@dataclass(frozen=True, slots=True)
+class _RowPlan:
+    """Cell positions a group of mappers applies to, for one row layout."""
+
+    signature: tuple[tuple[int, str | None, str], ...]
+    steps: tuple[tuple[int, tuple[CellMapper, ...]], ...]
+
+    @classmethod
+    def resolve(
+        cls,
+        cells: Sequence[Cell],
+        targets: Sequence[tuple[CellMapper, Collection[str] | None]],
+    ) -> "_RowPlan":
+        signature: list[tuple[int, str | None, str]] = []
+        steps: list[tuple[int, tuple[CellMapper, ...]]] = []
+        for position, cell in enumerate(cells):
+            mappers = tuple(
+                mapper
+                for mapper, columns in targets
+                if columns is None or (cell.kind == "body" and cell.column_id in columns)
+            )
+            if mappers:
+                signature.append((position, cell.column_id, cell.kind))
+                steps.append((position, mappers))
+        return cls(tuple(signature), tuple(steps))
+
+    def matches(self, cells: Sequence[Cell]) -> bool:
+        # Rows of the same width almost always share a layout, so checking the
+        # targeted positions is enough to reuse the plan.
+        for position, column_id, kind in self.signature:
+            cell = cells[position]
+            if cell.column_id != column_id or cell.kind != kind:
+                return False
+        return True
+
+
+def map_body_cells(table: Table, mapper: CellMapper) -> Table:
     """Apply ``mapper`` to every body cell in ``table``."""
 
     updated_rows: list[Row] = []
@@ -50,7 +188,8 @@ def map_body_cells(table: Table, mapper: Callable[[Cell, int, int], Cell]) -> Ta
             updated_rows.append(row)
     if not changed:
         return table
-    return replace(table, body_rows=tuple(updated_rows))
+    body_rows = tuple(updated_rows)
+    return replace(table, body_rows=body_rows, stats=carry_stats(table, body_rows))
 
 
 def merge_cell_style(cell: Cell, style: CellStyle | dict[str, str]) -> Cell:
@@ -1,85 +1,100 @@
 """Color scale plugin implementations."""
 from __future__ import annotations
 
-from dataclasses import replace
-from typing import Iterable, Sequence
+from typing import Sequence
 
-from ..core.model import Cell, Table
-from ..style import CellStyle
-from .base import PluginBase, map_body_cells, merge_cell_style
+import numpy as np
+
+from ..core.model import Table
+from ..core.stats import numeric_array, table_stats
+from .base import CellMapper, CellPlugin
+from .column import ColumnResult, column_mapper
 
 __all__ = ["ColorScalePlugin"]
 
 
-class ColorScalePlugin(PluginBase):
-    """Apply a background color scale to numeric columns."""
+class ColorScalePlugin(CellPlugin):
+    """Apply a background color scale to numeric columns.
+
+    ``palette`` lists two or more colors spread evenly over the range of the
+    values. With ``steps`` the range is split into that many buckets that each
+    get one color, so the number of distinct cell styles (and stylesheet
+    rules) is bounded by ``steps`` rather than by the number of values.
+    """
 
     def __init__(
         self,
         columns: str | Sequence[str],
         *,
-        palette: tuple[str, str] = ("#f1f5f9", "#1d4ed8"),
+        palette: Sequence[str] = ("#f1f5f9", "#1d4ed8"),
+        steps: int | None = None,
         text_contrast: bool = True,
         null_color: str | None = "#f8fafc",
     ) -> None:
-        self._columns = tuple(columns) if isinstance(columns, Sequence) and not isinstance(columns, str) else (columns,)
-        self._start_color = palette[0]
-        self._end_color = palette[1]
+        self.columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        if len(palette) < 2:
+            raise ValueError("palette must contain at least two colors")
+        if steps is not None and steps < 2:
+            raise ValueError("steps must be at least 2")
+        self._stops = np.array([_parse_hex(color) for color in palette], dtype=np.float64)
+        self._steps = steps
         self._text_contrast = text_contrast
         self._null_color = null_color
-
-    def before_render(self, table: Table) -> Table:
-        numeric_values = _collect_numeric_values(table, self._columns)
-        if not numeric_values:
-            return table
-        minimum = min(numeric_values)
-        maximum = max(numeric_values)
+        # The lookup table only depends on the palette, so build it once.
+        self._lut = _interpolate_rgb(self._stops, np.linspace(0.0, 1.0, steps)) if steps else None
+
+    def prepare(self, table: Table) -> CellMapper | None:
+        stats = table_stats(table).combined(self.columns)
+        if not stats.count:
+            return None
+        # Infinite values take the end colors and do not stretch the range.
+        finite = stats.values[np.isfinite(stats.values)]
+        minimum = float(finite[0]) if len(finite) else 0.0
+        maximum = float(finite[-1]) if len(finite) else 0.0
         if minimum == maximum:
             maximum = minimum + 1.0
 
-        def apply_scale(cell: Cell, _row: int, _column: int) -> Cell:
-            if cell.column_id not in self._columns or cell.kind != "body":
-                return cell
-            value = _coerce_float(cell.value)
-            if value is None:
-                if self._null_color is None:
-                    return cell
-                return merge_cell_style(cell, {"background-color": self._null_color})
-            fraction = (value - minimum) / (maximum - minimum)
-            background = _interpolate_hex(self._start_color, self._end_color, fraction)
-            updated = merge_cell_style(cell, {"background-color": background})
-            if not self._text_contrast:
-                return updated
-            if _relative_luminance(background) < 0.4:
-                return merge_cell_style(updated, {"color": "#f8fafc"})
-            return updated
-
-        return map_body_cells(table, apply_scale)
-
-
-def _collect_numeric_values(table: Table, columns: Iterable[str]) -> list[float]:
-    targets = set(columns)
-    values: list[float] = []
-    for row in table.body_rows:
-        for cell in row.cells:
-            if cell.kind != "body" or cell.column_id not in targets:
-                continue
-            numeric = _coerce_float(cell.value)
-            if numeric is not None:
-                values.append(numeric)
-    return values
-
-
-def _coerce_float(value: object) -> float | None:
-    if value is None:
-        return None
-    try:
-        numeric = float(value)
-    except (TypeError, ValueError):
-        return None
-    if numeric != numeric:  # NaN check
-        return None
-    return numeric
+        def scale(_column_id: str, values: np.ndarray, _valid: np.ndarray) -> ColumnResult:
+            return self._scale(numeric_array(values), minimum, maximum)
+
+        return column_mapper(table, self.columns, scale)
+
+    def _scale(self, numeric: np.ndarray, minimum: float, maximum: float) -> ColumnResult:
+        present = ~np.isnan(numeric)
+        fractions = (numeric[present] - minimum) / (maximum - minimum)
+        fractions = np.clip(np.nan_to_num(fractions, nan=0.0, posinf=1.0, neginf=0.0), 0.0, 1.0)
+        if self._lut is not None:
+            buckets = np.minimum((fractions * self._steps).astype(np.intp), self._steps - 1)
+            colors = self._lut
+        else:
+            # Every distinct color becomes one style.
+            rgb = _interpolate_rgb(self._stops, fractions)
+            packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+            unique, buckets = np.unique(packed, return_inverse=True)
+            colors = np.stack([(unique >> 16) & 0xFF, (unique >> 8) & 0xFF, unique & 0xFF], axis=1)
+        styles = [self._style(_format_hex(tuple(color))) for color in colors.tolist()]
+        style_ids = np.full(len(numeric), -1, dtype=np.intp)
+        style_ids[present] = buckets
+        if self._null_color is not None:
+            style_ids[~present] = len(styles)
+            styles.append({"background-color": self._null_color})
+        return ColumnResult(style_ids=style_ids, styles=styles)
+
+    def _style(self, background: str) -> dict[str, str]:
+        style = {"background-color": background}
+        if self._text_contrast and _relative_luminance(background) < 0.4:
+            style["color"] = "#f8fafc"
+        return style
+
+
+def _interpolate_rgb(stops: np.ndarray, fractions: np.ndarray) -> np.ndarray:
+    """Return rounded RGB rows for ``fractions`` along the evenly spaced ``stops``."""
+
+    position = fractions * (len(stops) - 1)
+    segment = np.minimum(position.astype(np.intp), len(stops) - 2)
+    local = (position - segment)[:, None]
+    rgb = stops[segment] + (stops[segment + 1] - stops[segment]) * local
+    return np.clip(np.round(rgb), 0, 255).astype(np.int64)
 
 
 def _parse_hex(color: str) -> tuple[int, int, int]:
@@ -102,18 +117,6 @@ def _format_hex(rgb: tuple[float, float, float]) -> str:
     )
 
 
-def _interpolate_hex(start: str, end: str, fraction: float) -> str:
-    fraction = max(0.0, min(1.0, fraction))
-    sr, sg, sb = _parse_hex(start)
-    er, eg, eb = _parse_hex(end)
-    rgb = (
-        sr + (er - sr) * fraction,
-        sg + (eg - sg) * fraction,
-        sb + (eb - sb) * fraction,
-    )
-    return _format_hex(rgb)
-
-
 def _relative_luminance(color: str) -> float:
     r, g, b = _parse_hex(color)
     return 0.2126 * (r / 255.0) + 0.7152 * (g / 255.0) + 0.0722 * (b / 255.0)
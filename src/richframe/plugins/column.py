@@ -0,0 +1,119 @@
+"""Vectorized plugins operating on whole columns."""
+from __future__ import annotations
+
+from abc import abstractmethod
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..core.model import Cell, Table
+from ..core.stats import aligned_stats
+from ..style import CellStyle
+from .base import CellMapper, CellPlugin, merge_cell_style
+
+__all__ = ["ColumnPlugin", "ColumnResult", "column_mapper"]
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnResult:
+    """Per-row output of a :class:`ColumnPlugin` for one column.
+
+    ``style_ids`` holds, for every body row, an index into ``styles`` or ``-1``
+    to leave the cell's style alone. ``text`` holds replacement cell texts,
+    with ``None`` for rows whose text is kept. Either array may be omitted.
+    """
+
+    style_ids: Any = None
+    styles: Sequence[CellStyle | Mapping[str, str]] = ()
+    text: Any = None
+
+
+class ColumnPlugin(CellPlugin):
+    """Base class for plugins that style whole columns with NumPy.
+
+    Subclasses implement :meth:`transform`, which receives a column's raw
+    values as an array (see :meth:`~richframe.core.TableStats.array`) and a
+    boolean mask of the rows holding a value, and returns a
+    :class:`ColumnResult`. The results are applied to the cells in bulk: each
+    distinct combination of existing style and style id is merged once.
+    """
+
+    def __init__(self, columns: str | Sequence[str]) -> None:
+        self.columns = (columns,) if isinstance(columns, str) else tuple(columns)
+
+    @abstractmethod
+    def transform(self, column_id: str, values: np.ndarray, valid: np.ndarray) -> ColumnResult | None:
+        """Return the styles and texts for one column, or ``None`` to leave it unchanged."""
+
+    def prepare(self, table: Table) -> CellMapper | None:
+        return column_mapper(table, self.columns, self.transform)
+
+
+def column_mapper(
+    table: Table,
+    columns: Sequence[str],
+    transform: Callable[[str, np.ndarray, np.ndarray], ColumnResult | None],
+) -> CellMapper | None:
+    """Run ``transform`` over ``columns`` and return a mapper applying the results.
+
+    This is what :meth:`ColumnPlugin.prepare` does with :meth:`ColumnPlugin.transform`;
+    plugins that compute settings per table pass a closure instead.
+    """
+
+    stats = aligned_stats(table, columns)
+    rows = len(table.body_rows)
+    results: dict[str, tuple[list[int] | None, tuple[CellStyle, ...], list[Any] | None]] = {}
+    for column_id in columns:
+        values = stats.array(column_id)
+        result = transform(column_id, values, ~np.asarray(pd.isna(values), dtype=bool))
+        if result is None:
+            continue
+        styles = tuple(_coerce_style(style) for style in result.styles)
+        style_ids = _row_list(result.style_ids, rows, "style_ids")
+        if style_ids is not None and rows and max(style_ids) >= len(styles):
+            raise ValueError("ColumnResult.style_ids refers to a style that is not in styles")
+        results[column_id] = (style_ids, styles, _row_list(result.text, rows, "text"))
+    if not results:
+        return None
+    merged: dict[tuple[str | None, CellStyle | None, int], CellStyle | None] = {}
+
+    def apply(cell: Cell, row_index: int, _column: int) -> Cell:
+        entry = results.get(cell.column_id)  # type: ignore[arg-type]
+        if entry is None:
+            return cell
+        style_ids, styles, texts = entry
+        updated = cell
+        if style_ids is not None:
+            style_id = style_ids[row_index]
+            if style_id >= 0:
+                key = (cell.column_id, cell.style, style_id)
+                if key not in merged:
+                    merged[key] = merge_cell_style(cell, styles[style_id]).style
+                style = merged[key]
+                if style is not cell.style:
+                    updated = replace(updated, style=style)
+        if texts is not None:
+            text = texts[row_index]
+            if text is not None and text != updated.text:
+                updated = replace(updated, text=str(text))
+        return updated
+
+    return apply
+
+
+def _row_list(values: Any, rows: int, name: str) -> list[Any] | None:
+    if values is None:
+        return None
+    array = np.asarray(values)
+    if array.shape != (rows,):
+        raise ValueError(f"ColumnResult.{name} must have one entry per body row ({rows}), got shape {array.shape}")
+    # Plain lists index much faster than arrays from Python code.
+    return array.tolist()
+
+
+def _coerce_style(style: CellStyle | Mapping[str, str]) -> CellStyle:
+    if isinstance(style, CellStyle):
+        return style
+    return CellStyle(dict(style))
@@ -1,17 +1,28 @@
 """In-cell bar visualisations."""
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from dataclasses import replace
+from typing import Sequence
 
 from ..core.model import Cell, Table
-from .base import PluginBase, map_body_cells, merge_cell_style
-from .color import _coerce_float
+from ..core.stats import table_stats
+from ..style import CellStyle
+from .base import CellMapper, CellPlugin, merge_cell_style
 
-__all__ = ["DataBarPlugin"]
+__all__ = ["BAR_VARIABLE", "DataBarPlugin"]
 
+BAR_VARIABLE = "--rf-bar"
 
-class DataBarPlugin(PluginBase):
-    """Render horizontal bars inside numeric cells."""
+
+class DataBarPlugin(CellPlugin):
+    """Render horizontal bars inside numeric cells.
+
+    In the default ``"gradient"`` mode every cell gets its own
+    ``linear-gradient`` background, so every cell has a distinct style. With
+    ``mode="variable"`` the gradient, axis and colors form one shared style and
+    each cell only sets the bar length through the ``--rf-bar`` CSS custom
+    property, keeping the stylesheet at one rule per column.
+    """
 
     def __init__(
         self,
@@ -20,64 +31,77 @@ class DataBarPlugin(PluginBase):
         bar_color: str = "#2563eb",
         base_color: str = "rgba(148, 163, 184, 0.16)",
         axis_color: str | None = "rgba(148, 163, 184, 0.8)",
+        mode: str = "gradient",
     ) -> None:
-        self._columns = tuple(columns) if isinstance(columns, Sequence) and not isinstance(columns, str) else (columns,)
+        if mode not in {"gradient", "variable"}:
+            raise ValueError("mode must be 'gradient' or 'variable'")
+        self.columns = tuple(columns) if isinstance(columns, Sequence) and not isinstance(columns, str) else (columns,)
         self._bar_color = bar_color
         self._base_color = base_color
         self._axis_color = axis_color
+        self._mode = mode
 
-    def before_render(self, table: Table) -> Table:
-        numeric_values = _collect_numeric_values(table, self._columns)
-        if not numeric_values:
-            return table
-        minimum = min(numeric_values)
-        maximum = max(numeric_values)
+    def prepare(self, table: Table) -> CellMapper | None:
+        stats = table_stats(table).combined(self.columns)
+        if not stats.count:
+            return None
+        minimum = stats.minimum
+        maximum = stats.maximum
         span = maximum - minimum or 1.0
         baseline = 0.0
         if minimum > 0:
             baseline = minimum
         elif maximum < 0:
             baseline = maximum
+        bar_style = {
+            "background-size": "100% 100%",
+            "background-repeat": "no-repeat",
+            "font-variant-numeric": "tabular-nums",
+        }
+        if self._axis_color is not None and baseline > minimum:
+            position = (baseline - minimum) / span * 100.0
+            bar_style["box-shadow"] = f"inset {position:.2f}% 0 0 0 {self._axis_color}"
+        if self._mode == "variable":
+            bar_style["background-image"] = (
+                f"linear-gradient(90deg, {self._bar_color} var({BAR_VARIABLE}), "
+                f"{self._base_color} var({BAR_VARIABLE}))"
+            )
+        # Cells sharing a style share the merged result as well.
+        merged: dict[CellStyle | None, Cell] = {}
 
         def decorate(cell: Cell, _row: int, _column: int) -> Cell:
-            if cell.column_id not in self._columns or cell.kind != "body":
-                return cell
             numeric = _coerce_float(cell.value)
             if numeric is None:
                 return cell
             fraction = (numeric - minimum) / span
-            width = max(0.0, min(1.0, fraction)) * 100.0
-            background = (
-                f"linear-gradient(90deg, {self._bar_color} {width:.2f}%, {self._base_color} {width:.2f}%)"
-            )
-            updated = merge_cell_style(
-                cell,
-                {
-                    "background-image": background,
-                    "background-size": "100% 100%",
-                    "background-repeat": "no-repeat",
-                    "font-variant-numeric": "tabular-nums",
-                },
-            )
-            if self._axis_color is not None and baseline > minimum:
-                position = (baseline - minimum) / span * 100.0
-                axis_style = {
-                    "box-shadow": f"inset {position:.2f}% 0 0 0 {self._axis_color}",
-                }
-                updated = merge_cell_style(updated, axis_style)
-            return updated
+            width = f"{max(0.0, min(1.0, fraction)) * 100.0:.2f}%"
+            if self._mode == "variable":
+                template = merged.get(cell.style)
+                if template is None:
+                    template = merged[cell.style] = merge_cell_style(cell, bar_style)
+                return replace(cell, style=template.style, variables=_set_variable(cell.variables, width))
+            background = f"linear-gradient(90deg, {self._bar_color} {width}, {self._base_color} {width})"
+            return merge_cell_style(cell, {"background-image": background, **bar_style})
 
-        return map_body_cells(table, decorate)
+        return decorate
 
 
-def _collect_numeric_values(table: Table, columns: Iterable[str]) -> list[float]:
-    targets = set(columns)
-    values: list[float] = []
-    for row in table.body_rows:
-        for cell in row.cells:
-            if cell.kind != "body" or cell.column_id not in targets:
-                continue
-            numeric = _coerce_float(cell.value)
-            if numeric is not None:
-                values.append(numeric)
-    return values
+def _set_variable(
+    variables: tuple[tuple[str, str], ...] | None,
+    width: str,
+) -> tuple[tuple[str, str], ...]:
+    if not variables:
+        return ((BAR_VARIABLE, width),)
+    return tuple((name, value) for name, value in variables if name != BAR_VARIABLE) + ((BAR_VARIABLE, width),)
+
+
+def _coerce_float(value: object) -> float | None:
+    if value is None:
+        return None
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return None
+    if numeric != numeric:  # NaN check
+        return None
+    return numeric
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Callable, Iterable, Sequence
+from typing import Callable, Iterable, Mapping, Sequence
+
+import numpy as np
 
 from ..core.model import Cell, Table
+from ..core.stats import numeric_array, aligned_stats
 from ..style import CellStyle
-from .base import PluginBase, map_body_cells, merge_cell_style
+from .base import CellMapper, CellPlugin, merge_cell_style
 
-__all__ = ["IconRule", "IconSetPlugin"]
+__all__ = ["IconBins", "IconRule", "IconSetPlugin"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,31 +23,74 @@ class IconRule:
     style: CellStyle | dict[str, str] | None = None
 
 
-class IconSetPlugin(PluginBase):
-    """Prefix or suffix cell text with icons based on rule matches."""
+@dataclass(frozen=True, slots=True)
+class IconBins:
+    """Numeric thresholds splitting a column into icon buckets.
+
+    ``edges`` are increasing bin edges and ``icons`` has one more entry than
+    ``edges``: values below ``edges[0]`` get ``icons[0]``, values from
+    ``edges[i - 1]`` up to ``edges[i]`` get ``icons[i]``, and values at or above
+    the last edge get ``icons[-1]``. With ``right=True`` each edge belongs to
+    the bucket below it instead. ``styles`` optionally pairs a style with each
+    icon. Missing and non-numeric values get no icon.
+    """
+
+    edges: Sequence[float]
+    icons: Sequence[str]
+    styles: Sequence[CellStyle | Mapping[str, str] | None] | None = None
+    right: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "edges", tuple(float(edge) for edge in self.edges))
+        object.__setattr__(self, "icons", tuple(self.icons))
+        if not self.edges or any(b <= a for a, b in zip(self.edges, self.edges[1:])):
+            raise ValueError("edges must be a non-empty, strictly increasing sequence")
+        if len(self.icons) != len(self.edges) + 1:
+            raise ValueError("icons must have exactly one more entry than edges")
+        if self.styles is not None:
+            object.__setattr__(self, "styles", tuple(self.styles))
+            if len(self.styles) != len(self.icons):
+                raise ValueError("styles must have one entry per icon")
+
+    def buckets(self, values: np.ndarray) -> np.ndarray:
+        """Return the bucket of every value, or ``-1`` where there is no number."""
+
+        numeric = numeric_array(values)
+        buckets = np.digitize(numeric, self.edges, right=self.right)
+        return np.where(np.isnan(numeric), -1, buckets)
+
+
+class IconSetPlugin(CellPlugin):
+    """Prefix or suffix cell text with icons based on rule matches.
+
+    ``rules`` is either a sequence of :class:`IconRule` predicates, tried in
+    order for each cell, or an :class:`IconBins` threshold spec that assigns
+    icons to the whole column at once.
+    """
 
     def __init__(
         self,
         columns: str | Sequence[str],
-        rules: Iterable[IconRule],
+        rules: Iterable[IconRule] | IconBins,
         *,
         position: str = "prefix",
         separator: str = " ",
     ) -> None:
-        self._columns = tuple(columns) if isinstance(columns, Sequence) and not isinstance(columns, str) else (columns,)
-        self._rules = tuple(rules)
+        self.columns = tuple(columns) if isinstance(columns, Sequence) and not isinstance(columns, str) else (columns,)
+        self._bins = rules if isinstance(rules, IconBins) else None
+        self._rules = () if self._bins is not None else tuple(rules)
         if position not in {"prefix", "suffix"}:
             raise ValueError("position must be 'prefix' or 'suffix'")
         self._position = position
         self._separator = separator
 
-    def before_render(self, table: Table) -> Table:
+    def prepare(self, table: Table) -> CellMapper | None:
+        if self._bins is not None:
+            return self._prepare_bins(table, self._bins)
         if not self._rules:
-            return table
+            return None
 
         def decorate(cell: Cell, _row: int, _column: int) -> Cell:
-            if cell.column_id not in self._columns or cell.kind != "body":
-                return cell
             for rule in self._rules:
                 try:
                     matched = rule.predicate(cell.value)
@@ -55,20 +101,42 @@ class IconSetPlugin(PluginBase):
                 icon = rule.icon
                 if not icon:
                     continue
-                if self._position == "prefix":
-                    if cell.text.startswith(icon):
-                        updated_text = cell.text
-                    else:
-                        updated_text = f"{icon}{self._separator}{cell.text}".strip()
-                else:
-                    if cell.text.endswith(icon):
-                        updated_text = cell.text
-                    else:
-                        updated_text = f"{cell.text}{self._separator}{icon}".strip()
-                updated = replace(cell, text=updated_text)
+                updated = replace(cell, text=self._decorate_text(cell.text, icon))
                 if rule.style:
                     updated = merge_cell_style(updated, rule.style)
                 return updated
             return cell
 
-        return map_body_cells(table, decorate)
+        return decorate
+
+    def _prepare_bins(self, table: Table, bins: IconBins) -> CellMapper | None:
+        stats = aligned_stats(table, self.columns)
+        buckets: dict[str, list[int]] = {}
+        for column_id in self.columns:
+            buckets[column_id] = bins.buckets(stats.array(column_id)).tolist()
+        if not buckets:
+            return None
+        styles = bins.styles or (None,) * len(bins.icons)
+        merged: dict[tuple[CellStyle | None, int], CellStyle | None] = {}
+
+        def decorate(cell: Cell, row_index: int, _column: int) -> Cell:
+            column_buckets = buckets.get(cell.column_id)  # type: ignore[arg-type]
+            if column_buckets is None:
+                return cell
+            bucket = column_buckets[row_index]
+            if bucket < 0 or not bins.icons[bucket]:
+                return cell
+            style = cell.style
+            if styles[bucket]:
+                key = (cell.style, bucket)
+                if key not in merged:
+                    merged[key] = merge_cell_style(cell, styles[bucket]).style
+                style = merged[key]
+            return replace(cell, text=self._decorate_text(cell.text, bins.icons[bucket]), style=style)
+
+        return decorate
+
+    def _decorate_text(self, text: str, icon: str) -> str:
+        if self._position == "prefix":
+            return text if text.startswith(icon) else f"{icon}{self._separator}{text}".strip()
+        return text if text.endswith(icon) else f"{text}{self._separator}{icon}".strip()
@@ -1,18 +1,36 @@
 """Rule-based conditional styling."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
 
 from ..core.model import Cell, Table
+from ..core.stats import aligned_stats
+from ..layout import FilterConfig, filter_mask
 from ..style import CellStyle
-from .base import PluginBase, map_body_cells, merge_cell_style
+from .base import CellMapper, CellPlugin, merge_cell_style
 
 __all__ = ["conditional_format"]
 
 
-class ConditionalFormatPlugin(PluginBase):
-    """Fluent rule builder that maps predicates onto styles."""
+class ConditionalFormatPlugin(CellPlugin):
+    """Fluent rule builder that maps predicates onto styles.
+
+    A rule's condition is one of:
+
+    ``predicate``
+        Called with each cell value; exceptions count as no match.
+    ``mask``
+        Called once per column with the source values as a
+        :class:`pandas.Series` and returns a boolean mask of matching rows.
+    ``op``
+        A :class:`~richframe.layout.FilterConfig` operator (``"gt"``,
+        ``"between"``, ``"in"``, ...) compared against ``value`` (and
+        ``upper``), evaluated once per column like ``mask``.
+    """
 
     def __init__(self) -> None:
         self._rules: list[_Rule] = []
@@ -21,34 +39,89 @@ class ConditionalFormatPlugin(PluginBase):
         self,
         *,
         column: str | Sequence[str] | None = None,
-        predicate: Callable[[object], bool],
+        predicate: Callable[[object], bool] | None = None,
+        mask: Callable[[pd.Series], Any] | None = None,
+        op: str | None = None,
+        value: Any = None,
+        upper: Any = None,
     ) -> "_RuleBuilder":
-        if predicate is None:
-            raise ValueError("predicate must be provided")
+        if sum(condition is not None for condition in (predicate, mask, op)) != 1:
+            raise ValueError("exactly one of predicate, mask or op must be provided")
         columns = _normalise_columns(column)
-        return _RuleBuilder(self, columns, predicate)
-
-    def before_render(self, table: Table) -> Table:
+        condition: _Condition
+        if op is not None:
+            config = FilterConfig(key=columns[0] if columns else "*", operator=op, value=value, upper=upper)
+            condition = _Condition(mask=lambda series: filter_mask(series, config))
+        elif mask is not None:
+            condition = _Condition(mask=mask)
+        else:
+            condition = _Condition(predicate=predicate)
+        return _RuleBuilder(self, columns, condition)
+
+    @property
+    def columns(self) -> tuple[str, ...] | None:  # type: ignore[override]
+        """Columns targeted by any rule, or ``None`` when a rule targets all."""
+
+        targets: dict[str, None] = {}
+        for rule in self._rules:
+            if rule.columns is None:
+                return None
+            targets.update(dict.fromkeys(rule.columns))
+        return tuple(targets)
+
+    def prepare(self, table: Table) -> CellMapper | None:
         if not self._rules:
-            return table
+            return None
+        masks = self._evaluate_masks(table)
+        # Cells that share a style and match the same rule share the result.
+        merged: dict[tuple[CellStyle | None, int], CellStyle | None] = {}
 
-        def apply_rules(cell: Cell, _row: int, _column: int) -> Cell:
+        def apply_rules(cell: Cell, row_index: int, _column: int) -> Cell:
             if cell.kind != "body":
                 return cell
-            updated = cell
-            for rule in self._rules:
+            style = cell.style
+            for number, rule in enumerate(self._rules):
                 if rule.columns and (cell.column_id not in rule.columns):
                     continue
-                try:
-                    matched = rule.predicate(cell.value)
-                except Exception:  # pragma: no cover - defensive
-                    matched = False
+                if rule.condition.predicate is not None:
+                    try:
+                        matched = rule.condition.predicate(cell.value)
+                    except Exception:  # pragma: no cover - defensive
+                        matched = False
+                else:
+                    column_mask = masks.get((number, cell.column_id))
+                    matched = column_mask is not None and column_mask[row_index]
                 if not matched:
                     continue
-                updated = merge_cell_style(updated, rule.style)
-            return updated
-
-        return map_body_cells(table, apply_rules)
+                key = (style, number)
+                if key not in merged:
+                    merged[key] = merge_cell_style(replace(cell, style=style), rule.style).style
+                style = merged[key]
+            if style is cell.style:
+                return cell
+            return replace(cell, style=style)
+
+        return apply_rules
+
+    def _evaluate_masks(self, table: Table) -> dict[tuple[int, str], list[bool]]:
+        rows = len(table.body_rows)
+        targets = [rule.columns or table.columns for rule in self._rules if rule.condition.mask is not None]
+        stats = aligned_stats(table, dict.fromkeys(column_id for columns in targets for column_id in columns))
+        masks: dict[tuple[int, str], list[bool]] = {}
+        for number, rule in enumerate(self._rules):
+            mask = rule.condition.mask
+            if mask is None:
+                continue
+            for column_id in rule.columns or table.columns:
+                series = stats.series(column_id)
+                result = mask(series)
+                if isinstance(result, pd.Series):
+                    result = result.fillna(False)
+                values = np.asarray(result, dtype=bool)
+                if values.shape != (rows,):
+                    raise ValueError(f"Rule mask for column '{column_id}' must return one boolean per row")
+                masks[(number, column_id)] = values.tolist()
+        return masks
 
 
 def conditional_format() -> ConditionalFormatPlugin:
@@ -57,10 +130,16 @@ def conditional_format() -> ConditionalFormatPlugin:
     return ConditionalFormatPlugin()
 
 
+@dataclass(frozen=True, slots=True)
+class _Condition:
+    predicate: Callable[[object], bool] | None = None
+    mask: Callable[[pd.Series], Any] | None = None
+
+
 @dataclass(slots=True)
 class _Rule:
     columns: tuple[str, ...] | None
-    predicate: Callable[[object], bool]
+    condition: _Condition
     style: CellStyle | dict[str, str]
 
 
@@ -69,11 +148,11 @@ class _RuleBuilder:
         self,
         plugin: ConditionalFormatPlugin,
         columns: tuple[str, ...] | None,
-        predicate: Callable[[object], bool],
+        condition: _Condition,
     ) -> None:
         self._plugin = plugin
         self._columns = columns
-        self._predicate = predicate
+        self._condition = condition
 
     def style(
         self,
@@ -83,7 +162,7 @@ class _RuleBuilder:
         if style is None and not properties:
             raise ValueError("style or keyword properties must be provided")
         resolved = _coerce_style(style, properties)
-        self._plugin._rules.append(_Rule(self._columns, self._predicate, resolved))
+        self._plugin._rules.append(_Rule(self._columns, self._condition, resolved))
         return self._plugin
 
 
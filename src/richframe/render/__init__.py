@@ -1,4 +1,14 @@
 """Rendering utilities."""
 from .html_renderer import HTMLRenderer
+from .patches import Patch, TableDiff, diff_tables, patches_to_json
+from .runtime import runtime_filename, write_runtime
 
-__all__ = ["HTMLRenderer"]
+__all__ = [
+    "HTMLRenderer",
+    "Patch",
+    "TableDiff",
+    "diff_tables",
+    "patches_to_json",
+    "runtime_filename",
+    "write_runtime",
+]
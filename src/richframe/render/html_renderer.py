@@ -1,18 +1,29 @@
 """HTML rendering for richframe tables."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import numbers
+import sys
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import uuid
 from importlib import resources
-from typing import Iterable, Mapping, Sequence
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
 from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup, escape
 
 from ..core.model import Cell, Row, Table
 from ..layout import ColumnConfig, LayoutOptions
+from ..parallel import create_executor
 from ..style import StyleRegistry
+from ..style.model import BaseStyle
+from ..style.registry import StyleDefinition
+from .runtime import RUNTIME_MODES, runtime_filename, runtime_source
 
-__all__ = ["HTMLRenderer"]
+__all__ = ["HTMLRenderer", "needs_runtime", "worker_renderer"]
 
 _BASE_STYLES = """\
 .richframe-container {
@@ -42,7 +53,12 @@ _BASE_STYLES = """\
 _CONTAINER_STYLE = (
     "max-width: 100%; overflow-x: auto; -webkit-overflow-scrolling: touch; position: relative;"
 )
+_VIRTUAL_CONTAINER_STYLE = f"{_CONTAINER_STYLE} max-height: 600px; overflow-y: auto;"
 _DEFAULT_STICKY_WIDTH = 120.0
+_BODY_TEMPLATE = "table_body.html.j2"
+# Below this many body rows per worker the pool start-up cost outweighs the gain.
+_MIN_ROWS_PER_WORKER = 2048
+_DIGEST_CACHE_LIMIT = 65536
 
 
 @dataclass(slots=True)
@@ -56,6 +72,8 @@ class RenderedCell:
     scope_attr: str | None
     headers_attr: str | None
     id_attr: str | None
+    column_attr: str | None = None
+    sort_key: str | None = None
 
 
 @dataclass(slots=True)
@@ -63,6 +81,7 @@ class RenderedRow:
     cells: tuple[RenderedCell, ...]
     class_attr: str
     style_attr: str | None
+    key_attr: str | None = None
 
 
 @dataclass(slots=True)
@@ -79,7 +98,25 @@ class RenderedTable:
     sorts: tuple[dict[str, object], ...] | None
     interactive_controls: bool
     resizable_columns: bool
+    live_updates: bool
     container_id: str
+    body_html: Markup
+    virtual_rows: Markup | None = None
+    value_index: list[dict[str, object] | None] | None = None
+    remote: Mapping[str, object] | None = None
+
+
+@dataclass(slots=True)
+class _RowContext:
+    """Table-wide inputs shared by every call to ``_materialize_row``."""
+
+    table: Table
+    column_style_map: dict[str, str | None]
+    sticky_columns: dict[str, str]
+    visible_columns: set[str]
+    layout: LayoutOptions
+    live_updates: bool = False
+    sort_keys: bool = False
 
 
 class HTMLRenderer:
@@ -90,18 +127,195 @@ class HTMLRenderer:
         *,
         template_name: str = "table.html.j2",
         inline_styles: bool = False,
+        runtime: str = "inline",
+        runtime_url: str | None = None,
     ) -> None:
+        if runtime not in RUNTIME_MODES:
+            raise ValueError(f"runtime must be one of {', '.join(RUNTIME_MODES)}")
+        self._template_name = template_name
         self._template = self._load_template(template_name)
+        self._body_template = self._load_template(_BODY_TEMPLATE)
         self._inline_styles = inline_styles
+        self._style_digests: dict[BaseStyle, str] = {}
+        self._runtime = runtime
+        self._runtime_url = runtime_url
+        self._runtime_emitted = False
+
+    @property
+    def template_name(self) -> str:
+        return self._template_name
+
+    @property
+    def inline_styles(self) -> bool:
+        return self._inline_styles
+
+    @property
+    def runtime(self) -> str:
+        return self._runtime
+
+    def render_runtime(self) -> str:
+        """Return the ``<script>`` tag that loads the client runtime.
+
+        ``"inline"`` and ``"once"`` embed the source; ``"external"`` references
+        ``runtime_url`` (by default the versioned file name written by
+        :func:`~richframe.render.runtime.write_runtime`).
+        """
+
+        if self._runtime == "external":
+            url = self._runtime_url or runtime_filename()
+            return f'<script src="{escape(url)}"></script>\n'
+        return f"<script>\n{runtime_source()}</script>\n"
+
+    def reset_runtime(self) -> None:
+        """Start a new page: with ``runtime="once"`` the next table embeds the runtime again."""
+
+        self._runtime_emitted = False
+
+    def claim_runtime(self, needed: bool) -> str:
+        """Return the runtime tag for a table, honouring ``runtime="once"``.
+
+        ``needed`` tells whether the table uses the runtime (see
+        :func:`needs_runtime`); tables that do not get an empty string.
+        """
+
+        if not needed:
+            return ""
+        if self._runtime == "once":
+            if self._runtime_emitted:
+                return ""
+            self._runtime_emitted = True
+        return self.render_runtime()
+
+    def create_registry(self) -> StyleRegistry:
+        """Return a fresh registry sharing this renderer's class-name cache."""
+
+        if len(self._style_digests) > _DIGEST_CACHE_LIMIT:
+            self._style_digests.clear()
+        return StyleRegistry(digests=self._style_digests)
+
+    def render(
+        self,
+        table: Table,
+        *,
+        workers: int | None = None,
+        registry: StyleRegistry | None = None,
+        include_stylesheet: bool = True,
+        include_runtime: bool = True,
+    ) -> str:
+        """Render ``table`` to HTML.
+
+        When ``workers`` is greater than one, large bodies are split into
+        contiguous row ranges rendered in a worker pool. The output is identical
+        to the serial render.
+
+        Pass a shared ``registry`` together with ``include_stylesheet=False`` to
+        render several tables against one stylesheet, emitted separately via
+        :meth:`render_stylesheet`. Likewise ``include_runtime=False`` leaves
+        the client runtime to :meth:`render_runtime`.
+        """
+
+        active_registry = registry if registry is not None else self.create_registry()
+        rendered_table = self._materialize_table(table, active_registry, workers=workers)
+        return self._render_document(
+            rendered_table,
+            active_registry,
+            include_stylesheet=include_stylesheet,
+            runtime=self.claim_runtime(needs_runtime(table)) if include_runtime else "",
+        )
+
+    def iter_render(self, table: Table, *, batch_size: int = 1000) -> Iterator[str]:
+        """Yield the HTML for ``table`` in chunks of at most ``batch_size`` body rows.
+
+        Joining the chunks reproduces :meth:`render`. Every row is materialised
+        before the first chunk because the stylesheet precedes the body.
+        """
+
+        for chunk in self.iter_render_steps(table, batch_size=batch_size):
+            if chunk:
+                yield chunk
+
+    def iter_render_steps(self, table: Table, *, batch_size: int = 1000) -> Iterator[str]:
+        """Like :meth:`iter_render`, with an empty string after each unit of work.
+
+        The empty steps let callers interleave other tasks (or cancel) between
+        row batches, for instance by advancing the iterator in an executor.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        registry = self.create_registry()
+        rendered_table, context = self._begin_table(table, registry)
+        yield ""
+        batches: list[tuple[RenderedRow, ...]] = []
+        for start in range(0, len(table.body_rows), batch_size):
+            rows = table.body_rows[start : start + batch_size]
+            batches.append(self._materialize_body(rows, registry, context, start=start))
+            yield ""
+        runtime = self.claim_runtime(needs_runtime(table))
+        if _metadata_flag(table.metadata, "virtualize"):
+            rows = tuple(row for batch in batches for row in batch)
+            rendered_table = replace(rendered_table, virtual_rows=_virtual_payload(rows))
+            yield self._render_document(rendered_table, registry, include_stylesheet=True, runtime=runtime)
+            return
+        sentinel = f"<!--rf-body-{uuid.uuid4().hex}-->"
+        document = self._render_document(
+            replace(rendered_table, body_html=Markup(sentinel)),
+            registry,
+            include_stylesheet=True,
+            runtime=runtime,
+        )
+        head, tail = document.split(sentinel, 1)
+        yield head
+        for batch in batches:
+            yield str(self._render_body(batch))
+        yield tail
+
+    def render_stylesheet(self, registry: StyleRegistry) -> str:
+        """Return the ``<style>`` block for every class in ``registry``."""
 
-    def render(self, table: Table) -> str:
-        registry = StyleRegistry()
-        rendered_table = self._materialize_table(table, registry)
-        stylesheet = None if self._inline_styles else self._compose_stylesheet(registry)
+        if self._inline_styles:
+            return ""
+        return f"<style>\n{self._compose_stylesheet(registry)}\n</style>\n"
+
+    def render_rows(
+        self,
+        table: Table,
+        registry: StyleRegistry,
+        *,
+        start: int = 0,
+    ) -> tuple[tuple[RenderedRow, ...], tuple[RenderedRow, ...]]:
+        """Materialise the header and body rows of ``table`` without rendering markup.
+
+        Styles are registered in ``registry``. ``start`` is the position of the
+        first body row within a larger result that ``table`` is a page of.
+        Pass the body rows to :meth:`render_body` for their ``<tr>`` markup.
+        """
+
+        rendered_table, context = self._begin_table(table, registry)
+        return rendered_table.header_rows, self._materialize_body(table.body_rows, registry, context, start=start)
+
+    def render_body(self, rows: Sequence[RenderedRow]) -> str:
+        """Return the ``<tr>`` markup of rows from :meth:`render_rows`."""
+
+        return str(self._render_body(rows))
+
+    def _render_document(
+        self,
+        rendered_table: RenderedTable,
+        registry: StyleRegistry,
+        *,
+        include_stylesheet: bool,
+        runtime: str = "",
+    ) -> str:
+        stylesheet = None
+        if include_stylesheet and not self._inline_styles:
+            stylesheet = self._compose_stylesheet(registry)
+        container_style = _CONTAINER_STYLE if rendered_table.virtual_rows is None else _VIRTUAL_CONTAINER_STYLE
         return self._template.render(
             table=rendered_table,
-            container_style=_CONTAINER_STYLE,
+            container_style=container_style,
             stylesheet=stylesheet,
+            runtime=Markup(runtime),
         )
 
     def _compose_stylesheet(self, registry: StyleRegistry) -> str:
@@ -115,7 +329,26 @@ class HTMLRenderer:
         self,
         table: Table,
         registry: StyleRegistry,
+        *,
+        workers: int | None = None,
     ) -> RenderedTable:
+        rendered_table, context = self._begin_table(table, registry)
+        if _metadata_flag(table.metadata, "virtualize"):
+            body_rows = self._materialize_body(table.body_rows, registry, context)
+            return replace(rendered_table, virtual_rows=_virtual_payload(body_rows))
+        if _should_parallelize(len(table.body_rows), workers):
+            body_html = self._render_body_parallel(table.body_rows, registry, context, workers or 1)
+            return replace(rendered_table, body_html=body_html)
+        body_rows = self._materialize_body(table.body_rows, registry, context)
+        return replace(rendered_table, body_rows=body_rows, body_html=self._render_body(body_rows))
+
+    def _begin_table(
+        self,
+        table: Table,
+        registry: StyleRegistry,
+    ) -> tuple[RenderedTable, _RowContext]:
+        """Materialise everything but the body rows, which are left empty."""
+
         layout = table.layout or LayoutOptions.empty()
         visible_columns = layout.columns.visible_columns(table.columns)
         visible_set = set(visible_columns)
@@ -129,38 +362,26 @@ class HTMLRenderer:
         sorts_meta = _metadata_sequence(table.metadata, "sorts")
         interactive_controls = _metadata_flag(table.metadata, "interactive_controls")
         resizable_columns = _metadata_flag(table.metadata, "resizable_columns")
+        live_updates = _metadata_flag(table.metadata, "live_updates")
         container_id = f"rf-{uuid.uuid4().hex}"
 
+        context = _RowContext(
+            table=table,
+            column_style_map=column_style_map,
+            sticky_columns=sticky_columns,
+            visible_columns=visible_set,
+            layout=layout,
+            live_updates=live_updates,
+            sort_keys=interactive_controls,
+        )
         header_rows = tuple(
-            self._materialize_row(
-                row,
-                table,
-                registry,
-                column_style_map,
-                sticky_columns,
-                visible_set,
-                layout,
-                body_index=None,
-            )
+            self._materialize_row(row, registry, context, body_index=None)
             for row in table.header_rows
         )
-        body_rows = tuple(
-            self._materialize_row(
-                row,
-                table,
-                registry,
-                column_style_map,
-                sticky_columns,
-                visible_set,
-                layout,
-                body_index=index,
-            )
-            for index, row in enumerate(table.body_rows)
-        )
-        return RenderedTable(
+        rendered_table = RenderedTable(
             caption=table.caption,
             header_rows=header_rows,
-            body_rows=body_rows,
+            body_rows=(),
             class_attr=table_class_attr,
             style_attr=table_style_attr,
             layout=layout,
@@ -170,21 +391,67 @@ class HTMLRenderer:
             sorts=sorts_meta,
             interactive_controls=interactive_controls,
             resizable_columns=resizable_columns,
+            live_updates=live_updates,
             container_id=container_id,
+            body_html=Markup(""),
+            value_index=_menu_value_index(table, visible_columns) if interactive_controls else None,
+            remote=_metadata_mapping(table.metadata, "remote"),
         )
+        return rendered_table, context
+
+    def _materialize_body(
+        self,
+        rows: Sequence[Row],
+        registry: StyleRegistry,
+        context: _RowContext,
+        *,
+        start: int = 0,
+    ) -> tuple[RenderedRow, ...]:
+        return tuple(
+            self._materialize_row(row, registry, context, body_index=start + offset)
+            for offset, row in enumerate(rows)
+        )
+
+    def _render_body(self, rows: Sequence[RenderedRow]) -> Markup:
+        return Markup(self._body_template.render(rows=rows))
+
+    def _render_body_parallel(
+        self,
+        rows: Sequence[Row],
+        registry: StyleRegistry,
+        context: _RowContext,
+        workers: int,
+    ) -> Markup:
+        chunk_size = math.ceil(len(rows) / workers)
+        # Workers only need the table-level styles, not every row a second time.
+        worker_context = replace(context, table=replace(context.table, header_rows=(), body_rows=()))
+        starts = range(0, len(rows), chunk_size)
+        jobs = [
+            (self._template_name, self._inline_styles, worker_context, rows[start : start + chunk_size], start)
+            for start in starts
+        ]
+        with create_executor(min(workers, len(jobs))) as executor:
+            results = list(executor.map(_render_body_chunk, jobs))
+        fragments: list[str] = []
+        for (_, _, _, chunk, start), (html, definitions) in zip(jobs, results, strict=True):
+            # Merging in row order reproduces the serial registration order.
+            renamed = registry.merge(definitions)
+            if renamed:
+                # A class name collided with one registered by an earlier range;
+                # re-render this range against the shared registry instead.
+                html = self._render_body(self._materialize_body(chunk, registry, context, start=start))
+            fragments.append(html)
+        return Markup("".join(fragments))
 
     def _materialize_row(
         self,
         row: Row,
-        table: Table,
         registry: StyleRegistry,
-        column_style_map: dict[str, str],
-        sticky_columns: dict[str, str],
-        visible_columns: set[str],
-        layout: LayoutOptions,
+        context: _RowContext,
         *,
         body_index: int | None,
     ) -> RenderedRow:
+        layout = context.layout
         row_style_class = registry.register(row.style)
         base_class = "richframe-row--header" if row.kind == "header" else "richframe-row--body"
         zebra_class = None
@@ -197,37 +464,39 @@ class HTMLRenderer:
             and body_index % 2 == 1
         ):
             zebra_class = "richframe-row--zebra"
-            zebra_style = _derive_zebra_background(row, table)
+            zebra_style = _derive_zebra_background(row, context.table)
         row_class_attr = _compose_classes("richframe-row", base_class, row_style_class, zebra_class)
         row_style_attr = _merge_inline_styles(
             _style_attribute(row.style, inline=self._inline_styles),
             zebra_style,
         )
+        with_sort_key = context.sort_keys and row.kind == "body"
         cells = tuple(
-            self._materialize_cell(
-                cell,
-                registry,
-                column_style_map,
-                sticky_columns,
-                layout,
-            )
+            self._materialize_cell(cell, registry, context, with_sort_key=with_sort_key)
             for cell in row.cells
-            if cell.column_id is None or cell.column_id in visible_columns
+            if cell.column_id is None or cell.column_id in context.visible_columns
         )
+        key_attr = None
+        if context.live_updates and row.kind == "body":
+            key_attr = _row_key(row, body_index)
         return RenderedRow(
             cells=cells,
             class_attr=row_class_attr,
             style_attr=row_style_attr,
+            key_attr=key_attr,
         )
 
     def _materialize_cell(
         self,
         cell: Cell,
         registry: StyleRegistry,
-        column_style_map: dict[str, str],
-        sticky_columns: dict[str, str],
-        layout: LayoutOptions,
+        context: _RowContext,
+        *,
+        with_sort_key: bool = False,
     ) -> RenderedCell:
+        layout = context.layout
+        column_style_map = context.column_style_map
+        sticky_columns = context.sticky_columns
         cell_style_class = registry.register(cell.style)
         base_class = "richframe-cell--header" if cell.kind == "header" else "richframe-cell--body"
         sticky_class = None
@@ -250,6 +519,11 @@ class HTMLRenderer:
             )
         if layout_style:
             cell_style_attr = _merge_inline_styles(cell_style_attr, layout_style)
+        if cell.variables:
+            cell_style_attr = _merge_inline_styles(
+                cell_style_attr,
+                "; ".join(f"{name}: {value}" for name, value in cell.variables),
+            )
         headers_attr = None
         if cell.headers:
             headers_attr = " ".join(cell.headers)
@@ -264,6 +538,8 @@ class HTMLRenderer:
             scope_attr=cell.scope,
             headers_attr=headers_attr,
             id_attr=cell.id,
+            column_attr=cell.column_id if context.live_updates else None,
+            sort_key=_sort_key(cell.value) if with_sort_key else None,
         )
 
     @staticmethod
@@ -305,6 +581,198 @@ class HTMLRenderer:
         return column_styles, sticky_offsets
 
 
+def needs_runtime(table: Table) -> bool:
+    """Return whether ``table`` renders with the client runtime."""
+
+    return any(
+        _metadata_flag(table.metadata, flag)
+        for flag in ("interactive_controls", "resizable_columns", "live_updates", "virtualize")
+    )
+
+
+def _row_key(row: Row, position: int | None) -> str:
+    """Return the key identifying a body row across renders of the same table."""
+
+    if row.index is not None:
+        return str(row.index)
+    return str(position)
+
+
+def _menu_value_index(table: Table, columns: Sequence[str]) -> list[dict[str, object] | None] | None:
+    """Return the filter menu entries for ``columns`` from the table's value index.
+
+    Entries whose texts no longer match the body in every row (for example
+    after a plugin rewrote some of them) are dropped so the runtime collects
+    those values itself.
+    """
+
+    index = table.metadata.get("value_index") if isinstance(table.metadata, dict) else None
+    if not index:
+        return None
+    stale = _stale_value_index_columns(table, {column_id: index[column_id] for column_id in columns if column_id in index})
+    entries: list[dict[str, object] | None] = []
+    for column_id in columns:
+        entry = index.get(column_id)
+        if entry is None or column_id in stale:
+            entries.append(None)
+        elif entry.get("search_only"):
+            entries.append({"searchOnly": True})
+        else:
+            entries.append({"values": list(entry["values"]), "counts": list(entry["counts"])})
+    return entries
+
+
+def _stale_value_index_columns(table: Table, entries: Mapping[str, Mapping[str, Any]]) -> set[str]:
+    """Return the columns whose value index disagrees with a body cell's text."""
+
+    body_rows = table.body_rows
+    expected: dict[str | None, tuple[Sequence[str], list[int]]] = {}
+    stale: set[str] = set()
+    for column_id, entry in entries.items():
+        if entry.get("search_only"):
+            continue
+        if len(entry["codes"]) != len(body_rows):
+            stale.add(column_id)
+        else:
+            expected[column_id] = (entry["values"], entry["codes"].tolist())
+    for position, row in enumerate(body_rows):
+        if not expected:
+            break
+        for cell in row.cells:
+            column = expected.get(cell.column_id)
+            if column is not None and cell.text.strip() != column[0][column[1][position]]:
+                stale.add(cell.column_id)  # type: ignore[arg-type]
+                del expected[cell.column_id]
+    return stale
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _sort_key(value: object) -> str | None:
+    """Return the numeric sort key the interactive runtime uses for ``value``.
+
+    Numbers sort by value, dates and datetimes by their offset from the epoch,
+    and durations by their length in seconds. Missing values map to ``""`` and
+    sort last. Other values have no key and sort by their displayed text.
+    """
+
+    if value is None or isinstance(value, bool):
+        return "" if value is None else None
+    try:
+        if value != value:  # NaN and NaT
+            return ""
+    except (TypeError, ValueError):
+        return None
+    if isinstance(value, numbers.Integral):
+        return str(int(value))
+    if isinstance(value, numbers.Real):
+        return _float_key(float(value))
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            return _float_key(value.timestamp() * 1000)
+        return _float_key((value - _EPOCH) / timedelta(milliseconds=1))
+    if isinstance(value, date):
+        return _float_key((datetime.combine(value, time()) - _EPOCH) / timedelta(milliseconds=1))
+    if isinstance(value, timedelta):
+        return _float_key(value.total_seconds())
+    return None
+
+
+def _float_key(value: float) -> str:
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value.is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    return repr(value)
+
+
+def _virtual_payload(rows: Sequence[RenderedRow]) -> Markup:
+    """Encode rendered rows as the compact JSON read by the virtual runtime.
+
+    Class, style, tag and scope attributes are dictionary-encoded into
+    ``dict`` (entry 0 is the empty string). Each row is ``[class, style, text,
+    class, style, tag, scope, id, headers, ...]`` with seven entries per cell;
+    ``id`` and ``headers`` differ from row to row and are stored as strings
+    (empty when absent). ``keys`` holds one array of sort
+    keys per cell position (``null`` for missing values), or ``null`` when a
+    position has no numeric keys and sorts by text.
+    """
+
+    dictionary: dict[str, int] = {"": 0}
+
+    def encode(value: str | None) -> int:
+        key = value or ""
+        code = dictionary.get(key)
+        if code is None:
+            code = dictionary[key] = len(dictionary)
+        return code
+
+    encoded_rows: list[list[object]] = []
+    for row in rows:
+        encoded: list[object] = [encode(row.class_attr), encode(row.style_attr)]
+        for cell in row.cells:
+            if cell.rowspan != 1:
+                raise ValueError("Virtualized tables cannot contain row-spanning body cells")
+            encoded.extend(
+                (
+                    cell.text,
+                    encode(cell.class_attr),
+                    encode(cell.style_attr),
+                    encode(cell.tag),
+                    encode(cell.scope_attr),
+                    cell.id_attr or "",
+                    cell.headers_attr or "",
+                )
+            )
+        encoded_rows.append(encoded)
+    payload = {"dict": list(dictionary), "rows": encoded_rows, "keys": _virtual_sort_keys(rows)}
+    return Markup(htmlsafe_json_dumps(payload, separators=(",", ":")))
+
+
+def _virtual_sort_keys(rows: Sequence[RenderedRow]) -> list[list[float | int | None] | None]:
+    width = max((len(row.cells) for row in rows), default=0)
+    columns: list[list[float | int | None] | None] = []
+    for position in range(width):
+        keys = [row.cells[position].sort_key if position < len(row.cells) else None for row in rows]
+        if any(key is None for key in keys):
+            columns.append(None)
+            continue
+        columns.append([_json_number(key) if key else None for key in keys])
+    return columns
+
+
+def _json_number(key: str) -> float | int:
+    # JSON has no infinity; clamping keeps infinite values at the extremes.
+    value = float(key)
+    if math.isinf(value):
+        return math.copysign(sys.float_info.max, value)
+    return int(value) if value.is_integer() else value
+
+
+def _should_parallelize(row_count: int, workers: int | None) -> bool:
+    if workers is None or workers <= 1:
+        return False
+    return row_count >= workers * _MIN_ROWS_PER_WORKER
+
+
+@lru_cache(maxsize=None)
+def worker_renderer(template_name: str, inline_styles: bool) -> HTMLRenderer:
+    """Return a renderer for jobs running in a worker, created once per process."""
+
+    return HTMLRenderer(template_name=template_name, inline_styles=inline_styles)
+
+
+def _render_body_chunk(
+    job: tuple[str, bool, _RowContext, Sequence[Row], int],
+) -> tuple[str, list[StyleDefinition]]:
+    template_name, inline_styles, context, rows, start = job
+    renderer = worker_renderer(template_name, inline_styles)
+    registry = renderer.create_registry()
+    rendered = renderer._materialize_body(rows, registry, context, start=start)
+    return str(renderer._render_body(rendered)), list(registry.definitions())
+
+
 def _compose_classes(*parts: str | None) -> str:
     tokens = [part for part in parts if part]
     return " ".join(tokens)
@@ -328,6 +796,13 @@ def _metadata_sequence(
     return tuple(extracted) if extracted else None
 
 
+def _metadata_mapping(metadata: Mapping[str, object] | None, key: str) -> Mapping[str, object] | None:
+    if not isinstance(metadata, Mapping):
+        return None
+    value = metadata.get(key)
+    return value if isinstance(value, Mapping) else None
+
+
 def _metadata_flag(metadata: Mapping[str, object] | None, key: str) -> bool:
     if not isinstance(metadata, Mapping):
         return False
@@ -0,0 +1,226 @@
+"""Incremental diffs between two renders of the same table."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+
+from ..core.model import Table
+from ..style import StyleRegistry
+from .html_renderer import HTMLRenderer, RenderedCell, RenderedRow
+
+__all__ = ["Patch", "TableDiff", "diff_tables", "patches_to_json"]
+
+
+@dataclass(frozen=True, slots=True)
+class Patch:
+    """A single DOM update understood by ``richframe.applyPatches``.
+
+    ``op`` is one of ``"style"`` (append CSS rules), ``"cell"`` (update a
+    cell's text and attributes), ``"row"`` (update a row's attributes),
+    ``"remove"``, ``"insert"`` or ``"replace"`` (row markup changes),
+    ``"order"`` (reorder rows by key), or ``"body"`` (replace the whole body).
+    """
+
+    op: str
+    row: str | None = None
+    column: str | None = None
+    text: str | None = None
+    class_attr: str | None = None
+    style_attr: str | None = None
+    html: str | None = None
+    before: str | None = None
+    rows: tuple[str, ...] | None = None
+    css: str | None = None
+    sort_key: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        if self.op == "style":
+            return {"op": self.op, "css": self.css}
+        if self.op == "cell":
+            payload = {
+                "op": self.op,
+                "row": self.row,
+                "column": self.column,
+                "text": self.text,
+                "class": self.class_attr,
+                "style": self.style_attr,
+            }
+            if self.sort_key is not None:
+                payload["key"] = self.sort_key
+            return payload
+        if self.op == "row":
+            return {"op": self.op, "row": self.row, "class": self.class_attr, "style": self.style_attr}
+        if self.op == "remove":
+            return {"op": self.op, "row": self.row}
+        if self.op == "insert":
+            return {"op": self.op, "row": self.row, "before": self.before, "html": self.html}
+        if self.op == "replace":
+            return {"op": self.op, "row": self.row, "html": self.html}
+        if self.op == "order":
+            return {"op": self.op, "rows": list(self.rows or ())}
+        return {"op": self.op, "html": self.html}
+
+
+@dataclass(frozen=True, slots=True)
+class TableDiff:
+    """Patches for one update together with the table they produce.
+
+    Keep ``table`` as the ``previous`` argument of the next diff.
+    """
+
+    table: Table
+    patches: tuple[Patch, ...]
+
+    def to_json(self) -> str:
+        return patches_to_json(self.patches)
+
+
+def patches_to_json(patches: Sequence[Patch]) -> str:
+    """Serialise ``patches`` into the JSON payload consumed by the client."""
+
+    return json.dumps([patch.to_dict() for patch in patches], ensure_ascii=False)
+
+
+def diff_tables(
+    previous: Table,
+    current: Table,
+    *,
+    renderer: HTMLRenderer | None = None,
+) -> tuple[Patch, ...]:
+    """Return the patches that turn the DOM for ``previous`` into ``current``.
+
+    Rows are matched by index value and cells by ``column_id``. Both tables
+    must share their columns and header rows; re-render the table when they do
+    not. Row insertions, removals, and reordering in tables with merged index
+    cells (rowspans) fall back to a single ``"body"`` patch.
+    """
+
+    if tuple(previous.columns) != tuple(current.columns):
+        raise ValueError("Cannot diff tables with different columns; re-render the table instead")
+    active_renderer = renderer or HTMLRenderer()
+    previous_registry = active_renderer.create_registry()
+    current_registry = active_renderer.create_registry()
+    previous_header, previous_rows = _render_rows(active_renderer, previous, previous_registry)
+    current_header, current_rows = _render_rows(active_renderer, current, current_registry)
+    if previous_header != current_header:
+        raise ValueError("Cannot diff tables with different header rows; re-render the table instead")
+
+    previous_keys = _unique_keys(previous_rows)
+    current_keys = _unique_keys(current_rows)
+    patches: list[Patch] = []
+    css = _new_rules(previous_registry, current_registry)
+    if css:
+        patches.append(Patch("style", css=css))
+
+    if previous_keys != current_keys and (_has_rowspans(previous_rows) or _has_rowspans(current_rows)):
+        patches.append(Patch("body", html=_rows_html(active_renderer, current_rows)))
+        return tuple(patches)
+
+    previous_by_key = dict(zip(previous_keys, previous_rows, strict=True))
+    current_set = set(current_keys)
+    for key in previous_keys:
+        if key not in current_set:
+            patches.append(Patch("remove", row=key))
+
+    # Inserting each new row before the next surviving row keeps new rows in
+    # place; a reorder is needed only when the surviving rows changed order.
+    next_surviving = _next_surviving_keys(current_keys, previous_by_key)
+    for position, (key, row) in enumerate(zip(current_keys, current_rows, strict=True)):
+        old_row = previous_by_key.get(key)
+        if old_row is None:
+            html = _rows_html(active_renderer, (row,))
+            patches.append(Patch("insert", row=key, before=next_surviving[position], html=html))
+            continue
+        patches.extend(_diff_row(active_renderer, key, old_row, row))
+    surviving_before = [key for key in previous_keys if key in current_set]
+    surviving_after = [key for key in current_keys if key in previous_by_key]
+    if surviving_before != surviving_after:
+        patches.append(Patch("order", rows=tuple(current_keys)))
+    return tuple(patches)
+
+
+def _render_rows(
+    renderer: HTMLRenderer,
+    table: Table,
+    registry: StyleRegistry,
+) -> tuple[tuple[RenderedRow, ...], tuple[RenderedRow, ...]]:
+    metadata = dict(table.metadata) if isinstance(table.metadata, dict) else {}
+    metadata["live_updates"] = True
+    live_table = Table(
+        columns=table.columns,
+        header_rows=table.header_rows,
+        body_rows=table.body_rows,
+        caption=table.caption,
+        metadata=metadata,
+        table_style=table.table_style,
+        layout=table.layout,
+        stats=table.stats,
+    )
+    return renderer.render_rows(live_table, registry)
+
+
+def _unique_keys(rows: Sequence[RenderedRow]) -> list[str]:
+    keys = [row.key_attr or "" for row in rows]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Row keys must be unique to diff tables; ensure the index has no duplicates")
+    return keys
+
+
+def _new_rules(previous: StyleRegistry, current: StyleRegistry) -> str:
+    known = {(definition.class_name, definition.style) for definition in previous.definitions()}
+    lines = [
+        f".{definition.class_name} {{ {definition.style.css_text()} }}"
+        for definition in current.definitions()
+        if (definition.class_name, definition.style) not in known
+    ]
+    return "\n".join(lines)
+
+
+def _has_rowspans(rows: Sequence[RenderedRow]) -> bool:
+    return any(cell.rowspan != 1 for row in rows for cell in row.cells)
+
+
+def _next_surviving_keys(keys: Sequence[str], surviving: Mapping[str, object]) -> list[str | None]:
+    result: list[str | None] = [None] * len(keys)
+    upcoming: str | None = None
+    for position in range(len(keys) - 1, -1, -1):
+        result[position] = upcoming
+        if keys[position] in surviving:
+            upcoming = keys[position]
+    return result
+
+
+def _diff_row(renderer: HTMLRenderer, key: str, old: RenderedRow, new: RenderedRow) -> list[Patch]:
+    if _cell_layout(old.cells) != _cell_layout(new.cells):
+        return [Patch("replace", row=key, html=_rows_html(renderer, (new,)))]
+    patches: list[Patch] = []
+    if (old.class_attr, old.style_attr) != (new.class_attr, new.style_attr):
+        patches.append(Patch("row", row=key, class_attr=new.class_attr, style_attr=new.style_attr))
+    for old_cell, new_cell in zip(old.cells, new.cells, strict=True):
+        if old_cell == new_cell:
+            continue
+        patches.append(
+            Patch(
+                "cell",
+                row=key,
+                column=new_cell.column_attr,
+                text=new_cell.text,
+                class_attr=new_cell.class_attr,
+                style_attr=new_cell.style_attr,
+                sort_key=new_cell.sort_key,
+            )
+        )
+    return patches
+
+
+def _cell_layout(cells: Sequence[RenderedCell]) -> tuple[tuple[Any, ...], ...]:
+    # Everything about a cell that a "cell" patch cannot update in place.
+    return tuple(
+        (cell.column_attr, cell.tag, cell.colspan, cell.rowspan, cell.id_attr, cell.scope_attr, cell.headers_attr)
+        for cell in cells
+    )
+
+
+def _rows_html(renderer: HTMLRenderer, rows: Sequence[RenderedRow]) -> str:
+    return renderer.render_body(rows).strip()
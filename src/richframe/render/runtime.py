@@ -0,0 +1,45 @@
+"""The client-side runtime shared by interactive, resizable, and live tables."""
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from importlib import resources
+from os import PathLike
+from pathlib import Path
+
+__all__ = ["RUNTIME_MODES", "runtime_filename", "runtime_source", "write_runtime"]
+
+RUNTIME_MODES = ("inline", "once", "external")
+
+
+@lru_cache(maxsize=None)
+def runtime_source() -> str:
+    """Return the JavaScript source of the richframe runtime."""
+
+    return resources.files("richframe.templates").joinpath("richframe.js").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def runtime_filename() -> str:
+    """Return the versioned file name of the runtime asset.
+
+    The name embeds a digest of the source, so it changes whenever the runtime
+    does and can be cached indefinitely by browsers.
+    """
+
+    digest = hashlib.sha1(runtime_source().encode("utf-8")).hexdigest()[:12]
+    return f"richframe-{digest}.js"
+
+
+def write_runtime(directory: str | PathLike[str]) -> Path:
+    """Write the runtime asset into ``directory`` and return its path.
+
+    Use this with ``runtime="external"`` to serve the runtime as a static file.
+    An existing asset with the same name is left untouched.
+    """
+
+    target = Path(directory) / runtime_filename()
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(runtime_source(), encoding="utf-8")
+    return target
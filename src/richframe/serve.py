@@ -0,0 +1,354 @@
+"""Serve a large DataFrame page by page to the interactive runtime.
+
+:class:`TableApp` keeps a prepared DataFrame in memory and answers paging,
+sorting, and filtering requests, so the browser only ever holds one page of
+rows. The app is a WSGI callable and exposes an ASGI entry point as
+:attr:`TableApp.asgi`::
+
+    app = TableApp(frame, page_size=200, theme="light")
+    # gunicorn module:app            (WSGI)
+    # uvicorn module:app.asgi        (ASGI)
+
+Routes (relative to where the app is mounted):
+
+``GET /``
+    An HTML page with the first page of rows and the runtime in remote mode.
+``GET /rows``
+    JSON ``{"total", "offset", "limit", "html", "css"}`` with the requested
+    rows rendered as ``<tr>`` elements and any CSS rules they need.
+``GET /data``
+    JSON ``{"total", "offset", "limit", "columns", "rows"}`` with the
+    displayed cell texts.
+
+Both data routes accept ``offset``, ``limit``, ``sort`` (shorthand such as
+``-price,name`` or a JSON list of sort mappings), and ``filter`` (a JSON list
+of filter mappings) query parameters, parsed with
+:func:`~richframe.layout.coerce_sort_configs` and
+:func:`~richframe.layout.coerce_filter_configs`. Filters run on the raw
+DataFrame values, so the search box's ``contains`` filter matches the string
+form of a value rather than its displayed text (``1500`` finds a cell shown
+as ``1,500.00``, while ``1,500`` does not), unlike the in-page search of a
+table rendered in full. ``HEAD`` requests get the headers of the matching
+``GET`` response with an empty body.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qs
+
+import pandas as pd
+
+from .api import build_table
+from .core.model import Table
+from .io.pandas_adapter import filter_frame, sort_frame
+from .layout import FilterConfig, SortConfig, coerce_filter_configs, coerce_sort_configs
+from .plugins import Plugin
+from .render import HTMLRenderer
+from .style import Theme, resolve_theme
+
+__all__ = ["TableApp", "TablePage"]
+
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+{table}
+</body>
+</html>
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class TablePage:
+    """One page of query results."""
+
+    total: int
+    offset: int
+    limit: int
+    table: Table
+    html: str
+    css: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "offset": self.offset,
+            "limit": self.limit,
+            "html": self.html,
+            "css": self.css,
+        }
+
+
+class TableApp:
+    """WSGI/ASGI application serving pages of ``frame``.
+
+    Parameters
+    ----------
+    frame:
+        The DataFrame to serve. It is not copied; do not mutate it while the
+        app is running.
+    page_size:
+        Rows per page when a request does not pass ``limit``.
+    max_page_size:
+        Upper bound for ``limit``.
+    theme, inline_styles, renderer, plugins:
+        As for :func:`~richframe.to_html`. Plugins only see the rows of the
+        page being rendered.
+    **options:
+        Other :func:`~richframe.to_html` options (formatters, column layout,
+        ...) applied to every page. ``filters`` and ``sorts`` come from each
+        request instead.
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        *,
+        page_size: int = 100,
+        max_page_size: int = 1000,
+        theme: str | Theme | None = "minimal",
+        inline_styles: bool = False,
+        renderer: HTMLRenderer | None = None,
+        plugins: Sequence[Plugin | None] | None = None,
+        **options: Any,
+    ) -> None:
+        if page_size < 1 or max_page_size < page_size:
+            raise ValueError("page_size must be positive and no larger than max_page_size")
+        if "filters" in options or "sorts" in options:
+            raise ValueError("TableApp takes filters and sorts from each request, not as options")
+        if options.get("virtualize"):
+            raise ValueError("TableApp pages rows itself and cannot be combined with virtualize")
+        self._frame = frame
+        self._page_size = page_size
+        self._max_page_size = max_page_size
+        self._theme = resolve_theme(theme)
+        self._plugins = plugins
+        self._options = options
+        self._renderer = renderer or HTMLRenderer(inline_styles=inline_styles)
+        self._lock = threading.Lock()
+        # Paging through one query is the common case, so keep its result.
+        self._last_query: tuple[str, Any] | None = None
+
+    @property
+    def page_size(self) -> int:
+        return self._page_size
+
+    def query(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        filters: Sequence[FilterConfig | Mapping[str, Any]] | None = None,
+        sorts: Sequence[SortConfig | Mapping[str, Any] | str] | None = None,
+    ) -> TablePage:
+        """Return the rows ``offset:offset + limit`` of the filtered, sorted frame."""
+
+        if offset < 0:
+            raise ValueError("offset must not be negative")
+        size = self._page_size if limit is None else limit
+        if not 1 <= size <= self._max_page_size:
+            raise ValueError(f"limit must be between 1 and {self._max_page_size}")
+        resolved_filters = coerce_filter_configs(filters) if filters else ()
+        resolved_sorts = coerce_sort_configs(sorts) if sorts else ()
+        result = self._result_frame(resolved_filters, resolved_sorts)
+        table = self._build_page(result.iloc[offset : offset + size])
+        registry = self._renderer.create_registry()
+        _, rows = self._renderer.render_rows(table, registry, start=offset)
+        css = "" if self._renderer.inline_styles else registry.stylesheet()
+        return TablePage(
+            total=len(result),
+            offset=offset,
+            limit=size,
+            table=table,
+            html=self._renderer.render_body(rows),
+            css=css,
+        )
+
+    def render(self, url: str) -> str:
+        """Return the table fragment for the first page, fetching further pages from ``url``.
+
+        ``url`` is where the ``/rows`` route is reachable from the page.
+        """
+
+        page = self.query()
+        metadata = dict(page.table.metadata)
+        metadata["interactive_controls"] = True
+        metadata.pop("value_index", None)
+        metadata["remote"] = {
+            "url": url,
+            "total": page.total,
+            "page_size": self._page_size,
+            "columns": _remote_columns(page.table),
+        }
+        table = Table(
+            columns=page.table.columns,
+            header_rows=page.table.header_rows,
+            body_rows=page.table.body_rows,
+            caption=page.table.caption,
+            metadata=metadata,
+            table_style=page.table.table_style,
+            layout=page.table.layout,
+            stats=page.table.stats,
+        )
+        return self._renderer.render(table)
+
+    def __call__(self, environ: Mapping[str, Any], start_response: Callable[..., Any]) -> Iterable[bytes]:
+        status, headers, body = self._dispatch(
+            environ.get("REQUEST_METHOD", "GET"),
+            environ.get("PATH_INFO", "") or "/",
+            environ.get("QUERY_STRING", ""),
+            environ.get("SCRIPT_NAME", ""),
+        )
+        start_response(status, headers)
+        return [body]
+
+    async def asgi(self, scope: Mapping[str, Any], receive: Callable[..., Any], send: Callable[..., Any]) -> None:
+        """ASGI entry point; requests are handled in the default executor."""
+
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            raise ValueError(f"Unsupported ASGI scope type '{scope['type']}'")
+        root = scope.get("root_path", "")
+        path = scope.get("path", "/")
+        if root and path.startswith(root):
+            path = path[len(root) :]
+        loop = asyncio.get_running_loop()
+        status, headers, body = await loop.run_in_executor(
+            None,
+            self._dispatch,
+            scope.get("method", "GET"),
+            path or "/",
+            scope.get("query_string", b"").decode("latin-1"),
+            root,
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(status.split(" ", 1)[0]),
+                "headers": [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        query_string: str,
+        root: str,
+    ) -> tuple[str, list[tuple[str, str]], bytes]:
+        if method not in {"GET", "HEAD"}:
+            return _json_response("405 Method Not Allowed", {"error": "Only GET requests are supported"})
+        status, headers, body = self._route(path, query_string, root)
+        return status, headers, b"" if method == "HEAD" else body
+
+    def _route(self, path: str, query_string: str, root: str) -> tuple[str, list[tuple[str, str]], bytes]:
+        route = path.rstrip("/") or "/"
+        try:
+            if route == "/":
+                html = _PAGE_TEMPLATE.format(title="richframe", table=self.render(f"{root}/rows"))
+                return _response("200 OK", "text/html; charset=utf-8", html.encode("utf-8"))
+            if route in {"/rows", "/data"}:
+                page = self.query(**_parse_query(query_string))
+                payload = page.to_dict() if route == "/rows" else _page_data(page)
+                return _json_response("200 OK", payload)
+        except (KeyError, TypeError, ValueError) as exc:
+            message = exc.args[0] if isinstance(exc, KeyError) and exc.args else str(exc)
+            return _json_response("400 Bad Request", {"error": str(message)})
+        return _json_response("404 Not Found", {"error": f"No route for '{path}'"})
+
+    def _result_frame(self, filters: tuple[FilterConfig, ...], sorts: tuple[SortConfig, ...]) -> pd.DataFrame:
+        if not filters and not sorts:
+            return self._frame
+        key = json.dumps(
+            [[config.to_dict() for config in filters], [config.to_dict() for config in sorts]],
+            default=str,
+            sort_keys=True,
+        )
+        with self._lock:
+            if self._last_query is not None and self._last_query[0] == key:
+                return self._last_query[1]
+        result = sort_frame(filter_frame(self._frame, filters), sorts)
+        with self._lock:
+            self._last_query = (key, result)
+        return result
+
+    def _build_page(self, frame: pd.DataFrame) -> Table:
+        return build_table(frame, theme=self._theme, plugins=self._plugins, **self._options)
+
+
+def _parse_query(query_string: str) -> dict[str, Any]:
+    params = parse_qs(query_string)
+    query: dict[str, Any] = {}
+    for name in ("offset", "limit"):
+        if name in params:
+            try:
+                query[name] = int(params[name][-1])
+            except ValueError:
+                raise ValueError(f"'{name}' must be an integer") from None
+    if "filter" in params:
+        filters = _load_json(params["filter"][-1], "filter")
+        if not isinstance(filters, list):
+            raise TypeError("'filter' must be a JSON list of filter mappings")
+        query["filters"] = filters
+    if "sort" in params:
+        sorts: list[Any] = []
+        for value in params["sort"]:
+            if value.lstrip().startswith("["):
+                sorts.extend(_load_json(value, "sort"))
+            else:
+                sorts.extend(part for part in value.split(",") if part)
+        query["sorts"] = sorts
+    return query
+
+
+def _load_json(value: str, name: str) -> Any:
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        raise ValueError(f"'{name}' is not valid JSON") from None
+
+
+def _remote_columns(table: Table) -> list[dict[str, str]]:
+    layout = table.layout
+    visible = layout.columns.visible_columns(table.columns) if layout is not None else table.columns
+    index_columns = set(table.metadata.get("index_columns") or ())
+    return [
+        {"key": column_id or "index", "axis": "index"} if column_id in index_columns else {"key": column_id, "axis": "column"}
+        for column_id in visible
+    ]
+
+
+def _page_data(page: TablePage) -> dict[str, Any]:
+    return {
+        "total": page.total,
+        "offset": page.offset,
+        "limit": page.limit,
+        "columns": list(page.table.columns),
+        "rows": [[cell.text for cell in row.cells] for row in page.table.body_rows],
+    }
+
+
+def _response(status: str, content_type: str, body: bytes) -> tuple[str, list[tuple[str, str]], bytes]:
+    headers = [("Content-Type", content_type), ("Content-Length", str(len(body)))]
+    return status, headers, body
+
+
+def _json_response(status: str, payload: Mapping[str, Any]) -> tuple[str, list[tuple[str, str]], bytes]:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    return _response(status, "application/json", body)
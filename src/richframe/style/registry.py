@@ -21,8 +21,10 @@ class StyleDefinition:
 class StyleRegistry:
     """Assign deterministic class names to style declarations."""
 
-    def __init__(self, *, prefix: str = "rf") -> None:
+    def __init__(self, *, prefix: str = "rf", digests: Dict[BaseStyle, str] | None = None) -> None:
         self._prefix = prefix
+        # ``digests`` may be shared between registries to skip re-hashing styles.
+        self._digests: Dict[BaseStyle, str] = digests if digests is not None else {}
         self._lookup: Dict[BaseStyle, str] = {}
         self._class_lookup: Dict[str, BaseStyle] = {}
         self._order: List[BaseStyle] = []
@@ -39,6 +41,20 @@ class StyleRegistry:
         self._order.append(style)
         return class_name
 
+    def merge(self, definitions: Iterable[StyleDefinition]) -> dict[str, str]:
+        """Register ``definitions`` in order, returning any class names that changed.
+
+        The returned mapping is keyed by the incoming class name and is empty
+        when every definition kept the class name it was registered under.
+        """
+
+        renamed: dict[str, str] = {}
+        for definition in definitions:
+            class_name = self.register(definition.style)
+            if class_name is not None and class_name != definition.class_name:
+                renamed[definition.class_name] = class_name
+        return renamed
+
     def definitions(self) -> Iterable[StyleDefinition]:
         for style in self._order:
             yield StyleDefinition(self._lookup[style], style)
@@ -51,8 +67,11 @@ class StyleRegistry:
         return "\n".join(lines)
 
     def _generate_class_name(self, style: BaseStyle) -> str:
-        css = style.css_text().encode("utf-8")
-        digest = hashlib.sha1(css).hexdigest()
+        digest = self._digests.get(style)
+        if digest is None:
+            css = style.css_text().encode("utf-8")
+            digest = hashlib.sha1(css).hexdigest()
+            self._digests[style] = digest
         suffix_length = 6
         attempt = 0
         while True:
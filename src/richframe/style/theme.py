@@ -5,6 +5,7 @@ from dataclasses import dataclass, replace
 from typing import Dict, Iterable, Mapping, Type, TypeVar
 
 from ..core.model import Cell, Row, Table
+from ..core.stats import carry_stats
 from .model import BaseStyle, CellStyle, RowStyle, TableStyle
 
 __all__ = ["Theme", "get_theme", "list_themes", "resolve_theme", "compose_theme", "register_theme"]
@@ -46,6 +47,7 @@ class Theme:
             table_style=table_style,
             header_rows=header_rows,
             body_rows=body_rows,
+            stats=carry_stats(table, body_rows),
         )
 
     @staticmethod
@@ -0,0 +1,714 @@
+// richframe client runtime: filter/sort menus, column resizing, and live patches.
+(function () {
+  var richframe = window.richframe = window.richframe || {};
+  if (richframe.init) return;
+
+  function initInteractive(container) {
+    if (container.dataset.rfInteractiveReady) return;
+    container.dataset.rfInteractiveReady = "1";
+    var table = container.querySelector("table");
+    if (!table || !table.tHead || !table.tBodies.length) return;
+    var tbody = table.tBodies[0];
+    if (!document.getElementById("rf-interactive-style")) {
+      var style = document.createElement("style");
+      style.id = "rf-interactive-style";
+      style.textContent = [
+        ".rf-filter-icon{border:none;background:transparent;cursor:pointer;position:absolute;right:0.6em;top:50%;transform:translateY(-50%);padding:0;}",
+        ".rf-filter-box{display:inline-flex;align-items:center;justify-content:center;width:1.25em;height:1.25em;border:1px solid #d1d5db;border-radius:3px;background:#f9fafb;color:#374151;font-size:0.62rem;line-height:1;}",
+        ".rf-filter-icon:hover .rf-filter-box{background:#e5e7eb;color:#111827;}",
+        ".rf-filter-menu{display:none;min-width:200px;background:#fff;border:1px solid #d1d5db;box-shadow:0 6px 18px rgba(15,23,42,0.18);padding:10px;border-radius:6px;z-index:9999;}",
+        ".rf-sort-actions{display:flex;flex-direction:column;gap:6px;margin-bottom:6px;}",
+        ".rf-sort-buttons{display:flex;gap:6px;}",
+        ".rf-sort-buttons button{flex:1;padding:4px 6px;font-size:0.72rem;border:1px solid #d1d5db;border-radius:4px;background:#f9fafb;cursor:pointer;display:flex;align-items:center;justify-content:center;font-weight:600;letter-spacing:0.02em;}",
+        ".rf-sort-buttons button:hover{background:#f3f4f6;}",
+        ".rf-divider{border:none;border-top:1px solid #e5e7eb;margin:6px 0;}",
+        ".rf-filter-search{width:100%;box-sizing:border-box;padding:4px;margin-bottom:6px;border-radius:4px;border:1px solid #d1d5db;}",
+        ".rf-filter-option{display:flex;align-items:center;gap:6px;margin:2px 0;font-size:0.85rem;}",
+        ".rf-filter-count{margin-left:auto;color:#6b7280;font-size:0.75rem;}",
+        ".rf-filter-note{color:#6b7280;font-size:0.8rem;}",
+        ".rf-pager{display:flex;align-items:center;justify-content:flex-end;gap:8px;padding:6px 0;font-size:0.8rem;}",
+        ".rf-pager button{padding:2px 8px;border:1px solid #d1d5db;border-radius:4px;background:#f9fafb;cursor:pointer;}",
+        ".rf-filter-actions{display:flex;justify-content:flex-end;gap:6px;margin-top:8px;}",
+        ".rf-filter-actions button{padding:4px 8px;font-size:0.8rem;border-radius:4px;border:1px solid #d1d5db;background:#f9fafb;cursor:pointer;}",
+        ".rf-filter-actions button:hover{background:#f3f4f6;}"
+      ].join("");
+      document.head.appendChild(style);
+    }
+
+    var headers = Array.prototype.slice.call(table.tHead.querySelectorAll("th"));
+    if (!headers.length) return;
+    headers.forEach(function (th) {
+      th.style.position = "relative";
+      th.style.paddingRight = "2em";
+    });
+    var source = container.dataset.richframeRemote
+      ? createRemoteSource()
+      : (container.dataset.richframeVirtual ? createVirtualSource() : createDomSource());
+    var order = [];
+    for (var position = 0; position < source.count; position++) {
+      order.push(position);
+    }
+    var filterColumn = null;
+    var allowedValues = null;
+    var searchTerm = null;
+    var valueIndex = container.dataset.richframeValues ? JSON.parse(container.dataset.richframeValues) : [];
+    var menuValues = {};
+
+    function createDomSource() {
+      var rows = Array.prototype.slice.call(tbody.rows);
+      return {
+        count: rows.length,
+        reload: function () {
+          rows = Array.prototype.slice.call(tbody.rows);
+          this.count = rows.length;
+        },
+        text: function (rowIdx, colIdx) {
+          var cell = rows[rowIdx].cells[colIdx];
+          return cell ? cell.textContent.trim() : null;
+        },
+        key: function (rowIdx, colIdx) {
+          var cell = rows[rowIdx].cells[colIdx];
+          var raw = cell ? cell.getAttribute("data-v") : null;
+          if (raw === null) return null;
+          return raw === "" ? NaN : Number(raw);
+        },
+        render: function (rowOrder, passes) {
+          var fragment = document.createDocumentFragment();
+          rowOrder.forEach(function (rowIdx) {
+            rows[rowIdx].style.display = passes(rowIdx) ? "" : "none";
+            fragment.appendChild(rows[rowIdx]);
+          });
+          tbody.appendChild(fragment);
+        }
+      };
+    }
+
+    function createVirtualSource() {
+      var payload = JSON.parse(container.querySelector("script.richframe-rows").textContent);
+      var dict = payload.dict;
+      var rows = payload.rows;
+      var view = rows.map(function (_, rowIdx) { return rowIdx; });
+      var cellCount = rows.length ? (rows[0].length - 2) / 7 : 1;
+      var overscan = 8;
+      var rowHeight = 0;
+      var scheduled = false;
+
+      function buildRow(rowIdx) {
+        var data = rows[rowIdx];
+        var tr = document.createElement("tr");
+        tr.className = dict[data[0]];
+        if (data[1]) tr.setAttribute("style", dict[data[1]]);
+        for (var offset = 2; offset < data.length; offset += 7) {
+          var cell = document.createElement(dict[data[offset + 3]]);
+          cell.className = dict[data[offset + 1]];
+          if (data[offset + 2]) cell.setAttribute("style", dict[data[offset + 2]]);
+          if (data[offset + 4]) cell.setAttribute("scope", dict[data[offset + 4]]);
+          if (data[offset + 5]) cell.id = data[offset + 5];
+          if (data[offset + 6]) cell.setAttribute("headers", data[offset + 6]);
+          cell.textContent = data[offset];
+          tr.appendChild(cell);
+        }
+        return tr;
+      }
+
+      function spacer(height) {
+        var tr = document.createElement("tr");
+        tr.className = "rf-virtual-spacer";
+        var td = document.createElement("td");
+        td.colSpan = cellCount;
+        td.style.cssText = "padding:0;border:0;height:" + height + "px;";
+        tr.appendChild(td);
+        return tr;
+      }
+
+      function draw() {
+        scheduled = false;
+        if (!rowHeight && view.length) {
+          var probe = buildRow(view[0]);
+          tbody.textContent = "";
+          tbody.appendChild(probe);
+          rowHeight = probe.getBoundingClientRect().height || 24;
+        }
+        var bodyTop = table.offsetTop + (table.tHead ? table.tHead.offsetHeight : 0) + (table.caption ? table.caption.offsetHeight : 0);
+        var scrollTop = Math.max(0, container.scrollTop - bodyTop);
+        var first = Math.max(0, Math.floor(scrollTop / (rowHeight || 24)) - overscan);
+        var last = Math.min(view.length, first + Math.ceil(container.clientHeight / (rowHeight || 24)) + 2 * overscan);
+        var fragment = document.createDocumentFragment();
+        if (first > 0) fragment.appendChild(spacer(first * rowHeight));
+        for (var position = first; position < last; position++) {
+          fragment.appendChild(buildRow(view[position]));
+        }
+        if (last < view.length) fragment.appendChild(spacer((view.length - last) * rowHeight));
+        tbody.textContent = "";
+        tbody.appendChild(fragment);
+      }
+
+      function schedule() {
+        if (scheduled) return;
+        scheduled = true;
+        window.requestAnimationFrame(draw);
+      }
+
+      container.addEventListener("scroll", schedule);
+      window.addEventListener("resize", schedule);
+      draw();
+
+      return {
+        count: rows.length,
+        text: function (rowIdx, colIdx) {
+          var value = rows[rowIdx][2 + colIdx * 7];
+          return value === undefined ? null : String(value).trim();
+        },
+        key: function (rowIdx, colIdx) {
+          var keys = payload.keys && payload.keys[colIdx];
+          if (!keys) return null;
+          return keys[rowIdx] === null ? NaN : keys[rowIdx];
+        },
+        render: function (rowOrder, passes) {
+          view = rowOrder.filter(passes);
+          draw();
+        }
+      };
+    }
+
+    // Remote tables keep only the current page; the server pages, sorts, and filters.
+    function createRemoteSource() {
+      var endpoint = container.dataset.richframeRemote;
+      var columns = JSON.parse(container.dataset.richframeColumns || "[]");
+      var pageSize = Number(container.dataset.richframePageSize) || 100;
+      var state = { offset: 0, total: Number(container.dataset.richframeTotal) || 0, sort: null, filter: null };
+      var seenRules = new Set();
+      var ticket = 0;
+      var pager = document.createElement("div");
+      pager.className = "rf-pager";
+      pager.innerHTML = '<button type="button" data-page="prev">&lsaquo;</button>' +
+        '<span class="rf-pager-status"></span>' +
+        '<button type="button" data-page="next">&rsaquo;</button>';
+      container.appendChild(pager);
+
+      function showStatus() {
+        var text = state.total
+          ? (state.offset + 1) + "\u2013" + Math.min(state.offset + pageSize, state.total) + " of " + state.total
+          : "No rows";
+        pager.querySelector(".rf-pager-status").textContent = text;
+      }
+
+      function addRules(css) {
+        var fresh = css.split("\n").filter(function (rule) {
+          if (!rule || seenRules.has(rule)) return false;
+          seenRules.add(rule);
+          return true;
+        });
+        if (!fresh.length) return;
+        var style = document.createElement("style");
+        style.textContent = fresh.join("\n");
+        container.parentNode.insertBefore(style, container);
+      }
+
+      function load() {
+        var params = new URLSearchParams();
+        params.set("offset", state.offset);
+        params.set("limit", pageSize);
+        if (state.sort) params.set("sort", JSON.stringify([state.sort]));
+        if (state.filter) params.set("filter", JSON.stringify([state.filter]));
+        var current = ++ticket;
+        fetch(endpoint + (endpoint.indexOf("?") === -1 ? "?" : "&") + params.toString())
+          .then(function (response) {
+            if (!response.ok) throw new Error("richframe: request failed with status " + response.status);
+            return response.json();
+          })
+          .then(function (page) {
+            if (current !== ticket) return;
+            if (page.css) addRules(page.css);
+            tbody.innerHTML = page.html;
+            state.total = page.total;
+            showStatus();
+          })
+          .catch(function (error) {
+            if (window.console) console.error(error);
+          });
+      }
+
+      pager.addEventListener("click", function (event) {
+        var action = event.target.getAttribute && event.target.getAttribute("data-page");
+        if (action === "prev" && state.offset > 0) {
+          state.offset = Math.max(0, state.offset - pageSize);
+          load();
+        } else if (action === "next" && state.offset + pageSize < state.total) {
+          state.offset += pageSize;
+          load();
+        }
+      });
+      showStatus();
+
+      return {
+        remote: true,
+        count: 0,
+        text: function () { return null; },
+        key: function () { return null; },
+        render: function () {},
+        sort: function (colIdx, direction) {
+          var column = columns[colIdx];
+          state.sort = direction === "clear" || !column
+            ? null
+            : { key: column.key, axis: column.axis, ascending: direction === "asc" };
+          state.offset = 0;
+          load();
+        },
+        filter: function (colIdx, term) {
+          var column = colIdx === null ? null : columns[colIdx];
+          state.filter = term && column
+            ? { key: column.key, axis: column.axis, operator: "contains", value: term }
+            : null;
+          state.offset = 0;
+          load();
+        }
+      };
+    }
+
+    function passes(rowIdx) {
+      if (allowedValues === null && searchTerm === null) return true;
+      var text = source.text(rowIdx, filterColumn);
+      if (text === null) text = "";
+      if (searchTerm !== null) return text.toLowerCase().indexOf(searchTerm) !== -1;
+      return allowedValues.has(text);
+    }
+
+    // Menus are built on first open, from the server-side index when present.
+    function columnMenuValues(colIdx) {
+      if (menuValues[colIdx]) return menuValues[colIdx];
+      var entry = valueIndex[colIdx];
+      var column;
+      if (source.remote || (entry && entry.searchOnly)) {
+        column = { searchOnly: true, values: [], counts: [] };
+      } else if (entry) {
+        column = { searchOnly: false, values: entry.values, counts: entry.counts };
+      } else {
+        var counts = new Map();
+        for (var rowIdx = 0; rowIdx < source.count; rowIdx++) {
+          var text = source.text(rowIdx, colIdx);
+          if (text !== null) counts.set(text, (counts.get(text) || 0) + 1);
+        }
+        column = { searchOnly: false, values: Array.from(counts.keys()), counts: Array.from(counts.values()) };
+      }
+      menuValues[colIdx] = column;
+      return column;
+    }
+
+    function refresh() {
+      source.render(order, passes);
+    }
+
+    var menu = document.createElement("div");
+    menu.className = "rf-filter-menu";
+    menu.innerHTML = '' +
+      '<div class="rf-sort-actions">' +
+      '  <strong>Sort</strong>' +
+      '  <div class="rf-sort-buttons">' +
+      '    <button type="button" data-sort="asc">ASC</button>' +
+      '    <button type="button" data-sort="desc">DESC</button>' +
+      '    <button type="button" data-sort="clear">Reset</button>' +
+      '  </div>' +
+      '</div>' +
+      '<hr class="rf-divider" />' +
+      '<input class="rf-filter-search" placeholder="Search…" />' +
+      '<div class="rf-filter-options"></div>' +
+      '<div class="rf-filter-actions">' +
+      '  <button type="button" data-action="clear">Reset Filter</button>' +
+      '  <button type="button" data-action="apply">Apply Filter</button>' +
+      '</div>';
+    document.body.appendChild(menu);
+
+    var activeColumn = null;
+
+    function positionMenu(th) {
+      var rect = th.getBoundingClientRect();
+      menu.style.position = "absolute";
+      menu.style.top = (window.scrollY + rect.bottom + 4) + "px";
+      menu.style.left = (window.scrollX + rect.left) + "px";
+    }
+
+    function populateMenu(columnIdx) {
+      var column = columnMenuValues(columnIdx);
+      var optionsRoot = menu.querySelector(".rf-filter-options");
+      optionsRoot.innerHTML = "";
+      menu.querySelector(".rf-filter-search").value = "";
+      menu.dataset.searchOnly = column.searchOnly ? "1" : "";
+      if (column.searchOnly) {
+        var note = document.createElement("div");
+        note.className = "rf-filter-note";
+        note.textContent = "Too many values to list; type to filter.";
+        optionsRoot.appendChild(note);
+        return;
+      }
+      var positions = column.values.map(function (_, position) { return position; });
+      positions.sort(function (a, b) {
+        return column.values[a].localeCompare(column.values[b], undefined, { numeric: true });
+      });
+      var fragment = document.createDocumentFragment();
+      positions.forEach(function (position) {
+        var value = column.values[position];
+        var option = document.createElement("label");
+        option.className = "rf-filter-option";
+        option.dataset.value = value.toLowerCase();
+        var input = document.createElement("input");
+        input.type = "checkbox";
+        input.value = value;
+        input.checked = true;
+        var label = document.createElement("span");
+        label.textContent = value || "(empty)";
+        var count = document.createElement("span");
+        count.className = "rf-filter-count";
+        count.textContent = column.counts[position];
+        option.appendChild(input);
+        option.appendChild(label);
+        option.appendChild(count);
+        fragment.appendChild(option);
+      });
+      optionsRoot.appendChild(fragment);
+    }
+
+    function toggleMenu(th, columnIdx) {
+      if (activeColumn === columnIdx && menu.style.display === "block") {
+        menu.style.display = "none";
+        activeColumn = null;
+        return;
+      }
+      activeColumn = columnIdx;
+      populateMenu(columnIdx);
+      positionMenu(th);
+      menu.style.display = "block";
+    }
+
+    function applyFilters() {
+      if (activeColumn === null) return;
+      var checkboxes = Array.prototype.slice.call(menu.querySelectorAll('.rf-filter-options input[type="checkbox"]'));
+      var checked = checkboxes.filter(function (input) { return input.checked; }).map(function (input) {
+        return input.value.trim();
+      });
+      var allowAll = checked.length === checkboxes.length;
+      filterColumn = activeColumn;
+      if (menu.dataset.searchOnly) {
+        var term = menu.querySelector(".rf-filter-search").value.trim().toLowerCase();
+        searchTerm = term ? term : null;
+        allowedValues = null;
+        if (source.remote) {
+          source.filter(filterColumn, searchTerm);
+          return;
+        }
+      } else {
+        searchTerm = null;
+        allowedValues = allowAll ? null : new Set(checked);
+      }
+      refresh();
+    }
+
+    // Sort keys are read once per column and reused until the body changes.
+    var sortCache = {};
+
+    container.addEventListener("richframe:updated", function () {
+      sortCache = {};
+      menuValues = {};
+      valueIndex = [];
+      if (!source.reload) return;
+      source.reload();
+      order = [];
+      for (var rowIdx = 0; rowIdx < source.count; rowIdx++) {
+        order.push(rowIdx);
+      }
+    });
+
+    function sortKeys(colIdx) {
+      if (sortCache[colIdx]) return sortCache[colIdx];
+      var values = new Array(source.count);
+      var numeric = true;
+      for (var rowIdx = 0; rowIdx < source.count; rowIdx++) {
+        var key = source.key(rowIdx, colIdx);
+        if (key === null) {
+          numeric = false;
+          break;
+        }
+        values[rowIdx] = key;
+      }
+      if (!numeric) {
+        for (rowIdx = 0; rowIdx < source.count; rowIdx++) {
+          values[rowIdx] = source.text(rowIdx, colIdx) || "";
+        }
+      }
+      sortCache[colIdx] = { numeric: numeric, values: values };
+      return sortCache[colIdx];
+    }
+
+    function sortRows(columnIdx, direction) {
+      if (source.remote) {
+        source.sort(columnIdx, direction);
+        return;
+      }
+      if (direction === "clear") {
+        order.sort(function (a, b) { return a - b; });
+        refresh();
+        return;
+      }
+      var keys = sortKeys(columnIdx);
+      var values = keys.values;
+      var sign = direction === "asc" ? 1 : -1;
+      if (keys.numeric) {
+        order.sort(function (a, b) {
+          var aValue = values[a];
+          var bValue = values[b];
+          var aMissing = aValue !== aValue;
+          var bMissing = bValue !== bValue;
+          if (aMissing || bMissing) return aMissing === bMissing ? a - b : (aMissing ? 1 : -1);
+          if (aValue === bValue) return a - b;
+          return aValue < bValue ? -sign : sign;
+        });
+      } else {
+        var collator = new Intl.Collator(undefined, { numeric: true, sensitivity: "base" });
+        order.sort(function (a, b) {
+          return sign * collator.compare(values[a], values[b]) || a - b;
+        });
+      }
+      refresh();
+    }
+
+    headers.forEach(function (th, idx) {
+      var icon = document.createElement("button");
+      icon.type = "button";
+      icon.className = "rf-filter-icon";
+      icon.innerHTML = '<span class="rf-filter-box">▼</span>';
+      icon.addEventListener("click", function (event) {
+        event.stopPropagation();
+        toggleMenu(th, idx);
+      });
+      th.appendChild(icon);
+    });
+
+    document.addEventListener("click", function (event) {
+      if (!menu.contains(event.target)) {
+        menu.style.display = "none";
+        activeColumn = null;
+      }
+    });
+
+    menu.querySelector(".rf-filter-search").addEventListener("input", function (event) {
+      var term = event.target.value.toLowerCase();
+      Array.prototype.forEach.call(menu.querySelectorAll(".rf-filter-option"), function (option) {
+        option.style.display = option.dataset.value.indexOf(term) !== -1 ? "" : "none";
+      });
+    });
+
+    menu.querySelector('[data-action="clear"]').addEventListener("click", function () {
+      allowedValues = null;
+      searchTerm = null;
+      if (source.remote) {
+        source.filter(null, null);
+      } else {
+        refresh();
+      }
+      menu.style.display = "none";
+      activeColumn = null;
+    });
+
+    menu.querySelector('[data-action="apply"]').addEventListener("click", function () {
+      applyFilters();
+      menu.style.display = "none";
+    });
+
+    Array.prototype.forEach.call(menu.querySelectorAll("[data-sort]"), function (button) {
+      button.addEventListener("click", function (event) {
+        event.stopPropagation();
+        if (activeColumn === null) activeColumn = 0;
+        sortRows(activeColumn, button.dataset.sort);
+        menu.style.display = "none";
+      });
+    });
+  }
+
+  function initResizable(container) {
+    if (container.dataset.rfResizeReady) return;
+    container.dataset.rfResizeReady = "1";
+    var table = container.querySelector("table");
+    if (!table || !table.tHead || !table.tBodies.length) return;
+    if (!document.getElementById("rf-resize-style")) {
+      var style = document.createElement("style");
+      style.id = "rf-resize-style";
+      style.textContent = [
+        ".rf-resize-handle{position:absolute;top:0;right:0;width:8px;margin-right:-4px;height:100%;cursor:col-resize;}",
+        ".rf-resize-handle:hover{background:rgba(17,23,42,0.15);}",
+        ".rf-resize-active{user-select:none;}"
+      ].join("");
+      document.head.appendChild(style);
+    }
+
+    var headerRows = Array.prototype.slice.call(table.tHead.rows);
+    if (!headerRows.length) return;
+
+    var columnCells = [];
+    headerRows.forEach(function (row) {
+      var position = 0;
+      Array.prototype.forEach.call(row.cells, function (cell) {
+        var span = cell.colSpan || 1;
+        for (var i = 0; i < span; i++) {
+          var index = position + i;
+          if (!columnCells[index]) columnCells[index] = [];
+          if (columnCells[index].indexOf(cell) === -1) {
+            columnCells[index].push(cell);
+          }
+        }
+        position += span;
+      });
+    });
+
+    var lastHeaderRow = headerRows[headerRows.length - 1];
+    var columnIndex = 0;
+    Array.prototype.forEach.call(lastHeaderRow.cells, function (cell) {
+      var span = cell.colSpan || 1;
+      if (span === 1) {
+        installHandle(cell, columnIndex);
+      }
+      columnIndex += span;
+    });
+
+    function installHandle(cell, columnIndex) {
+      if (!cell.style.position) {
+        cell.style.position = "relative";
+      }
+      var handle = document.createElement("div");
+      handle.className = "rf-resize-handle";
+      cell.appendChild(handle);
+
+      handle.addEventListener("mousedown", function (event) {
+        event.preventDefault();
+        var rect = cell.getBoundingClientRect();
+        var leftEdge = rect.left;
+        container.classList.add("rf-resize-active");
+        var previousCursor = document.body.style.cursor;
+        document.body.style.cursor = "col-resize";
+
+        function onMove(moveEvent) {
+          var newRight = moveEvent.clientX;
+          var newWidth = Math.max(60, newRight - leftEdge);
+          applyWidth(columnIndex, newWidth);
+        }
+
+        function onUp() {
+          document.removeEventListener("mousemove", onMove);
+          document.removeEventListener("mouseup", onUp);
+          container.classList.remove("rf-resize-active");
+          document.body.style.cursor = previousCursor || "";
+        }
+
+        document.addEventListener("mousemove", onMove);
+        document.addEventListener("mouseup", onUp);
+      });
+    }
+
+    function applyWidth(index, width) {
+      var widthPx = width + "px";
+      var uniqueHeaderCells = columnCells[index] ? Array.from(new Set(columnCells[index])) : [];
+      uniqueHeaderCells.forEach(function (cell) {
+        cell.style.width = widthPx;
+        cell.style.minWidth = widthPx;
+      });
+      Array.prototype.forEach.call(table.tBodies, function (body) {
+        Array.prototype.forEach.call(body.rows, function (row) {
+          var cell = row.cells[index];
+          if (cell) {
+            cell.style.width = widthPx;
+            cell.style.minWidth = widthPx;
+          }
+        });
+      });
+    }
+  }
+
+  function selectorValue(value) {
+    var text = String(value);
+    return window.CSS && CSS.escape ? CSS.escape(text) : text.replace(/["\\]/g, "\\$&");
+  }
+
+  function findRow(tbody, key) {
+    return tbody.querySelector('tr[data-rf-key="' + selectorValue(key) + '"]');
+  }
+
+  function parseRow(html) {
+    var scratch = document.createElement("tbody");
+    scratch.innerHTML = html;
+    return scratch.querySelector("tr");
+  }
+
+  function setAttributes(element, patch) {
+    if (patch["class"] !== undefined) element.className = patch["class"];
+    if (patch.style === undefined) return;
+    if (patch.style) {
+      element.setAttribute("style", patch.style);
+    } else {
+      element.removeAttribute("style");
+    }
+  }
+
+  richframe.applyPatches = function (target, patches) {
+    var container = typeof target === "string" ? document.getElementById(target) : target;
+    if (!container) return;
+    var table = container.querySelector("table");
+    if (!table || !table.tBodies.length) return;
+    var tbody = table.tBodies[0];
+    patches.forEach(function (patch) {
+      var row;
+      switch (patch.op) {
+        case "style":
+          var style = document.createElement("style");
+          style.textContent = patch.css;
+          container.parentNode.insertBefore(style, container);
+          break;
+        case "cell":
+          row = findRow(tbody, patch.row);
+          var cell = row && row.querySelector('[data-rf-col="' + selectorValue(patch.column) + '"]');
+          if (!cell) break;
+          cell.textContent = patch.text;
+          setAttributes(cell, patch);
+          if (patch.key === null || patch.key === undefined) {
+            cell.removeAttribute("data-v");
+          } else {
+            cell.setAttribute("data-v", patch.key);
+          }
+          break;
+        case "row":
+          row = findRow(tbody, patch.row);
+          if (row) setAttributes(row, patch);
+          break;
+        case "remove":
+          row = findRow(tbody, patch.row);
+          if (row) tbody.removeChild(row);
+          break;
+        case "insert":
+          var before = patch.before === null ? null : findRow(tbody, patch.before);
+          tbody.insertBefore(parseRow(patch.html), before);
+          break;
+        case "replace":
+          row = findRow(tbody, patch.row);
+          if (row) tbody.replaceChild(parseRow(patch.html), row);
+          break;
+        case "order":
+          var fragment = document.createDocumentFragment();
+          patch.rows.forEach(function (key) {
+            var match = findRow(tbody, key);
+            if (match) fragment.appendChild(match);
+          });
+          tbody.appendChild(fragment);
+          break;
+        case "body":
+          tbody.innerHTML = patch.html;
+          break;
+      }
+    });
+    container.dispatchEvent(new CustomEvent("richframe:updated"));
+  };
+
+  richframe.init = function (target) {
+    var container = typeof target === "string" ? document.getElementById(target) : target;
+    if (!container) return;
+    if (container.dataset.richframeInteractive) initInteractive(container);
+    if (container.dataset.richframeResizable) initResizable(container);
+  };
+})();
@@ -4,15 +4,25 @@ from datetime import date
 from decimal import Decimal
 
 import math
+import warnings
+import numpy as np
+import pandas as pd
 import pytest
 
 from richframe.format import (
     CurrencyFormatter,
     DateFormatter,
+    DurationFormatter,
     FormatContext,
+    IntervalFormatter,
     NumberFormatter,
+    PatternFormatter,
     PercentageFormatter,
+    PeriodFormatter,
+    resolve_formatter,
+    warm_locales,
 )
+from richframe.io.pandas_adapter import dataframe_to_table
 
 
 def test_number_formatter_default_precision() -> None:
@@ -75,8 +85,262 @@ def test_number_formatter_locale_separators() -> None:
     assert "\u202f" in result or "\xa0" in result
 
 
+def test_locale_data_is_resolved_once_per_locale_and_pattern(monkeypatch) -> None:
+    babel_dates = pytest.importorskip("babel.dates")
+    from richframe.format import locales
+
+    locales.number_symbols.cache_clear()
+    locales.date_pattern.cache_clear()
+    parsed: list[str] = []
+    parse_pattern = locales.parse_pattern
+    monkeypatch.setattr(locales, "parse_pattern", lambda pattern: parsed.append(str(pattern)) or parse_pattern(pattern))
+    warm_locales(["de_DE"], patterns=("medium", "dd.MM.yyyy"))
+    parsed_on_warm_up = len(parsed)
+
+    context = FormatContext(column_id="when", locale="de_DE")
+    values = [date(2024, 1, day) for day in range(1, 11)]
+    for formatter in (DateFormatter(), DateFormatter()):
+        texts = [formatter(value, context) for value in values]
+        assert texts == [babel_dates.format_datetime(value, format="medium", locale="de_DE") for value in values]
+    assert DateFormatter("dd.MM.yyyy")(values[0], context) == "01.01.2024"
+    assert NumberFormatter(precision=2)(1234.5, context) == "1.234,50"
+
+    assert len(parsed) == parsed_on_warm_up
+    assert locales.number_symbols.cache_info().misses == 1
+    assert locales.date_pattern.cache_info().misses == 2
+
+
+def test_number_formatter_rounds_decimal_ties_half_up() -> None:
+    formatter = NumberFormatter()
+    context = FormatContext(column_id="value")
+
+    # 2.675 and 1.005 are stored just below the tie, -0.125 exactly on it.
+    assert [formatter(value, context) for value in (2.675, 1.005, -0.125, 0.125 + 1e-12)] == [
+        "2.68",
+        "1.01",
+        "-0.13",
+        "0.13",
+    ]
+    assert formatter(12345678901234567, context) == "12,345,678,901,234,567.00"
+    # Large floats keep rounding their shortest repr, not their binary expansion.
+    assert formatter(1e15 + 0.25, context) == "1,000,000,000,000,000.20"
+
+
+def test_number_formatter_swapped_separators() -> None:
+    formatter = NumberFormatter(thousands=".", decimal=",")
+
+    assert formatter(1234567.891, FormatContext(column_id="value")) == "1.234.567,89"
+
+
 def test_number_formatter_preserves_non_numeric_values() -> None:
     formatter = NumberFormatter()
     context = FormatContext(column_id="value")
 
     assert formatter("n/a", context) == "n/a"
+
+
+def test_low_cardinality_columns_are_formatted_once_per_value(monkeypatch) -> None:
+    frame = pd.DataFrame(
+        {
+            "price": [9.99, 19.5, 9.99, None, 19.5, 9.99],
+            "zero": [0.0, -0.0, 0.0, 1.0, 0.0, 1.0],
+            "status": pd.Categorical(["ok", "late", "ok", "ok", "late", "ok"]),
+        }
+    )
+    calls: list[object] = []
+    original = NumberFormatter.__call__
+
+    def counting(self, value, context):
+        calls.append(value)
+        return original(self, value, context)
+
+    monkeypatch.setattr(NumberFormatter, "__call__", counting)
+
+    table = dataframe_to_table(frame, include_index=False)
+    texts = [[cell.text for cell in row.cells] for row in table.body_rows]
+
+    assert [row[0] for row in texts] == ["9.99", "19.50", "9.99", "", "19.50", "9.99"]
+    assert [row[2] for row in texts] == ["ok", "late", "ok", "ok", "late", "ok"]
+    # Each distinct price is formatted once; -0.0 keeps "zero" on the per-cell path.
+    assert len([value for value in calls if value is not None and value in (9.99, 19.5)]) == 2
+    assert [row[1] for row in texts] == ["0.00", "-0.00", "0.00", "1.00", "0.00", "1.00"]
+    assert table.body_rows[0].cells[0].text is table.body_rows[2].cells[0].text
+
+
+def test_datetime_columns_are_formatted_in_bulk(monkeypatch) -> None:
+    stamps = pd.DatetimeIndex(
+        ["2024-01-02 03:04:05", None, "2024-01-02 03:04:05.25", "2024-06-30 23:59:59.000000007"],
+        name="when",
+    )
+    frame = pd.DataFrame(
+        {"local": stamps.tz_localize("Europe/Paris"), "value": [1, 2, 3, 4]},
+        index=stamps,
+    )
+    monkeypatch.setattr(DateFormatter, "__call__", lambda *args: pytest.fail("formatted per cell"))
+
+    table = dataframe_to_table(frame)
+    texts = [[cell.text for cell in row.cells] for row in table.body_rows]
+
+    assert [row[0] for row in texts] == [
+        "2024-01-02T03:04:05",
+        "",
+        "2024-01-02T03:04:05.250000",
+        "2024-06-30T23:59:59.000000007",
+    ]
+    assert [row[1] for row in texts] == [
+        "2024-01-02T03:04:05+01:00",
+        "",
+        "2024-01-02T03:04:05.250000+01:00",
+        "2024-06-30T23:59:59.000000007+02:00",
+    ]
+
+
+def test_date_formatter_treats_nat_as_missing() -> None:
+    context = FormatContext(column_id="when")
+
+    assert DateFormatter()(pd.NaT, context) == ""
+
+
+@pytest.mark.parametrize(
+    ("pattern", "values", "expected"),
+    [
+        ("#,##0.00", [1234.567, -1234.567, 0, None], ["1,234.57", "-1,234.57", "0.00", ""]),
+        ("0.0%", [0.1234, 0.0115, -0.5], ["12.3%", "1.2%", "-50.0%"]),
+        ("$#,##0;($#,##0)", [1234.5, -1234.5], ["$1,235", "($1,235)"]),
+        ('#,##0;(#,##0);"-";"<"@">"', [5, -5, 0, "n/a"], ["5", "(5)", "-", "<n/a>"]),
+        ('#,##0.0,,"M"', [1234567890], ["1,234.6M"]),
+        ("#.0#", [0.5, 1.256], [".5", "1.26"]),
+        (",.2f", [1234.567, "text"], ["1,234.57", "text"]),
+        ("{:+.1%}", [0.1234], ["+12.3%"]),
+    ],
+)
+def test_pattern_formatter(pattern: str, values: list[object], expected: list[str]) -> None:
+    formatter = resolve_formatter(pattern)
+    context = FormatContext(column_id="value")
+
+    assert isinstance(formatter, PatternFormatter)
+    assert [formatter(value, context) for value in values] == expected
+
+
+def test_pattern_formatters_compile_once_and_format_columns_in_bulk(monkeypatch) -> None:
+    assert resolve_formatter("#,##0.00")._compiled is PatternFormatter("#,##0.00")._compiled
+    with pytest.raises(KeyError, match="number pattern"):
+        resolve_formatter("fancy")
+
+    frame = pd.DataFrame({"amount": [1500.0, -20.0, None, 1500.0], "share": [0.25, 0.5, 0.125, None]})
+    monkeypatch.setattr(PatternFormatter, "__call__", lambda *args: pytest.fail("formatted per cell"))
+
+    table = dataframe_to_table(frame, include_index=False, formatters={"amount": "$#,##0;($#,##0)", "share": "0.0%"})
+
+    assert [[cell.text for cell in row.cells] for row in table.body_rows] == [
+        ["$1,500", "25.0%"],
+        ["($20)", "50.0%"],
+        ["", "12.5%"],
+        ["$1,500", ""],
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["#,##0.00", "0.0%", "$#,##0;($#,##0)", "#,##0,"])
+def test_pattern_format_column_matches_per_cell_formatting_for_non_finite_values(pattern: str) -> None:
+    formatter = PatternFormatter(pattern)
+    context = FormatContext(column_id="value")
+    values = pd.Series([1.5, np.inf, -np.inf, np.nan, -2.25, 0.0])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        texts = formatter.format_column(values, context)
+
+    assert list(texts) == [formatter(value, context) for value in values]
+
+
+def test_format_column_hooks_fall_back_to_per_cell_formatting() -> None:
+    class Tagged:
+        def __call__(self, value, context):
+            return f"<{value}>"
+
+        def format_column(self, values, context):
+            if not pd.api.types.is_integer_dtype(values.dtype):
+                return None
+            return [None if value < 0 else f"#{value}" for value in values]
+
+    class Broken(Tagged):
+        def format_column(self, values, context):
+            raise ZeroDivisionError("broken hook")
+
+    frame = pd.DataFrame({"count": [1, -2, 3], "ratio": [0.5, 1.5, 2.5]})
+
+    table = dataframe_to_table(frame, include_index=False, formatters={"count": Tagged(), "ratio": Tagged()})
+
+    assert [[cell.text for cell in row.cells] for row in table.body_rows] == [
+        ["#1", "<0.5>"],
+        ["<-2>", "<1.5>"],
+        ["#3", "<2.5>"],
+    ]
+    with pytest.raises(ZeroDivisionError, match="broken hook"):
+        dataframe_to_table(frame, include_index=False, formatters={"count": Broken()})
+
+
+def test_formatter_subclasses_are_not_formatted_by_value() -> None:
+    class RowLabel(NumberFormatter):
+        def __call__(self, value, context):
+            return f"{value}@{context.row_index}"
+
+    frame = pd.DataFrame({"value": [1, 1, 1, 1]}, index=[10, 11, 12, 13])
+
+    table = dataframe_to_table(frame, formatters={"value": RowLabel()})
+
+    assert [row.cells[1].text for row in table.body_rows] == ["1@10", "1@11", "1@12", "1@13"]
+
+
+def test_duration_period_and_interval_columns_get_bulk_formatters(monkeypatch) -> None:
+    frame = pd.DataFrame(
+        {
+            "took": pd.to_timedelta(["1 days 02:03:04.6", None, "-00:05:00", "50:00:00"]),
+            "month": pd.PeriodIndex(["2024-01", "2024-02", None, "2024-04"], freq="M"),
+            "band": pd.arrays.IntervalArray.from_breaks([0, 1.5, 3, 4.5, 6]),
+            "bin": pd.cut([1, 5, 7, 2], [0, 3, 6, 10]),
+        }
+    )
+    for formatter in (DurationFormatter, PeriodFormatter, IntervalFormatter):
+        monkeypatch.setattr(formatter, "__call__", lambda *args: pytest.fail("formatted per cell"))
+
+    table = dataframe_to_table(frame, include_index=False, formatters={"month": PeriodFormatter("%b %Y")})
+    texts = [[cell.text for cell in row.cells] for row in table.body_rows]
+
+    assert [row[0] for row in texts] == ["1d 02:03:05", "", "-00:05:00", "2d 02:00:00"]
+    assert [row[1] for row in texts] == ["Jan 2024", "Feb 2024", "", "Apr 2024"]
+    assert [row[2] for row in texts] == ["(0, 1.5]", "(1.5, 3]", "(3, 4.5]", "(4.5, 6]"]
+    assert [row[3] for row in texts] == ["(0, 3]", "(3, 6]", "(6, 10]", "(0, 3]"]
+
+
+def test_duration_formatter_options() -> None:
+    context = FormatContext(column_id="took")
+    value = pd.Timedelta("2 days 01:02:03.4567")
+
+    assert DurationFormatter(precision=3)(value, context) == "2d 01:02:03.457"
+    assert DurationFormatter(days=False)(value, context) == "49:02:03"
+    assert IntervalFormatter()(pd.Interval(0.5, 2, closed="left"), context) == "[0.5, 2)"
+    assert DurationFormatter()(pd.NaT, context) == ""
+    assert DurationFormatter()(pd.Timedelta(milliseconds=-400), context) == "00:00:00"
+    assert DurationFormatter(precision=1)(pd.Timedelta(milliseconds=-400), context) == "-00:00:00.4"
+
+
+def test_parallel_column_formatting_matches_serial(monkeypatch) -> None:
+    monkeypatch.setattr("richframe.io.pandas_adapter._MIN_CELLS_PER_FORMAT_WORKER", 1)
+    frame = pd.DataFrame(
+        {
+            "price": [1234.5, -20.0, None, 0.125],
+            "share": [0.25, 0.5, 0.125, None],
+            "when": pd.to_datetime(["2024-01-01 00:00", None, "2024-03-01 12:30", "2024-04-01 00:00"]),
+            "label": ["a", None, "c", 4],
+        },
+        index=pd.Index([10, 20, 30, 40], name="id"),
+    )
+    options = dict(formatters={"price": "$#,##0.00;($#,##0.00)", "share": PercentageFormatter()}, locale="en_US")
+
+    serial = dataframe_to_table(frame, **options)
+    parallel = dataframe_to_table(frame, format_workers=2, **options)
+
+    assert [[cell.text for cell in row.cells] for row in parallel.body_rows] == [
+        [cell.text for cell in row.cells] for row in serial.body_rows
+    ]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+
+from richframe import ColorScalePlugin, build_table, diff_table, to_html
+
+
+def _frame(values: list[int], index: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({"value": values}, index=pd.Index(index, name="key"))
+
+
+def test_live_updates_emit_row_and_cell_keys() -> None:
+    html = to_html(_frame([1, 2], ["a", "b"]), live_updates=True)
+
+    assert 'data-richframe-live="true"' in html
+    assert 'data-rf-key="a"' in html and 'data-rf-key="b"' in html
+    assert 'data-rf-col="value"' in html
+    assert "richframe.applyPatches" in html
+
+
+def test_diff_table_emits_only_changed_cells() -> None:
+    previous = build_table(_frame([1, 2, 3], ["a", "b", "c"]), live_updates=True)
+
+    diff = diff_table(previous, _frame([1, 5, 3], ["a", "b", "c"]))
+
+    assert [patch.to_dict() for patch in diff.patches] == [
+        {
+            "op": "cell",
+            "row": "b",
+            "column": "value",
+            "text": "5.00",
+            "class": "richframe-cell richframe-cell--body",
+            "style": None,
+        }
+    ]
+    assert diff_table(diff.table, _frame([1, 5, 3], ["a", "b", "c"])).patches == ()
+
+
+def test_diff_table_handles_inserted_removed_and_reordered_rows() -> None:
+    previous = build_table(_frame([1, 2, 3], ["a", "b", "c"]), live_updates=True)
+
+    diff = diff_table(previous, _frame([3, 1, 4], ["c", "a", "d"]))
+    patches = json.loads(diff.to_json())
+
+    assert {"op": "remove", "row": "b"} in patches
+    insert = next(patch for patch in patches if patch["op"] == "insert")
+    assert insert["row"] == "d" and insert["before"] is None
+    assert insert["html"].startswith('<tr data-rf-key="d"')
+    assert patches[-1] == {"op": "order", "rows": ["c", "a", "d"]}
+
+
+def test_diff_table_ships_rules_for_new_styles_only() -> None:
+    plugins = [ColorScalePlugin("value")]
+    previous = build_table(_frame([1, 2, 3], ["a", "b", "c"]), plugins=plugins, live_updates=True)
+
+    diff = diff_table(previous, _frame([1, 2, 4], ["a", "b", "c"]), plugins=plugins)
+
+    style_patch = diff.patches[0].to_dict()
+    assert style_patch["op"] == "style"
+    assert style_patch["css"].count("{") == 1  # only the new mid-scale colour
+    assert [(patch.op, patch.row) for patch in diff.patches[1:]] == [("cell", "b"), ("cell", "c")]
+
+
+def test_diff_table_rejects_column_changes() -> None:
+    previous = build_table(_frame([1], ["a"]), live_updates=True)
+
+    with pytest.raises(ValueError):
+        diff_table(previous, pd.DataFrame({"other": [1]}, index=pd.Index(["a"], name="key")))
+
+
+def test_diff_table_updates_sort_keys_of_interactive_tables() -> None:
+    previous = build_table(_frame([1, 2], ["a", "b"]), live_updates=True, interactive_controls=True)
+
+    diff = diff_table(previous, _frame([1, 7.5], ["a", "b"]), interactive_controls=True)
+
+    assert diff.patches[0].to_dict()["key"] == "7.5"
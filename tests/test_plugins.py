@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import re
+import warnings
+from dataclasses import replace
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from richframe import (
     ColorScalePlugin,
     DataBarPlugin,
+    IconBins,
     IconRule,
     IconSetPlugin,
     conditional_format,
     to_html,
 )
+from richframe.core import ColumnStats, TableStats, numeric_array, table_stats
+from richframe.io.pandas_adapter import dataframe_to_table
+from richframe.plugins import CellPlugin, ColumnPlugin, ColumnResult, PluginBase, base
 
 
 def test_color_scale_plugin_applies_gradient() -> None:
@@ -20,6 +30,31 @@ def test_color_scale_plugin_applies_gradient() -> None:
     assert "background-color: #1d4ed8" in html
 
 
+@pytest.mark.parametrize("steps", [None, 3])
+def test_color_scale_clamps_infinite_values_to_the_end_colors(steps) -> None:
+    frame = pd.DataFrame({"x": [1.0, np.inf, 3.0, -np.inf, 2.0]})
+    plugin = ColorScalePlugin("x", palette=("#000000", "#ffffff"), steps=steps, text_contrast=False)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        html = to_html(frame, theme=None, include_index=False, inline_styles=True, plugins=[plugin])
+    colors = re.findall(r"background-color: (#[0-9a-f]{6})", html)
+
+    assert colors == ["#000000", "#ffffff", "#ffffff", "#000000", "#808080"]
+
+
+def test_color_scale_steps_bound_the_number_of_styles() -> None:
+    frame = pd.DataFrame({"score": np.linspace(0.0, 100.0, 1000)})
+    plugin = ColorScalePlugin("score", palette=("#ff0000", "#ffffff", "#0000ff"), steps=5, text_contrast=False)
+
+    html = to_html(frame, theme=None, include_index=False, plugins=[plugin])
+    backgrounds = set(re.findall(r"background-color: (#[0-9a-f]{6})", html))
+
+    assert backgrounds == {"#ff0000", "#ff8080", "#ffffff", "#8080ff", "#0000ff"}
+    cell_classes = set(re.findall(r'<td headers="[^"]*" class="([^"]+)"', html))
+    assert 1 < len(cell_classes) <= 5
+
+
 def test_data_bar_plugin_renders_linear_gradient() -> None:
     frame = pd.DataFrame({"amount": [5, 15, 30]})
 
@@ -28,6 +63,38 @@ def test_data_bar_plugin_renders_linear_gradient() -> None:
     assert "linear-gradient(90deg" in html
 
 
+def test_data_bar_variable_mode_shares_one_style() -> None:
+    frame = pd.DataFrame({"amount": np.arange(200.0)})
+
+    html = to_html(frame, theme=None, include_index=False, plugins=[DataBarPlugin("amount", mode="variable")])
+    cells = re.findall(r'<td headers="[^"]*" class="([^"]+)"(?: style="([^"]*)")?', html)
+
+    assert len({class_attr for class_attr, _ in cells}) == 1
+    assert cells[0][1] == "--rf-bar: 0.00%"
+    assert cells[-1][1] == "--rf-bar: 100.00%"
+    assert html.count("var(--rf-bar)") == 2
+    assert "linear-gradient(90deg, #2563eb 50" not in html
+
+
+def test_plugins_rescan_columns_after_rows_are_dropped() -> None:
+    class KeepFirstRows(PluginBase):
+        def after_format(self, table):
+            return replace(table, body_rows=table.body_rows[:2])
+
+    frame = pd.DataFrame({"amount": [1, 2, 300]})
+
+    html = to_html(
+        frame,
+        theme=None,
+        include_index=False,
+        plugins=[KeepFirstRows(), ColorScalePlugin("amount", text_contrast=False), DataBarPlugin("amount", mode="variable")],
+    )
+    cells = re.findall(r'<td headers="[^"]*" class="([^"]+)"(?: style="([^"]*)")?', html)
+
+    assert [style for _, style in cells] == ["--rf-bar: 0.00%", "--rf-bar: 100.00%"]
+    assert len({class_attr for class_attr, _ in cells}) == 2
+
+
 def test_icon_set_plugin_prefixes_text() -> None:
     frame = pd.DataFrame({"trend": [0.2, -0.1]})
     plugin = IconSetPlugin(
@@ -54,3 +121,212 @@ def test_conditional_formatting_rules_apply_styles() -> None:
     html = to_html(frame, inline_styles=True, theme="light", plugins=[rules])
 
     assert "background-color: #fee2e2" in html
+
+
+def test_conditional_format_vectorized_rules() -> None:
+    frame = pd.DataFrame({"price": [5.0, 12.0, None, 30.0], "status": ["ok", "late", "ok", "lost"]})
+    calls: list[str] = []
+
+    def expensive(series: pd.Series) -> pd.Series:
+        calls.append(series.name)
+        return series > 20
+
+    rules = (
+        conditional_format()
+        .when(column="price", op="between", value=10, upper=20)
+        .style(color="#2563eb")
+        .when(column="price", mask=expensive)
+        .style(font_weight="700")
+        .when(column="status", op="in", value=["late", "lost"])
+        .style(background_color="#fee2e2")
+    )
+    table = rules.before_render(dataframe_to_table(frame, include_index=False))
+    styles = [
+        [dict(cell.style.properties) if cell.style else {} for cell in row.cells] for row in table.body_rows
+    ]
+
+    assert calls == ["price"]
+    assert styles[0] == [{}, {}]
+    assert styles[1] == [{"color": "#2563eb"}, {"background-color": "#fee2e2"}]
+    assert styles[2] == [{}, {}]
+    assert styles[3] == [{"font-weight": "700"}, {"background-color": "#fee2e2"}]
+
+
+def test_icon_set_bins_assign_icons_per_bucket() -> None:
+    frame = pd.DataFrame({"trend": [-0.5, 0.0, 0.02, None, 0.3]})
+    bins = IconBins(
+        edges=[-0.01, 0.01],
+        icons=["▼", "", "▲"],
+        styles=[{"color": "#dc2626"}, None, {"color": "#16a34a"}],
+    )
+
+    table = IconSetPlugin("trend", bins).before_render(dataframe_to_table(frame, include_index=False))
+    cells = [row.cells[0] for row in table.body_rows]
+
+    assert [cell.text.split(" ")[0] for cell in cells] == ["▼", "0.00", "▲", "", "▲"]
+    assert dict(cells[0].style.properties)["color"] == "#dc2626"
+    assert cells[2].style is cells[4].style
+    assert cells[1].style is None and cells[3].style is None
+
+
+def test_cell_plugins_are_fused_into_one_traversal(monkeypatch) -> None:
+    frame = pd.DataFrame({"score": [10, 20, 30], "delta": [-1.0, 0.5, 2.0]})
+    plugins = [
+        ColorScalePlugin("score"),
+        DataBarPlugin("delta"),
+        conditional_format().when(column="delta", predicate=lambda value: value < 0).style(color="#dc2626"),
+    ]
+    # A plain plugin between cell plugins forces them to run one at a time.
+    sequential = to_html(frame, plugins=[plugins[0], PluginBase(), plugins[1], PluginBase(), plugins[2]])
+    traversals: list[int] = []
+    original = base.dispatch_body_cells
+
+    def counting(table, targets):
+        traversals.append(1)
+        return original(table, targets)
+
+    monkeypatch.setattr(base, "dispatch_body_cells", counting)
+
+    fused = to_html(frame, plugins=plugins)
+
+    assert len(traversals) == 1
+    assert _strip_ids(fused) == _strip_ids(sequential)
+
+
+def test_cell_plugins_only_visit_their_columns() -> None:
+    frame = pd.DataFrame({f"c{index}": range(4) for index in range(50)})
+    table = dataframe_to_table(frame, include_index=False)
+    visited: list[str | None] = []
+
+    class Highlight(CellPlugin):
+        columns = ("c7",)
+
+        def prepare(self, table):
+            def mapper(cell, row_index, cell_index):
+                visited.append(cell.column_id)
+                if cell.value < 2:
+                    return cell
+                return base.merge_cell_style(cell, {"color": "red"})
+
+            return mapper
+
+    result = Highlight().before_render(table)
+
+    assert visited == ["c7"] * 4
+    assert result.body_rows[0] is table.body_rows[0]
+    assert result.body_rows[3] is not table.body_rows[3]
+    assert result.body_rows[3].cells[6] is table.body_rows[3].cells[6]
+    assert dict(result.body_rows[3].cells[7].style.properties)["color"] == "red"
+
+
+def test_plugin_base_classes_require_their_hooks() -> None:
+    class Incomplete(CellPlugin):
+        columns = ("c0",)
+
+    class NoTransform(ColumnPlugin):
+        pass
+
+    with pytest.raises(TypeError, match="prepare"):
+        Incomplete()
+    with pytest.raises(TypeError, match="transform"):
+        NoTransform("c0")
+
+
+def test_column_stats_summarise_source_columns() -> None:
+    frame = pd.DataFrame(
+        {
+            "price": pd.array([4, None, 1, 4, 10], dtype="Int64"),
+            "label": ["a", "b", None, "a", "c"],
+        }
+    )
+    table = dataframe_to_table(frame)
+    stats = table_stats(table)
+
+    price = stats.column("price")
+    assert (price.count, price.null_count, price.distinct_count) == (4, 1, 3)
+    assert (price.minimum, price.maximum, price.mean) == (1.0, 10.0, 4.75)
+    assert price.quantile(0.5) == 4.0
+    assert price.quantiles([0.0, 1.0]) == (1.0, 10.0)
+    label = stats.column("label")
+    assert (label.count, label.null_count, label.distinct_count, label.minimum) == (0, 1, 3, None)
+    assert stats.combined(["price", "price"]) is price
+    # Plain sequences of cell values give the same summary.
+    assert ColumnStats.from_values([4, None, 1, 4, 10]).to_dict() == price.to_dict()
+    infinite = ColumnStats.from_values([np.inf, 1.0, np.inf, -np.inf, -np.inf])
+    assert (infinite.distinct_count, infinite.minimum, infinite.maximum) == (3, -np.inf, np.inf)
+    mixed = numeric_array(np.array([1, "x", None, 2.5], dtype=object))
+    np.testing.assert_array_equal(mixed, [1.0, np.nan, np.nan, 2.5])
+
+
+def test_stacked_plugins_share_one_stats_pass(monkeypatch) -> None:
+    frame = pd.DataFrame({"score": [3.0, 1.0, 2.0]})
+    computed: list[int] = []
+    original = ColumnStats.from_values.__func__
+
+    def counting(cls, values):
+        computed.append(1)
+        return original(cls, values)
+
+    monkeypatch.setattr(ColumnStats, "from_values", classmethod(counting))
+
+    to_html(
+        frame,
+        plugins=[
+            ColorScalePlugin("score"),
+            DataBarPlugin("score"),
+            IconSetPlugin("score", [IconRule(lambda value: value > 2, "▲")]),
+        ],
+    )
+
+    assert len(computed) == 1
+
+
+def test_column_plugin_applies_array_results_in_bulk() -> None:
+    frame = pd.DataFrame({"change": [1.5, -2.0, None, 0.0], "name": list("abcd")})
+    seen: list[tuple[str, list[bool]]] = []
+
+    class Sign(ColumnPlugin):
+        def transform(self, column_id, values, valid):
+            seen.append((column_id, valid.tolist()))
+            style_ids = np.select([valid & (values > 0), valid & (values < 0)], [0, 1], -1)
+            text = np.where(valid & (values < 0), "neg", None)
+            return ColumnResult(
+                style_ids=style_ids,
+                styles=[{"color": "green"}, {"color": "red"}],
+                text=text,
+            )
+
+    table = dataframe_to_table(frame, include_index=False)
+    result = Sign("change").before_render(table)
+
+    assert seen == [("change", [True, True, False, True])]
+    cells = [row.cells[0] for row in result.body_rows]
+    assert [dict(cell.style.properties).get("color") if cell.style else None for cell in cells] == [
+        "green",
+        "red",
+        None,
+        None,
+    ]
+    assert cells[1].text == "neg"
+    assert result.body_rows[2] is table.body_rows[2]
+    assert result.body_rows[0].cells[1] is table.body_rows[0].cells[1]
+
+
+def test_column_plugin_falls_back_to_cell_values_for_misaligned_sources() -> None:
+    frame = pd.DataFrame({"change": [1.5, -2.0, 3.0]})
+    seen: list[list[float]] = []
+
+    class Record(ColumnPlugin):
+        def transform(self, column_id, values, valid):
+            seen.append(values.tolist())
+            return None
+
+    table = dataframe_to_table(frame, include_index=False)
+    table = replace(table, stats=TableStats({"change": [1.5]}, rows=table.body_rows))
+    Record("change").before_render(table)
+
+    assert seen == [[1.5, -2.0, 3.0]]
+
+
+def _strip_ids(html: str) -> str:
+    return re.sub(r"rf-[0-9a-f]{32}", "rf-id", html)
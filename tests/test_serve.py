@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import re
+from typing import Any
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import pandas as pd
+import pytest
+
+from richframe.serve import TableApp
+
+
+class _Client:
+    """Minimal stand-in for an HTTP client driving a WSGI app in-process."""
+
+    def __init__(self, app: TableApp) -> None:
+        self._app = app
+
+    def get(self, path: str, method: str = "GET", **params: Any) -> tuple[int, dict[str, str], bytes]:
+        environ: dict[str, Any] = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path,
+            "QUERY_STRING": urlencode(params),
+            "wsgi.input": io.BytesIO(),
+        }
+        setup_testing_defaults(environ)
+        captured: dict[str, Any] = {}
+
+        def start_response(status: str, headers: list[tuple[str, str]]) -> None:
+            captured["status"] = int(status.split()[0])
+            captured["headers"] = dict(headers)
+
+        body = b"".join(self._app(environ, start_response))
+        return captured["status"], captured["headers"], body
+
+    def get_json(self, path: str, **params: Any) -> tuple[int, dict[str, Any]]:
+        status, _, body = self.get(path, **params)
+        return status, json.loads(body)
+
+
+def _frame(rows: int = 250) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"price": [float(value % 17) for value in range(rows)], "name": [f"item-{value}" for value in range(rows)]},
+        index=pd.Index(range(rows), name="id"),
+    )
+
+
+def test_rows_route_returns_requested_page() -> None:
+    client = _Client(TableApp(_frame(), page_size=50))
+
+    status, page = client.get_json("/rows", offset=100, limit=20)
+
+    assert status == 200
+    assert page["total"] == 250
+    assert (page["offset"], page["limit"]) == (100, 20)
+    assert page["html"].count("<tr") == 20
+    assert ">item-100<" in page["html"]
+
+
+def test_data_route_sorts_and_filters_like_to_html() -> None:
+    client = _Client(TableApp(_frame(), include_index=False))
+    filters = json.dumps([{"key": "price", "operator": ">=", "value": 15}])
+
+    status, page = client.get_json("/data", sort="-price,name", filter=filters, limit=3)
+
+    assert status == 200
+    assert page["total"] == 28
+    assert page["columns"] == ["price", "name"]
+    assert page["rows"] == [["16.00", "item-101"], ["16.00", "item-118"], ["16.00", "item-135"]]
+
+
+def test_index_page_renders_remote_runtime() -> None:
+    client = _Client(TableApp(_frame(), page_size=25))
+
+    status, headers, body = client.get("/")
+    html = body.decode("utf-8")
+
+    assert status == 200
+    assert headers["Content-Type"].startswith("text/html")
+    assert 'data-richframe-remote="/rows"' in html
+    assert 'data-richframe-total="250"' in html
+    assert re.search(r"<tbody>.*</tbody>", html, re.S).group(0).count("<tr") == 25
+    assert json.loads(re.search(r"data-richframe-columns='(.*?)'", html).group(1))[0] == {"key": "id", "axis": "index"}
+
+
+def test_invalid_requests_return_client_errors() -> None:
+    client = _Client(TableApp(_frame()))
+
+    assert client.get_json("/rows", sort="missing")[0] == 400
+    assert client.get_json("/rows", filter="not json")[1] == {"error": "'filter' is not valid JSON"}
+    assert client.get_json("/rows", limit=5000)[0] == 400
+    assert client.get_json("/nowhere")[0] == 404
+
+
+def test_asgi_entry_point_serves_rows() -> None:
+    app = TableApp(_frame(10))
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/app/rows", "root_path": "/app", "query_string": b"limit=4"}
+    asyncio.run(app.asgi(scope, receive, send))
+
+    assert messages[0]["status"] == 200
+    assert json.loads(messages[1]["body"])["html"].count("<tr") == 4
+
+
+def test_head_requests_get_headers_without_a_body() -> None:
+    app = TableApp(_frame(10))
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    _, get_headers, get_body = _Client(app).get("/rows", limit=4)
+    status, headers, body = _Client(app).get("/rows", method="HEAD", limit=4)
+    asyncio.run(app.asgi({"type": "http", "method": "HEAD", "path": "/", "query_string": b""}, receive, send))
+
+    assert (status, body) == (200, b"")
+    assert headers["Content-Length"] == get_headers["Content-Length"] == str(len(get_body))
+    assert messages[0]["status"] == 200
+    assert messages[1]["body"] == b""
+
+
+def test_table_app_rejects_static_filters() -> None:
+    with pytest.raises(ValueError, match="from each request"):
+        TableApp(_frame(), sorts=["price"])
@@ -40,3 +40,19 @@ def test_style_registry_handles_hash_collisions(monkeypatch: pytest.MonkeyPatch)
 
     assert class_a is not None and class_b is not None
     assert class_a != class_b
+
+
+def test_style_registry_merge_preserves_order_and_reports_renames() -> None:
+    source = StyleRegistry(prefix="test")
+    source.register(CellStyle(color="#000000"))
+    source.register(CellStyle(color="#222222"))
+    target = StyleRegistry(prefix="test")
+    target.register(CellStyle(color="#222222"))
+
+    renamed = target.merge(source.definitions())
+
+    assert renamed == {}
+    assert [definition.style for definition in target.definitions()] == [
+        CellStyle(color="#222222"),
+        CellStyle(color="#000000"),
+    ]
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from datetime import date
 from typing import Sequence
 
 import pandas as pd
 import pytest
 
-from richframe import ColumnConfig, FilterConfig, RowStyle, SortConfig, to_html
+from richframe import (
+    ColumnConfig,
+    FilterConfig,
+    IconRule,
+    IconSetPlugin,
+    RowMask,
+    RowStyle,
+    SortConfig,
+    build_table,
+    iter_html,
+    iter_html_async,
+    render_many,
+    to_html,
+    to_html_async,
+)
 from richframe.format import PercentageFormatter
+from richframe.io.pandas_adapter import dataframe_to_table
+from richframe.plugins import CellPlugin
+from richframe.render import HTMLRenderer
+from richframe.render.runtime import runtime_filename, runtime_source, write_runtime
 from richframe.style import compose_theme, register_theme
 
 
@@ -79,6 +102,8 @@ def test_to_html_rejects_formatters_for_table_objects(simple_table) -> None:
 
     with pytest.raises(ValueError):
         to_html(table, formatters={"A": "number"})
+    with pytest.raises(ValueError, match="DataFrame inputs"):
+        to_html(table, format_workers=2)
 
 
 def test_to_html_applies_column_layout_visibility_and_alignment() -> None:
@@ -159,6 +184,48 @@ def test_to_html_applies_row_predicate_styles() -> None:
     assert "#ffeeee" in html
 
 
+def test_row_masks_are_evaluated_once_with_first_match_winning() -> None:
+    frame = pd.DataFrame({"value": [1, 8, 15, 3], "status": ["ok", "late", "late", "ok"]})
+    calls: list[int] = []
+
+    def late(data: pd.DataFrame) -> pd.Series:
+        calls.append(len(data))
+        return data["status"] == "late"
+
+    table = dataframe_to_table(
+        frame,
+        row_predicates=[
+            ("value > 10", {"background-color": "#fee2e2"}),
+            (lambda _index, values: values[1] < 2, {"background-color": "#e0f2fe"}),
+            (RowMask(late), {"background-color": "#fef3c7"}),
+        ],
+    )
+    colors = [dict(row.style.properties)["background-color"] if row.style else None for row in table.body_rows]
+
+    assert calls == [4]
+    assert colors == ["#e0f2fe", "#fef3c7", "#fee2e2", None]
+
+
+def test_hidden_index_is_only_used_as_row_key() -> None:
+    frame = pd.DataFrame({"value": [1, 2]}, index=["a", "b"])
+    seen: list[tuple[object, list[object]]] = []
+
+    def record(index: object, values: list[object]) -> bool:
+        seen.append((index, list(values)))
+        return False
+
+    table = dataframe_to_table(
+        frame,
+        include_index=False,
+        row_predicates=[(record, None)],
+        formatters={"value": lambda value, context: f"{value}@{context.row_index}"},
+    )
+
+    assert seen == [(None, [1]), (None, [2])]
+    assert [row.cells[0].text for row in table.body_rows] == ["1@None", "2@None"]
+    assert [row.index for row in table.body_rows] == ["a", "b"]
+
+
 def test_to_html_renders_titles_and_subtitles() -> None:
     frame = pd.DataFrame({"A": [1]})
 
@@ -321,3 +388,318 @@ def test_to_html_includes_resizable_columns() -> None:
 
     assert 'data-richframe-resizable="true"' in html
     assert "rf-resize-handle" in html
+
+
+def test_to_html_parallel_render_matches_serial(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("richframe.render.html_renderer._MIN_ROWS_PER_WORKER", 1)
+    monkeypatch.setattr("richframe.render.html_renderer.uuid.uuid4", lambda: uuid.UUID(int=0))
+    frame = pd.DataFrame(
+        {"A": range(9), "B": ["x", "y", "z"] * 3},
+        index=pd.Index([f"r{i}" for i in range(9)], name="row"),
+    )
+    options = dict(
+        theme="light",
+        zebra_striping=True,
+        row_predicates=[(lambda _idx, values: values[1] > 5, RowStyle(background_color="#fef3c7"))],
+        interactive_controls=True,
+    )
+
+    serial = to_html(frame, **options)
+    parallel = to_html(frame, workers=3, **options)
+
+    assert parallel == serial
+
+
+def test_render_many_matches_individual_renders(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("richframe.render.html_renderer.uuid.uuid4", lambda: uuid.UUID(int=0))
+    frames = [pd.DataFrame({"A": [i, i + 1]}) for i in range(3)]
+
+    fragments = render_many(frames, theme="light", caption="Batch")
+
+    assert fragments == [to_html(frame, theme="light", caption="Batch") for frame in frames]
+
+
+def test_render_many_emits_one_shared_stylesheet() -> None:
+    frames = [
+        pd.DataFrame({"A": [1]}),
+        pd.DataFrame({"B": ["x"]}),
+    ]
+
+    fragments = render_many(frames, theme="dark", shared_stylesheet=True)
+
+    assert fragments[0].startswith("<style>")
+    assert all("<style>" not in fragment for fragment in fragments[1:])
+    assert fragments[0].count("<style>") == 1
+
+
+def test_render_many_process_pool_matches_serial() -> None:
+    frames = [pd.DataFrame({"A": [i * 10, i * 20]}) for i in range(5)]
+
+    serial = render_many(frames, theme="light", shared_stylesheet=True, interactive_controls=True)
+    parallel = render_many(
+        frames,
+        theme="light",
+        shared_stylesheet=True,
+        interactive_controls=True,
+        processes=2,
+        chunksize=2,
+    )
+
+    assert [_strip_container_ids(fragment) for fragment in parallel] == [
+        _strip_container_ids(fragment) for fragment in serial
+    ]
+
+
+def _strip_container_ids(html: str) -> str:
+    # Container ids are random per render, including inside worker processes.
+    return re.sub(r"rf-[0-9a-f]{32}", "rf-id", html)
+
+
+def test_iter_html_chunks_join_to_to_html(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("richframe.render.html_renderer.uuid.uuid4", lambda: uuid.UUID(int=0))
+    frame = pd.DataFrame({"A": range(5), "B": list("abcde")})
+
+    chunks = list(iter_html(frame, batch_size=2, theme="light", zebra_striping=True))
+
+    assert len(chunks) == 5  # head, three row batches, tail
+    assert "".join(chunks) == to_html(frame, theme="light", zebra_striping=True)
+
+
+def test_to_html_async_matches_to_html(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("richframe.render.html_renderer.uuid.uuid4", lambda: uuid.UUID(int=0))
+    frame = pd.DataFrame({"A": [1.5, 2.5, 3.5]})
+
+    html = asyncio.run(to_html_async(frame, batch_size=1, caption="Async"))
+
+    assert html == to_html(frame, caption="Async")
+
+
+def test_iter_html_async_honours_cancellation() -> None:
+    frame = pd.DataFrame({"A": range(200)})
+    received: list[str] = []
+
+    async def consume() -> None:
+        async for chunk in iter_html_async(frame, batch_size=1):
+            received.append(chunk)
+
+    async def main() -> None:
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert received == []
+
+
+def test_render_many_passes_workers_to_the_renderer(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("richframe.render.html_renderer._MIN_ROWS_PER_WORKER", 1)
+    frames = [pd.DataFrame({"A": range(6)}), pd.DataFrame({"B": list("abcdef")})]
+
+    parallel = render_many(frames, theme="light", workers=2)
+
+    assert [_strip_container_ids(fragment) for fragment in parallel] == [
+        _strip_container_ids(fragment) for fragment in render_many(frames, theme="light")
+    ]
+    with pytest.raises(ValueError, match="processes or workers"):
+        render_many(frames, processes=2, workers=2)
+
+
+def test_streaming_entry_points_reject_workers() -> None:
+    frame = pd.DataFrame({"A": [1, 2]})
+
+    with pytest.raises(TypeError, match="format_workers"):
+        iter_html(frame, workers=2)
+    with pytest.raises(TypeError, match="format_workers"):
+        build_table(frame, workers=2)
+    with pytest.raises(TypeError, match="format_workers"):
+        asyncio.run(to_html_async(frame, workers=2))
+
+
+def test_async_entry_points_reject_process_executors() -> None:
+    frame = pd.DataFrame({"A": [1, 2]})
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError, match="thread-based executor"):
+            asyncio.run(to_html_async(frame, executor=executor))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        html = asyncio.run(to_html_async(frame, executor=executor))
+    assert _strip_container_ids(html) == _strip_container_ids(to_html(frame))
+
+
+def test_to_html_virtualize_embeds_dictionary_encoded_rows() -> None:
+    frame = pd.DataFrame({"A": [1, 2, 3], "B": ["x", "y", "x"]})
+
+    html = to_html(frame, virtualize=True)
+
+    assert 'data-richframe-virtual="true"' in html
+    assert 'data-richframe-interactive="true"' in html
+    payload = re.search(r'<script type="application/json" class="richframe-rows">(.*?)</script>', html, re.S)
+    assert payload is not None
+    data = json.loads(payload.group(1))
+    assert len(data["rows"]) == 3
+    assert [data["rows"][row][16] for row in range(3)] == ["x", "y", "x"]
+    assert data["dict"][data["rows"][0][17]] == data["dict"][data["rows"][2][17]]
+    _, _, _, tag, scope, id_attr, headers = data["rows"][0][2:9]
+    assert [data["dict"][tag], data["dict"][scope]] == ["th", "row"]
+    assert id_attr == "rf-r0-idx0" and headers == "rf-h0-0"
+    assert data["dict"][data["rows"][0][12]] == "td"
+    assert data["rows"][0][15] == "rf-h0-1 rf-r0-idx0"
+    assert "<tbody>\n  </tbody>" in html
+
+
+def test_to_html_virtualize_rejects_live_updates_and_workers() -> None:
+    frame = pd.DataFrame({"A": [1, 2]})
+
+    with pytest.raises(ValueError, match="live_updates"):
+        to_html(frame, virtualize=True, live_updates=True)
+    with pytest.raises(ValueError, match="workers"):
+        to_html(frame, virtualize=True, workers=2)
+    with pytest.raises(ValueError, match="workers"):
+        render_many([frame], virtualize=True, workers=2)
+
+
+def test_to_html_virtualize_does_not_merge_index_rows() -> None:
+    index = pd.MultiIndex.from_tuples([("a", 1), ("a", 2)], names=["outer", "inner"])
+    frame = pd.DataFrame({"value": [1, 2]}, index=index)
+
+    html = to_html(frame, virtualize=True)
+
+    data = json.loads(re.search(r'class="richframe-rows">(.*?)</script>', html, re.S).group(1))
+    assert [row[2] for row in data["rows"]] == ["a", "a"]
+
+
+def test_to_html_interactive_controls_emit_raw_sort_keys() -> None:
+    frame = pd.DataFrame(
+        {
+            "amount": [1200.5, float("nan"), -3.0],
+            "when": pd.to_datetime(["1970-01-02", None, "1970-01-01"]),
+            "label": ["x", "y", "z"],
+            "day": [date(1970, 1, 3), date(1969, 12, 31), None],
+        }
+    )
+
+    html = to_html(frame, interactive_controls=True)
+
+    assert 'data-v="172800000"' in html
+    assert 'data-v="-86400000"' in html
+    assert 'data-v="1200.5"' in html
+    assert 'data-v="-3"' in html
+    assert 'data-v="86400000"' in html
+    assert html.count('data-v=""') == 3
+    assert "data-v" not in html.split("<thead>")[1].split("</thead>")[0]
+    assert "data-v" not in to_html(frame)
+
+
+def test_to_html_virtualize_emits_sort_key_columns() -> None:
+    frame = pd.DataFrame({"amount": [2.5, None, 1.0], "label": ["b", "a", "c"]})
+
+    html = to_html(frame, virtualize=True, include_index=False)
+
+    data = json.loads(re.search(r'class="richframe-rows">(.*?)</script>', html, re.S).group(1))
+    assert data["keys"] == [[2.5, None, 1], None]
+
+
+def _menu_index(html: str) -> list[dict[str, object] | None]:
+    match = re.search(r"data-richframe-values='(.*?)'", html)
+    assert match is not None
+    return json.loads(match.group(1))
+
+
+def test_to_html_embeds_distinct_values_for_filter_menus() -> None:
+    frame = pd.DataFrame({"price": [1.001, 1.004, 2.0, None], "city": ["Oslo", "Rome", "Oslo", "Oslo"]})
+
+    index = _menu_index(to_html(frame, interactive_controls=True, include_index=False))
+
+    assert index == [
+        {"values": ["1.00", "2.00", ""], "counts": [2, 1, 1]},
+        {"values": ["Oslo", "Rome"], "counts": [3, 1]},
+    ]
+    assert "data-richframe-values" not in to_html(frame)
+
+
+def test_value_index_marks_high_cardinality_columns_search_only() -> None:
+    frame = pd.DataFrame({"id": range(5), "flag": [True, False, True, True, False]})
+    table = dataframe_to_table(frame, include_index=False, interactive_controls=True, filter_value_limit=3)
+
+    index = _menu_index(to_html(table))
+
+    assert index[0] == {"searchOnly": True}
+    assert index[1] == {"values": ["True", "False"], "counts": [3, 2]}
+
+
+def test_value_index_drops_columns_rewritten_by_plugins() -> None:
+    frame = pd.DataFrame({"trend": [0.5, -0.5], "name": ["a", "b"]})
+    plugin = IconSetPlugin("trend", rules=(IconRule(lambda value: value > 0, "+"),))
+
+    index = _menu_index(to_html(frame, include_index=False, interactive_controls=True, plugins=[plugin]))
+
+    assert index[0] is None
+    assert index[1] == {"values": ["a", "b"], "counts": [1, 1]}
+
+
+def test_value_index_checks_every_row_of_a_column() -> None:
+    class RenameThird(CellPlugin):
+        columns = ("name",)
+
+        def prepare(self, table):
+            return lambda cell, row_index, _column: replace(cell, text="z") if row_index == 2 else cell
+
+    frame = pd.DataFrame({"name": ["a", "b", "a"], "count": [1, 2, 1]})
+
+    index = _menu_index(to_html(frame, include_index=False, interactive_controls=True, plugins=[RenameThird()]))
+
+    assert index[0] is None
+    assert index[1] == {"values": ["1.00", "2.00"], "counts": [2, 1]}
+
+
+def test_runtime_once_embeds_script_in_first_table_only() -> None:
+    frame = pd.DataFrame({"A": [1, 2]})
+    renderer = HTMLRenderer(runtime="once")
+
+    first = to_html(frame, renderer=renderer, interactive_controls=True)
+    second = to_html(frame, renderer=renderer, resizable_columns=True)
+    renderer.reset_runtime()
+    third = to_html(frame, renderer=renderer, interactive_controls=True)
+
+    assert first.startswith("<script>\n" + runtime_source())
+    assert runtime_source() not in second
+    assert 'window.richframe.init("rf-' in second
+    assert runtime_source() in third
+    assert renderer.claim_runtime(False) == ""
+    assert renderer.claim_runtime(True) == ""
+    renderer.reset_runtime()
+    assert renderer.claim_runtime(True) == renderer.render_runtime()
+
+
+def test_runtime_external_references_versioned_asset(tmp_path) -> None:
+    frame = pd.DataFrame({"A": [1, 2]})
+
+    html = to_html(frame, interactive_controls=True, runtime="external")
+    path = write_runtime(tmp_path)
+
+    assert html.startswith(f'<script src="{runtime_filename()}"></script>')
+    assert runtime_source() not in html
+    assert path.name == runtime_filename()
+    assert path.read_text(encoding="utf-8") == runtime_source()
+
+
+def test_runtime_is_omitted_for_static_tables() -> None:
+    assert "<script" not in to_html(pd.DataFrame({"A": [1]}), runtime="once")
+
+
+def test_render_many_runtime_once_across_process_chunks() -> None:
+    frames = [pd.DataFrame({"A": [index]}) for index in range(5)]
+
+    serial = render_many(frames, runtime="once", interactive_controls=True)
+    parallel = render_many(frames, runtime="once", interactive_controls=True, processes=2, chunksize=2)
+
+    assert sum(runtime_source() in fragment for fragment in serial) == 1
+    assert [_strip_container_ids(html) for html in parallel] == [_strip_container_ids(html) for html in serial]
+
+
+def test_renderer_rejects_unknown_runtime_mode() -> None:
+    with pytest.raises(ValueError, match="runtime must be one of"):
+        HTMLRenderer(runtime="deferred")